@@ -0,0 +1,117 @@
+"""
+Board + legend rendering benchmark (per-guess cost of the in-game embed text).
+
+Plays random games and times scoring + board + legend after every guess, once with the
+original renderer (every cell of every row re-rendered through the emoji dicts, legend rebuilt
+from the letter dict) and once with the incremental one in bot.py (apply_guess / render_board /
+game_legend). Both outputs are compared, so a mismatch fails the run instead of producing a
+meaningless number.
+
+Two runs: real 5-row boards (mean cost per guess), and long boards timed by row index, where
+the original cost grows with every row already on the board and the incremental one stays flat.
+
+Run from a directory with the word lists:  python bench_render.py [games] [long_rows]
+"""
+import os, sys, random, time
+
+os.environ.setdefault("DB_PATH", ":memory:")
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import bot
+
+
+# ---- original renderer (before incremental rows/legend) ----
+def old_render_tile(letter, color):
+    em = bot.emoji_lookup.get(color, {}).get(letter.lower())
+    return em if em else f"{bot.FALLBACK_COLOR[color]}{letter.upper()}"
+
+def old_render_row(word, colors):
+    return "".join(old_render_tile(ch, col) for ch, col in zip(word, colors))
+
+def old_render_board(guesses, total_rows):
+    rows = [old_render_row(g["word"], g["colors"]) for g in guesses]
+    blank = bot.BLANK_TILE if bot.BLANK_TILE else "⬛"
+    while len(rows) < total_rows:
+        rows.append(blank * 5)
+    return "\n".join(rows)
+
+def old_legend(legend, guesses):
+    if not legend and not guesses:
+        return ""
+    greens  = sorted(ch for ch, c in legend.items() if c == "green")
+    yellows = sorted(ch for ch, c in legend.items() if c == "yellow")
+    grays   = sorted(ch for ch, c in legend.items() if c == "gray")
+    used = set()
+    for g in guesses:
+        used.update(g.get("word", ""))
+    not_used = [ch for ch in "abcdefghijklmnopqrstuvwxyz" if ch not in used]
+    parts = []
+    if greens:
+        parts.append("**Correct**: " + " ".join(old_render_tile(ch, "green") for ch in greens))
+    if yellows:
+        parts.append("**Present**: " + " ".join(old_render_tile(ch, "yellow") for ch in yellows))
+    if grays:
+        parts.append("**Absent**: " + " ".join(old_render_tile(ch, "red") for ch in grays))
+    if not_used:
+        parts.append("**Not used**: " + " ".join(old_render_tile(ch, "gray") for ch in not_used))
+    return "\n".join(parts)
+
+def old_step(game, word):
+    colors = bot.pattern_colors(bot.score_pattern(word, game["answer"]))
+    game["guesses"].append({"word": word, "colors": colors})
+    bot.update_legend(game["legend"], word, colors)
+    return old_render_board(game["guesses"], game["max"]), old_legend(game["legend"], game["guesses"])
+
+def new_step(game, word):
+    bot.apply_guess(game, word, bot.score_pattern(word, game["answer"]))
+    return bot.render_board(game["guesses"], game["max"]), bot.game_legend(game)
+
+
+def run(step, games):
+    """Returns every (board, legend) and the total seconds spent at each row index."""
+    out, by_row, clock = [], [], time.perf_counter
+    for answer, words in games:
+        game = {"answer": answer, "guesses": [], "max": len(words), "legend": {}}
+        for i, w in enumerate(words):
+            t0 = clock()
+            out.append(step(game, w))
+            dt = clock() - t0
+            if i == len(by_row):
+                by_row.append(0.0)
+            by_row[i] += dt
+    return out, by_row
+
+def compare(games):
+    old_out, old_rows = run(old_step, games)
+    new_out, new_rows = run(new_step, games)
+    assert old_out == new_out, "renderers disagree"
+    return old_rows, new_rows
+
+def make_games(rng, n, rows):
+    # guesses drawn with replacement, so boards can be longer than the answer list
+    return [(rng.choice(bot.ANSWERS), rng.choices(bot.ANSWERS, k=rows)) for _ in range(n)]
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    long_rows = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    if not bot.WORDS_READY:
+        bot.install_word_pack(bot.WordPack(bot.compile_word_pack()))
+    bot.build_emoji_lookup()
+    rng = random.Random(1)
+
+    games = make_games(rng, n, 5)
+    old_rows, new_rows = compare(games)
+    guesses = n * 5
+    print(f"{n} games x 5 rows, {guesses} guesses, output identical")
+    print(f"  before: {sum(old_rows) / guesses * 1e6:.1f} us/guess")
+    print(f"  after:  {sum(new_rows) / guesses * 1e6:.1f} us/guess")
+
+    m = max(1, n // 10)
+    old_rows, new_rows = compare(make_games(rng, m, long_rows))
+    print(f"{m} games x {long_rows} rows, output identical; us per guess by row index:")
+    print("    row   before    after")
+    for i in sorted({0, 1, 4, 9, 19, long_rows // 2 - 1, long_rows - 1}):
+        if 0 <= i < long_rows:
+            print(f"  {i + 1:5d} {old_rows[i] / m * 1e6:8.1f} {new_rows[i] / m * 1e6:8.1f}")
+
+if __name__ == "__main__":
+    main()
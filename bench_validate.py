@@ -0,0 +1,89 @@
+"""
+Guess-validation benchmark (is_valid_guess on a mixed guess stream).
+
+Replays the same stream through the original check (VALID_GUESSES set, then every
+_generate_us_variants candidate looked up in VALID_BASE) and through the precomputed
+ACCEPTED_GUESSES closure in bot.py. Every answer is compared, so a disagreement fails
+the run instead of producing a meaningless number.
+
+The stream mimics what players type: mostly dictionary words (answers more often than
+obscure allowed words), British spellings of base words, near-miss typos of real words,
+and some keyboard junk.
+
+Run from a directory with the word lists:  python bench_validate.py [guesses]
+"""
+import os, sys, random, string, time
+
+os.environ.setdefault("DB_PATH", ":memory:")
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import bot
+
+
+# ---- original check (before the accepted-spellings closure) ----
+def make_old_check():
+    valid, base = set(bot.VALID_GUESSES), set(bot.VALID_BASE)   # plain sets, as before the word pack
+
+    def is_valid_guess(word):
+        if word in valid:
+            return True
+        for cand in bot._generate_us_variants(word):
+            if cand in base:
+                return True
+        return False
+    return is_valid_guess
+
+def new_check(word):
+    return bot.is_valid_guess(word)
+
+
+def british_spellings(words):
+    """re/ise/yse spellings of base words, whether or not the closure accepts them."""
+    out = []
+    for w in words:
+        for us, uk in bot._US_TO_UK_SUFFIXES:
+            if w.endswith(us):
+                cand = w[:-len(us)] + uk
+                if len(cand) == 5:
+                    out.append(cand)
+    return out
+
+def typo(rng, w):
+    i = rng.randrange(5)
+    return w[:i] + rng.choice(string.ascii_lowercase) + w[i + 1:]
+
+def guess_stream(rng, n):
+    answers, base = bot.ANSWERS, sorted(bot.VALID_BASE)
+    british = british_spellings(base) or list(bot.BRITISH_5_BUILTIN)
+    kinds = [
+        (45, lambda: rng.choice(answers)),
+        (20, lambda: rng.choice(base)),
+        (10, lambda: rng.choice(british)),
+        (20, lambda: typo(rng, rng.choice(answers))),
+        (5,  lambda: "".join(rng.choices(string.ascii_lowercase, k=5))),
+    ]
+    weights = [k for k, _ in kinds]
+    makers = [m for _, m in kinds]
+    return [rng.choices(makers, weights)[0]() for _ in range(n)]
+
+
+def run(check, stream):
+    t0 = time.perf_counter()
+    out = [check(w) for w in stream]
+    return out, time.perf_counter() - t0
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    if not bot.WORDS_READY:
+        bot.install_word_pack(bot.WordPack(bot.compile_word_pack()))
+    stream = guess_stream(random.Random(1), n)
+
+    old_out, old_s = run(make_old_check(), stream)
+    new_out, new_s = run(new_check, stream)
+    bad = [w for w, a, b in zip(stream, old_out, new_out) if a != b]
+    assert not bad, f"checks disagree on {len(bad)} guesses, e.g. {sorted(set(bad))[:10]}"
+    print(f"{n} guesses ({sum(old_out)} accepted, {len(set(stream))} distinct), answers identical")
+    print(f"  before: {old_s / n * 1e9:.0f} ns/guess")
+    print(f"  after:  {new_s / n * 1e9:.0f} ns/guess")
+
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,61 @@
 # Wordle World bot (UK reset + anti-bully + casino/Word Pot)
-# Python 3.12; deps: discord.py==2.4.0, python-dotenv==1.0.1, requests==2.32.3, aiosqlite==0.20.0
+# Python 3.12; deps: discord.py==2.4.0, python-dotenv==1.0.1, aiohttp (via discord.py), aiosqlite==0.20.0, numpy>=1.26
+# SQLite >= 3.35 (UPDATE ... RETURNING)
 
-import os, json, random, pathlib, logging, requests, re, asyncio, time
+import os, json, random, pathlib, logging, re, asyncio, time, contextlib, bisect, hashlib, mmap, struct, heapq, itertools, zlib
+from collections import OrderedDict, deque
 from typing import Optional, Tuple
 from datetime import datetime, timezone, date as dt_date
 from zoneinfo import ZoneInfo  # NEW: UK local-time resets
 
 import discord
 from discord import app_commands
-from discord.ext import tasks
 from dotenv import load_dotenv
+import aiohttp
 import aiosqlite
+import numpy as np
 
 # -------------------- basic setup --------------------
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
 log = logging.getLogger("wordle")
 
+# Boot timing: each stage records (name, seconds); the report is logged once the client is ready
+_BOOT_T0 = time.perf_counter()
+BOOT_STAGES: list[tuple[str, float]] = []
+
+@contextlib.contextmanager
+def boot_stage(name: str):
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        BOOT_STAGES.append((name, time.perf_counter() - t0))
+
+def log_boot_report():
+    lines = "\n".join(f"  {name:<22}{secs * 1000:9.1f} ms" for name, secs in BOOT_STAGES)
+    log.info(f"[boot] ready {time.perf_counter() - _BOOT_T0:.2f}s after import:\n{lines}")
+
 load_dotenv()
 TOKEN = os.getenv("DISCORD_TOKEN")
 
 DB_PATH = os.getenv("DB_PATH", "wordle_world.db")
 START_BONUS = int(os.getenv("START_BONUS", "5"))
 
+# Group commit: writes from all coroutines share one COMMIT every few ms (or every N statements)
+DB_COMMIT_INTERVAL_MS = float(os.getenv("DB_COMMIT_INTERVAL_MS", "5"))
+DB_COMMIT_MAX_BATCH   = int(os.getenv("DB_COMMIT_MAX_BATCH", "64"))
+
+# guild_cfg cache lifetime in seconds (0 = until invalidated; set >0 when several processes share the DB)
+CFG_CACHE_TTL_S = float(os.getenv("CFG_CACHE_TTL_S", "0"))
+
+# Tier-role sync runs in the background; bursts for the same member collapse into one edit
+ROLE_SYNC_DEBOUNCE_S = float(os.getenv("ROLE_SYNC_DEBOUNCE_S", "2"))
+# ...but a member whose balance keeps changing is still synced this long after the first change
+ROLE_SYNC_MAX_DELAY_S = float(os.getenv("ROLE_SYNC_MAX_DELAY_S", "30"))
+# Bulk /role_sync: concurrent role edits, and members per checkpoint/progress update
+ROLE_SYNC_CONCURRENCY = int(os.getenv("ROLE_SYNC_CONCURRENCY", "4"))
+ROLE_SYNC_BATCH       = int(os.getenv("ROLE_SYNC_BATCH", "100"))
+
 # Named item emoji ENV (custom emoji in your emoji server)
 EMO_BADGE_NAME   = os.getenv("WW_BADGE_NAME",   "ww_badge")
 EMO_CHICKEN_NAME = os.getenv("WW_CHICKEN_NAME", "ww_chicken")
@@ -32,7 +66,14 @@ EMO_BOUNTY_NAME  = os.getenv("WW_BOUNTY_NAME",  "ww_bounty")
 
 INTENTS = discord.Intents.default()
 INTENTS.message_content = True
-bot = discord.Client(intents=INTENTS)
+INTENTS.members = True  # privileged: member cache + role updates feed the Worldler index
+class WorldleClient(discord.Client):
+    async def close(self):
+        # runs on the bot's loop during shutdown; release the shared HTTP pool with it
+        await http.close()
+        await super().close()
+
+bot = WorldleClient(intents=INTENTS)
 tree = app_commands.CommandTree(bot)
 
 
@@ -62,6 +103,73 @@ def _current_20m_slot() -> int:
     """Integer index for 20-minute windows. Used to coordinate one roll per slot per guild."""
     return int(time.time() // 1200)
 
+# -------------------- timers --------------------
+class TimerService:
+    """Keyed one-shot deadlines (epoch seconds) on a heap; one task sleeps until the earliest is due.
+    Re-scheduling a key replaces its deadline; cancelled entries are skipped lazily."""
+
+    def __init__(self):
+        self._heap: list[tuple[float, int, object]] = []   # (when, seq, key)
+        self._live: dict = {}                               # key -> (seq, when, callback, args)
+        self._seq = itertools.count()
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._running: set[asyncio.Task] = set()
+        self.fired = 0
+
+    def schedule(self, key, when: float, callback, *args):
+        seq = next(self._seq)
+        self._live[key] = (seq, when, callback, args)
+        heapq.heappush(self._heap, (when, seq, key))
+        if self._heap[0][1] == seq:
+            self._wake.set()
+        if len(self._heap) > 2 * len(self._live) + 64:
+            self._heap = [(w, sq, k) for k, (sq, w, _, _) in self._live.items()]
+            heapq.heapify(self._heap)
+
+    def cancel(self, key):
+        self._live.pop(key, None)
+
+    def due_at(self, key) -> Optional[float]:
+        e = self._live.get(key)
+        return e[1] if e else None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def _stale(self, entry) -> bool:
+        e = self._live.get(entry[2])
+        return e is None or e[0] != entry[1]
+
+    async def _run(self):
+        while True:
+            while self._heap and self._stale(self._heap[0]):
+                heapq.heappop(self._heap)
+            delay = (self._heap[0][0] - time.time()) if self._heap else None
+            if delay is None or delay > 0:
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            _, _, key = heapq.heappop(self._heap)
+            _, _, callback, args = self._live.pop(key)
+            self.fired += 1
+            task = asyncio.create_task(self._fire(key, callback, args))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    @staticmethod
+    async def _fire(key, callback, args):
+        try:
+            await callback(*args)
+        except Exception as e:
+            log.warning(f"[timers] {key} failed: {e}")
+
+timers = TimerService()
+
 
 # -------------------- env tiers --------------------
 def env_default_tiers():
@@ -84,9 +192,42 @@ WORLDLER_ROLE_NAME = "Worldler"
 BOUNTY_ROLE_NAME   = "Bounty Hunter"
 
 # -------------------- emoji helpers --------------------
+# Lowercase name -> emoji string, merged across guilds (first guild holding a name wins).
+# Seeded in on_ready and patched per guild from on_guild_emojis_update / join / remove.
+_guild_emojis: dict[int, dict[str, str]] = {}
+EMOJI_REGISTRY: dict[str, str] = {}
+
+def set_guild_emojis(guild_id: int, emojis) -> set[str]:
+    """Replace one guild's emojis in the registry; returns the names whose entry changed."""
+    old = _guild_emojis.get(guild_id, {})
+    new: dict[str, str] = {}
+    for e in emojis:
+        new.setdefault((e.name or "").lower(), str(e))
+    if new:
+        _guild_emojis[guild_id] = new
+    else:
+        _guild_emojis.pop(guild_id, None)
+    changed = set()
+    for name in old.keys() | new.keys():
+        if old.get(name) == new.get(name):
+            continue
+        before = EMOJI_REGISTRY.pop(name, None)
+        for m in _guild_emojis.values():
+            if name in m:
+                EMOJI_REGISTRY[name] = m[name]
+                break
+        if EMOJI_REGISTRY.get(name) != before:
+            changed.add(name)
+    return changed
+
+def rebuild_emoji_registry():
+    _guild_emojis.clear()
+    EMOJI_REGISTRY.clear()
+    for g in bot.guilds:
+        set_guild_emojis(g.id, g.emojis)
+
 def get_named_emoji(name: str) -> str:
-    e = discord.utils.find(lambda em: em.name.lower() == name.lower(), bot.emojis)
-    return str(e) if e else ""
+    return EMOJI_REGISTRY.get(name.lower(), "")
 
 EMO_BADGE   = lambda: (get_named_emoji(EMO_BADGE_NAME)   or "🎖️")
 EMO_CHICKEN = lambda: (get_named_emoji(EMO_CHICKEN_NAME) or "🍗")
@@ -98,23 +239,105 @@ EMO_BOUNTY  = lambda: (get_named_emoji(EMO_BOUNTY_NAME)  or "🎯")
 # -------------------- deps sanity --------------------
 def log_deps_health():
     from importlib.metadata import version, PackageNotFoundError
-    for pkg in ("discord.py","python-dotenv","requests","aiosqlite"):
+    for pkg in ("discord.py","python-dotenv","aiohttp","aiosqlite","numpy"):
         try:
             v = version(pkg)
             log.info(f"dep {pkg:<12}: OK  {v}")
         except PackageNotFoundError:
             log.warning(f"dep {pkg:<12}: MISSING")
 
+# -------------------- http --------------------
+# One pooled aiohttp session (the one discord.py already depends on) for all outbound HTTP:
+# keep-alive, a per-host connection cap, timeouts, and retries with jittered backoff.
+# Base URLs are env-configurable so the bot can be pointed at a local stand-in server.
+HTTP_TIMEOUT_S   = float(os.getenv("HTTP_TIMEOUT_S", "10"))
+HTTP_PER_HOST    = int(os.getenv("HTTP_PER_HOST", "4"))
+HTTP_RETRIES     = int(os.getenv("HTTP_RETRIES", "3"))
+HTTP_BACKOFF_S   = float(os.getenv("HTTP_BACKOFF_S", "0.5"))
+DICTIONARY_API_URL = os.getenv("DICTIONARY_API_URL", "https://api.dictionaryapi.dev/api/v2/entries/en").rstrip("/")
+_RETRY_STATUS = {429, 500, 502, 503, 504}
+
+class HttpClient:
+    """Shared async HTTP client. `get()` returns (status, body); only transport errors raise."""
+    def __init__(self, *, timeout_s: float, per_host: int, retries: int, backoff_s: float):
+        self.timeout = aiohttp.ClientTimeout(total=timeout_s)
+        self.per_host = max(1, per_host)
+        self.retries = max(0, retries)
+        self.backoff_s = backoff_s
+        self._session: Optional[aiohttp.ClientSession] = None
+        # host -> {"requests", "errors", "retries", "ms"}
+        self.metrics: dict[str, dict[str, float]] = {}
+
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=4 * self.per_host, limit_per_host=self.per_host, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout,
+                                                  headers={"User-Agent": "WordleWorldBot"})
+        return self._session
+
+    async def close(self):
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        if retry_after:
+            try:
+                return min(float(retry_after), 60.0)
+            except ValueError:
+                pass
+        return random.uniform(0, self.backoff_s * (2 ** attempt))   # full jitter
+
+    async def get(self, url: str, *, timeout_s: Optional[float] = None, deadline_s: Optional[float] = None) -> tuple[int, bytes]:
+        """`deadline_s` bounds the whole call, retries and backoff included (for user-facing lookups)."""
+        host = url.split("/")[2] if "://" in url else url
+        m = self.metrics.setdefault(host, {"requests": 0, "errors": 0, "retries": 0, "ms": 0.0})
+        end = time.monotonic() + deadline_s if deadline_s else None
+        attempt = 0
+        while True:
+            per_try = timeout_s
+            if end is not None:
+                per_try = max(0.1, min(per_try or self.timeout.total, end - time.monotonic()))
+            timeout = aiohttp.ClientTimeout(total=per_try) if per_try else None
+            m["requests"] += 1
+            t0 = time.perf_counter()
+            try:
+                async with self.session().get(url, timeout=timeout) as r:
+                    body = await r.read()
+                    status, retry_after = r.status, r.headers.get("Retry-After")
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                m["errors"] += 1
+                if attempt >= self.retries:
+                    raise
+                status, retry_after = None, None
+            finally:
+                m["ms"] += (time.perf_counter() - t0) * 1000
+            if status is not None and (status not in _RETRY_STATUS or attempt >= self.retries):
+                return status, body
+            delay = self._delay(attempt, retry_after)
+            if end is not None and time.monotonic() + delay >= end:
+                if status is not None:
+                    return status, body
+                raise asyncio.TimeoutError(f"{host}: deadline of {deadline_s}s exceeded")
+            m["retries"] += 1
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def summary(self) -> str:
+        return ", ".join(
+            f"{h}: {int(m['requests'])} req / {int(m['errors'])} err / {int(m['retries'])} retry / "
+            f"{m['ms'] / max(1, m['requests']):.0f}ms avg"
+            for h, m in self.metrics.items()
+        ) or "no requests"
+
+http = HttpClient(timeout_s=HTTP_TIMEOUT_S, per_host=HTTP_PER_HOST, retries=HTTP_RETRIES, backoff_s=HTTP_BACKOFF_S)
+
 # -------------------- word lists (NYT + British guesses) --------------------
 ANS_LOCAL = pathlib.Path("answers_nyt.txt")
 ALLOWED_LOCAL = pathlib.Path("allowed_nyt.txt")
 ANS_URL = "https://raw.githubusercontent.com/LaurentLessard/wordlesolver/main/solutions_nyt.txt"
 ALLOWED_URL = "https://raw.githubusercontent.com/LaurentLessard/wordlesolver/main/nonsolutions_nyt.txt"
 
-def _download(url: str, path: pathlib.Path):
-    r = requests.get(url, timeout=20); r.raise_for_status()
-    path.write_text(r.text, encoding="utf-8")
-
 def _parse_words(text: str) -> list[str]:
     t = text.strip()
     if t.startswith("[") and t.endswith("]"):
@@ -133,12 +356,12 @@ def _parse_words(text: str) -> list[str]:
             seen.add(w); out.append(w)
     return out
 
+def _read_words(path: pathlib.Path) -> list[str]:
+    return _parse_words(path.read_text(encoding="utf-8")) if path.exists() else []
+
 def ensure_word_lists():
-    if not ANS_LOCAL.exists(): _download(ANS_URL, ANS_LOCAL)
-    if not ALLOWED_LOCAL.exists(): _download(ALLOWED_URL, ALLOWED_LOCAL)
-    answers = _parse_words(ANS_LOCAL.read_text(encoding="utf-8"))
-    allowed = _parse_words(ALLOWED_LOCAL.read_text(encoding="utf-8"))
-    return answers, allowed
+    """Local files only; missing lists are fetched by the background refresh (see word pipeline)."""
+    return _read_words(ANS_LOCAL), _read_words(ALLOWED_LOCAL)
 
 # British dictionary (extra guesses)
 BRITISH_LOCAL = pathlib.Path("british_words.txt")
@@ -149,22 +372,8 @@ BRITISH_WORDS_URL = os.getenv(
 ALLOWED_EXTRA_LOCAL = pathlib.Path("allowed_extra.txt")
 BRITISH_5_BUILTIN = {"fibre","litre","metre","mould","sabre","odour","enrol","storey","tyres"}
 
-def _safe_download_to(path: pathlib.Path, url: str):
-    try:
-        if url:
-            r = requests.get(url, timeout=20); r.raise_for_status()
-            path.write_text(r.text, encoding="utf-8")
-    except Exception as e:
-        log.warning(f"[dict] British list download failed: {e}")
-
 def ensure_british_words() -> set[str]:
-    if not BRITISH_LOCAL.exists():
-        _safe_download_to(BRITISH_LOCAL, BRITISH_WORDS_URL)
-    extra = set()
-    if BRITISH_LOCAL.exists():
-        extra |= set(_parse_words(BRITISH_LOCAL.read_text(encoding="utf-8")))
-    if ALLOWED_EXTRA_LOCAL.exists():
-        extra |= set(_parse_words(ALLOWED_EXTRA_LOCAL.read_text(encoding="utf-8")))
+    extra = set(_read_words(BRITISH_LOCAL)) | set(_read_words(ALLOWED_EXTRA_LOCAL))
     extra |= {w for w in BRITISH_5_BUILTIN if len(w)==5 and w.isalpha()}
     return extra
 
@@ -180,26 +389,232 @@ def _generate_us_variants(word: str) -> set[str]:
     if w.endswith("yse"): cands.add(w[:-3] + "yze")
     return {c for c in cands if len(c) == 5 and c.isalpha()}
 
-ANSWERS, ALLOWED = ensure_word_lists()
-BRITISH_ALLOWED = ensure_british_words()
-VALID_BASE = set(ANSWERS) | set(ALLOWED)
-EXTRA_ALLOWED = {w for w in BRITISH_ALLOWED if w not in VALID_BASE}
-VALID_GUESSES = VALID_BASE | EXTRA_ALLOWED
-
-log.info(
-    "word lists: answers=%d, allowed=%d, extras=%d, valid=%d, cigar? %s, fibre? %s",
-    len(ANSWERS), len(ALLOWED), len(EXTRA_ALLOWED), len(VALID_GUESSES),
-    "yes" if "cigar" in VALID_GUESSES else "no",
-    "yes" if "fibre" in VALID_GUESSES else "no",
-)
+# -------------------- word pack (compiled, mmap'd) --------------------
+# All word lists are compiled into one versioned binary file that is memory-mapped at startup;
+# it is rebuilt only when a source list changes. Layout (little-endian):
+#   header  <4sHHIII20s : magic, version, header size, n_words, n_answers, n_links, source sha1
+#   codes   u32[n_words]      5 letters packed 5 bits each, sorted (== alphabetical order)
+#   text    5*n_words bytes   the same words as ASCII, for decoding without arithmetic
+#   answer  packbits[n_words] answer flag per word
+#   base    packbits[n_words] in the NYT answer/allowed lists (vs. British extras)
+#   links   u32[n_links, 2]   (word index, index of its US spelling in base)
+WORD_PACK = pathlib.Path(os.getenv("WORD_PACK", "words.wwpk"))
+WORD_PACK_MAGIC = b"WWPK"
+WORD_PACK_VERSION = 1
+_WP_HEADER = struct.Struct("<4sHHIII20s")
+_WP_HEADER_SIZE = 64
+
+def _word_code(word: str) -> int:
+    code = 0
+    for ch in word:
+        code = (code << 5) | (ord(ch) - 96)
+    return code
+
+def _word_pack_sources() -> list[pathlib.Path]:
+    return [ANS_LOCAL, ALLOWED_LOCAL, BRITISH_LOCAL, ALLOWED_EXTRA_LOCAL]
+
+def _word_pack_fingerprint() -> bytes:
+    h = hashlib.sha1(f"v{WORD_PACK_VERSION}|{','.join(sorted(BRITISH_5_BUILTIN))}".encode())
+    for p in _word_pack_sources():
+        try:
+            st = p.stat()
+            h.update(f"|{p.name}:{st.st_size}:{st.st_mtime_ns}".encode())
+        except FileNotFoundError:
+            h.update(f"|{p.name}:-".encode())
+    return h.digest()
+
+def _pad4(b: bytes) -> bytes:
+    return b + b"\0" * (-len(b) % 4)
+
+def compile_word_pack(out: pathlib.Path = WORD_PACK) -> pathlib.Path:
+    """Parse the text lists once and write the binary pack (atomically)."""
+    answers, allowed = ensure_word_lists()
+    if not answers:
+        raise FileNotFoundError(f"{ANS_LOCAL} is missing or empty")
+    british = ensure_british_words()
+    fp = _word_pack_fingerprint()
+    ok = lambda w: len(w) == 5 and w.isascii() and w.isalpha()
+    base = {w for w in answers if ok(w)} | {w for w in allowed if ok(w)}
+    words = sorted(base | {w for w in british if ok(w)})
+    index = {w: i for i, w in enumerate(words)}
+    answer_set = {w for w in answers if ok(w)}
+
+    links = []
+    for i, w in enumerate(words):
+        for cand in sorted(_generate_us_variants(w)):
+            if cand in base and cand != w:
+                links.append((i, index[cand]))
+                break
+
+    codes = np.array([_word_code(w) for w in words], dtype="<u4")
+    text = "".join(words).encode("ascii")
+    is_answer = np.packbits(np.array([w in answer_set for w in words], dtype=bool), bitorder="little")
+    is_base = np.packbits(np.array([w in base for w in words], dtype=bool), bitorder="little")
+    link_arr = np.array(links, dtype="<u4").reshape(-1, 2)
+
+    header = _WP_HEADER.pack(WORD_PACK_MAGIC, WORD_PACK_VERSION, _WP_HEADER_SIZE,
+                             len(words), len(answer_set), len(links), fp)
+    blob = b"".join([
+        header.ljust(_WP_HEADER_SIZE, b"\0"),
+        codes.tobytes(),
+        _pad4(text),
+        _pad4(is_answer.tobytes()),
+        _pad4(is_base.tobytes()),
+        link_arr.tobytes(),
+    ])
+    tmp = out.with_suffix(out.suffix + ".tmp")
+    tmp.write_bytes(blob)
+    os.replace(tmp, out)
+    log.info(f"[words] compiled {out}: {len(words)} words, {len(answer_set)} answers, {len(links)} variant links")
+    return out
 
-def is_valid_guess(word: str) -> bool:
-    if word in VALID_GUESSES:
-        return True
-    for cand in _generate_us_variants(word):
-        if cand in VALID_BASE:
+class WordPack:
+    """Read-only view over a compiled word pack; arrays point straight into the mmap."""
+    def __init__(self, path: pathlib.Path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, hsize, n, n_ans, n_links, fp = _WP_HEADER.unpack_from(self._mm, 0)
+        if magic != WORD_PACK_MAGIC or version != WORD_PACK_VERSION:
+            raise ValueError(f"{path}: not a v{WORD_PACK_VERSION} word pack")
+        self.fingerprint = fp
+        self.n_answers = n_ans
+        off = hsize
+        self.codes = np.frombuffer(self._mm, dtype="<u4", count=n, offset=off)
+        self._codes_mv = memoryview(self._mm)[off:off + 4 * n].cast("I")   # fast scalar bisect
+        off += 4 * n
+        self.text = memoryview(self._mm)[off:off + 5 * n]; off += 5 * n + (-5 * n % 4)
+        nb = (n + 7) // 8
+        self._answer_bits = np.frombuffer(self._mm, dtype=np.uint8, count=nb, offset=off); off += nb + (-nb % 4)
+        self._base_bits = np.frombuffer(self._mm, dtype=np.uint8, count=nb, offset=off); off += nb + (-nb % 4)
+        self.links = np.frombuffer(self._mm, dtype="<u4", count=2 * n_links, offset=off).reshape(-1, 2)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def index(self, word: str) -> int:
+        if len(word) != 5 or not word.isascii() or not word.isalpha():
+            return -1
+        code = _word_code(word.lower())
+        i = bisect.bisect_left(self._codes_mv, code)
+        return i if i < len(self._codes_mv) and self._codes_mv[i] == code else -1
+
+    def word(self, i: int) -> str:
+        return bytes(self.text[5 * i:5 * i + 5]).decode("ascii")
+
+    def is_answer(self, i: int) -> bool:
+        return bool(self._answer_bits[i >> 3] >> (i & 7) & 1)
+
+    def is_base(self, i: int) -> bool:
+        return bool(self._base_bits[i >> 3] >> (i & 7) & 1)
+
+    def mask(self, which: str) -> np.ndarray:
+        bits = self._answer_bits if which == "answer" else self._base_bits
+        return np.unpackbits(bits, count=len(self), bitorder="little").astype(bool)
+
+    def words(self, mask: Optional[np.ndarray] = None) -> list[str]:
+        s = bytes(self.text).decode("ascii")
+        all_words = [s[i:i + 5] for i in range(0, len(s), 5)]
+        return all_words if mask is None else [w for w, keep in zip(all_words, mask) if keep]
+
+    def us_spelling(self, word: str) -> Optional[str]:
+        """Base-list spelling linked to `word` at compile time (e.g. fibre -> fiber), if any."""
+        i = self.index(word)
+        if i < 0 or not len(self.links):
+            return None
+        j = int(np.searchsorted(self.links[:, 0], i))
+        return self.word(int(self.links[j, 1])) if j < len(self.links) and self.links[j, 0] == i else None
+
+class PackedWordSet:
+    """Set-like membership over a word pack, optionally restricted to base / extra words."""
+    def __init__(self, pack: WordPack, kind: Optional[str] = None):
+        self.pack, self.kind = pack, kind
+
+    def __contains__(self, word) -> bool:
+        if not isinstance(word, str):
+            return False
+        i = self.pack.index(word)
+        if i < 0:
+            return False
+        if self.kind is None:
             return True
-    return False
+        return self.pack.is_base(i) == (self.kind == "base")
+
+    def _mask(self) -> Optional[np.ndarray]:
+        if self.kind is None:
+            return None
+        base = self.pack.mask("base")
+        return base if self.kind == "base" else ~base
+
+    def __iter__(self):
+        return iter(self.pack.words(self._mask()))
+
+    def __len__(self) -> int:
+        m = self._mask()
+        return len(self.pack) if m is None else int(m.sum())
+
+def load_word_pack(path: pathlib.Path = WORD_PACK) -> Optional[WordPack]:
+    """Local artifacts only: the pack if fresh, else a recompile from local lists, else None."""
+    have_sources = any(p.exists() for p in _word_pack_sources())
+    if path.exists():
+        try:
+            pack = WordPack(path)
+            if not have_sources or pack.fingerprint == _word_pack_fingerprint():
+                return pack
+            log.info(f"[words] {path} is stale; recompiling")
+        except Exception as e:
+            log.warning(f"[words] {path} unreadable, recompiling: {e}")
+    try:
+        compile_word_pack(path)
+    except FileNotFoundError as e:
+        log.warning(f"[words] no local word lists yet ({e}); waiting for background download")
+        return None
+    return WordPack(path)
+
+# Swapped as a unit by install_word_pack(); commands that need words check WORDS_READY
+WORDS: Optional[WordPack] = None
+WORDS_READY = False
+ANSWERS: list[str] = []
+VALID_GUESSES = VALID_BASE = EXTRA_ALLOWED = frozenset()
+ACCEPTED_GUESSES: frozenset[str] = frozenset()   # VALID_GUESSES + British spellings of base words
+
+# Only same-length rules of _generate_us_variants can map a 5-letter guess to a 5-letter word,
+# so the British spellings a base word accepts are found by inverting these suffixes.
+_US_TO_UK_SUFFIXES = (("er", "re"), ("ize", "ise"), ("yze", "yse"))
+
+def _accepted_closure(words: list[str], base_mask: np.ndarray) -> frozenset[str]:
+    base = {w for w, b in zip(words, base_mask) if b}
+    accepted = set(words)
+    for b in base:
+        for us, uk in _US_TO_UK_SUFFIXES:
+            if b.endswith(us):
+                cand = b[:-len(us)] + uk
+                if b in _generate_us_variants(cand):
+                    accepted.add(cand)
+    return frozenset(accepted)
+
+def install_word_pack(pack: WordPack):
+    global WORDS, WORDS_READY, ANSWERS, VALID_GUESSES, VALID_BASE, EXTRA_ALLOWED, ACCEPTED_GUESSES
+    WORDS = pack
+    ANSWERS = pack.words(pack.mask("answer"))
+    VALID_GUESSES = PackedWordSet(pack)
+    VALID_BASE = PackedWordSet(pack, "base")
+    EXTRA_ALLOWED = PackedWordSet(pack, "extra")
+    ACCEPTED_GUESSES = _accepted_closure(pack.words(), pack.mask("base"))
+    WORDS_READY = bool(ANSWERS)
+    log.info(
+        "word lists: answers=%d, base=%d, extras=%d, valid=%d, cigar? %s, fibre? %s",
+        len(ANSWERS), len(VALID_BASE), len(EXTRA_ALLOWED), len(VALID_GUESSES),
+        "yes" if "cigar" in VALID_GUESSES else "no",
+        "yes" if "fibre" in VALID_GUESSES else "no",
+    )
+
+with boot_stage("word pack"):
+    _pack = load_word_pack()
+    if _pack:
+        install_word_pack(_pack)
+
+def is_valid_guess(word: str) -> bool:
+    return word in ACCEPTED_GUESSES
 
 # -------------------- tiles --------------------
 FALLBACK_COLOR = {"green": "🟩", "yellow": "🟨", "gray": "⬛", "red": "🟥"}
@@ -214,12 +629,10 @@ def build_emoji_lookup():
     # wl_g_*, wl_y_*, wl_x_* (gray), wl_r_* (RED for "Not used")
     cmap = {"g": "green", "y": "yellow", "x": "gray", "r": "red"}
 
-    for e in bot.emojis:
-        n = (e.name or "").lower()
-
+    for n, e in EMOJI_REGISTRY.items():
         # blank tile (optional)
         if n.startswith("wl_blank") and BLANK_TILE is None:
-            BLANK_TILE = str(e)
+            BLANK_TILE = e
             continue
 
         if not n.startswith("wl_"):
@@ -230,7 +643,7 @@ def build_emoji_lookup():
             continue
         _, c, ch = parts
         if c in cmap and len(ch) == 1 and ch.isalpha():
-            emoji_lookup[cmap[c]][ch] = str(e)
+            emoji_lookup[cmap[c]][ch] = e
 
     log.info(
         "[emoji] loaded tiles | g=%d y=%d x=%d r=%d | blank=%s",
@@ -240,35 +653,317 @@ def build_emoji_lookup():
         len(emoji_lookup["red"]),
         "yes" if BLANK_TILE else "no",
     )
+    rebuild_tile_table()
+
+# Flat (letter, color) -> tile string table; rebuilt with the emoji lookup. TILE_VERSION bumps on
+# every rebuild so rows rendered with the old tiles are re-rendered on next use.
+TILE_TABLE: dict[tuple[str, str], str] = {}
+TILE_VERSION = 0
+_legend_cache: dict[tuple[int, int, int], str] = {}   # (green, yellow, gray) letter masks -> text
+
+def rebuild_tile_table():
+    global TILE_VERSION
+    TILE_TABLE.clear()
+    for color in FALLBACK_COLOR:
+        for ch in "abcdefghijklmnopqrstuvwxyz":
+            TILE_TABLE[(ch, color)] = emoji_lookup.get(color, {}).get(ch) or f"{FALLBACK_COLOR[color]}{ch.upper()}"
+    TILE_VERSION += 1
+    _row_cache.clear()
+    _blank_cache.clear()
+    _legend_cache.clear()
 
 def render_tile(letter: str, color: str) -> str:
-    em = emoji_lookup.get(color, {}).get(letter.lower())
-    return em if em else f"{FALLBACK_COLOR[color]}{letter.upper()}"
-
+    tile = TILE_TABLE.get((letter, color))
+    if tile is None:
+        em = emoji_lookup.get(color, {}).get(letter.lower())
+        tile = em if em else f"{FALLBACK_COLOR[color]}{letter.upper()}"
+    return tile
+
+
+# -------------------- scoring engine (base-3 patterns) --------------------
+# Feedback for a (guess, answer) pair is one uint8: sum(color_i * 3**i), gray=0 yellow=1 green=2.
+# The full VALID_GUESSES x ANSWERS matrix is built once with NumPy (or memory-mapped from cache),
+# so scoring in the game paths is a table lookup.
+PATTERN_CACHE_DIR = pathlib.Path(os.getenv("PATTERN_CACHE_DIR", "."))
+SHOW_CANDIDATES_LEFT = os.getenv("SHOW_CANDIDATES_LEFT", "0") == "1"  # solo: show remaining-answer count
+PATTERN_CHUNK = 512  # guesses per vectorized block
+PATTERN_COLORS: tuple[tuple[str, ...], ...] = tuple(
+    tuple(("gray", "yellow", "green")[(p // 3**i) % 3] for i in range(5)) for p in range(243)
+)
+PATTERN_SOLVED = 242
 
-# -------------------- scoring/render --------------------
-def score_guess(guess: str, answer: str):
-    result = ["gray"]*5
+def _score_pattern_py(guess: str, answer: str) -> int:
+    greens = [g == a for g, a in zip(guess, answer)]
     counts = {}
-    for c in answer: counts[c] = counts.get(c,0) + 1
-    for i, ch in enumerate(guess):
-        if ch == answer[i]:
-            result[i] = "green"; counts[ch] -= 1
+    for a, hit in zip(answer, greens):
+        if not hit: counts[a] = counts.get(a, 0) + 1
+    p = 0
     for i, ch in enumerate(guess):
-        if result[i] == "gray" and counts.get(ch,0) > 0:
-            result[i] = "yellow"; counts[ch] -= 1
-    return result
+        if greens[i]:
+            p += 2 * 3**i
+        elif counts.get(ch, 0) > 0:
+            counts[ch] -= 1
+            p += 3**i
+    return p
+
+def _encode_words(words) -> np.ndarray:
+    return (np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8).reshape(-1, 5) - ord("a"))
+
+def _pattern_block(g: np.ndarray, a: np.ndarray) -> np.ndarray:
+    """Patterns for guesses g (n,5) against answers a (m,5) -> (n,m) uint8."""
+    n, m = len(g), len(a)
+    green = [g[:, k, None] == a[None, :, k] for k in range(5)]
+    out = np.zeros((n, m), dtype=np.uint8)
+    for i in range(5):
+        # yellow iff the answer has more unmatched copies of this letter than earlier non-green guesses used
+        avail = np.zeros((n, m), dtype=np.uint8)
+        for k in range(5):
+            avail += (g[:, i, None] == a[None, :, k]) & ~green[k]
+        prior = np.zeros((n, m), dtype=np.uint8)
+        for j in range(i):
+            prior += (g[:, i] == g[:, j])[:, None] & ~green[j]
+        yellow = ~green[i] & (avail > prior)
+        out += (green[i].astype(np.uint8) * 2 + yellow) * np.uint8(3**i)
+    return out
+
+def _pattern_fingerprint(guesses: list[str], answers: list[str]) -> str:
+    h = hashlib.sha1()
+    h.update("\n".join(guesses).encode()); h.update(b"|"); h.update("\n".join(answers).encode())
+    return h.hexdigest()[:16]
+
+def _pattern_cache_path(guesses: list[str], answers: list[str]) -> pathlib.Path:
+    return PATTERN_CACHE_DIR / f"patterns_{_pattern_fingerprint(guesses, answers)}.npy"
+
+def load_pattern_matrix(guesses: list[str], answers: list[str]) -> Optional[np.ndarray]:
+    path = _pattern_cache_path(guesses, answers)
+    if not path.exists():
+        return None
+    try:
+        mat = np.load(path, mmap_mode="r")
+        if mat.shape == (len(guesses), len(answers)) and mat.dtype == np.uint8:
+            log.info(f"[patterns] loaded {mat.shape[0]}x{mat.shape[1]} matrix from {path}")
+            return mat
+    except Exception as e:
+        log.warning(f"[patterns] cache {path} unreadable, rebuilding: {e}")
+    return None
+
+def build_pattern_matrix(guesses: list[str], answers: list[str]) -> np.ndarray:
+    """CPU-heavy (seconds for the full lists): run it off the event loop."""
+    path = _pattern_cache_path(guesses, answers)
+    t0 = time.perf_counter()
+    g, a = _encode_words(guesses), _encode_words(answers)
+    mat = np.empty((len(guesses), len(answers)), dtype=np.uint8)
+    for i in range(0, len(guesses), PATTERN_CHUNK):
+        mat[i:i + PATTERN_CHUNK] = _pattern_block(g[i:i + PATTERN_CHUNK], a)
+    log.info(f"[patterns] built {mat.shape[0]}x{mat.shape[1]} matrix in {time.perf_counter() - t0:.2f}s")
+    try:
+        PATTERN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for old in PATTERN_CACHE_DIR.glob("patterns_*.npy"):
+            old.unlink(missing_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            np.save(f, mat)
+        os.replace(tmp, path)
+    except Exception as e:
+        log.warning(f"[patterns] could not write cache {path}: {e}")
+    return mat
+
+# Until a matrix matching the current pack is installed, scoring uses the Python fallback
+PATTERN_GUESSES: list[str] = []
+PATTERN_ANSWERS: list[str] = []
+GUESS_INDEX: dict[str, int] = {}
+ANSWER_INDEX: dict[str, int] = {}
+PATTERNS = np.zeros((0, 0), dtype=np.uint8)
+
+def install_patterns(guesses: list[str], answers: list[str], mat: Optional[np.ndarray]):
+    global PATTERN_GUESSES, PATTERN_ANSWERS, GUESS_INDEX, ANSWER_INDEX, PATTERNS
+    if mat is None:
+        guesses, answers, mat = [], answers, np.zeros((0, len(answers)), dtype=np.uint8)
+    PATTERN_GUESSES, PATTERN_ANSWERS, PATTERNS = guesses, answers, mat
+    GUESS_INDEX = {w: i for i, w in enumerate(guesses)}
+    ANSWER_INDEX = {w: i for i, w in enumerate(answers)}
+
+with boot_stage("pattern matrix"):
+    if WORDS:
+        _guesses = WORDS.words()      # already sorted, ASCII a-z only
+        install_patterns(_guesses, ANSWERS, load_pattern_matrix(_guesses, ANSWERS))
+
+def score_pattern(guess: str, answer: str) -> int:
+    """O(1) feedback pattern; words outside the matrix (variant spellings) fall back to Python."""
+    gi, ai = GUESS_INDEX.get(guess), ANSWER_INDEX.get(answer)
+    if gi is not None and ai is not None:
+        return int(PATTERNS[gi, ai])
+    return _score_pattern_py(guess, answer)
+
+def score_many(guess: str, answers: Optional[np.ndarray] = None) -> np.ndarray:
+    """Patterns of one guess against every answer (or the given answer indices)."""
+    gi = GUESS_INDEX.get(guess)
+    if gi is not None:
+        row = PATTERNS[gi]
+        return np.asarray(row if answers is None else row[answers])
+    idx = np.arange(len(PATTERN_ANSWERS)) if answers is None else answers
+    return _pattern_block(_encode_words([guess]), _encode_words([PATTERN_ANSWERS[i] for i in idx]))[0]
+
+def pattern_colors(pattern: int) -> list[str]:
+    return list(PATTERN_COLORS[pattern])
+
+def remaining_answers(guesses: list[dict]) -> np.ndarray:
+    """Answer indices still consistent with every {word, pattern} guess so far."""
+    alive = np.arange(len(PATTERN_ANSWERS))
+    for g in guesses:
+        if "pattern" not in g:
+            continue
+        alive = alive[score_many(g["word"], alive) == g["pattern"]]
+    return alive
+
+def score_guess(guess: str, answer: str):
+    return pattern_colors(score_pattern(guess, answer))
+
+# -------------------- word pipeline (background refresh) --------------------
+# Startup never touches the network: the pack/matrix above come from local files only.
+# After connecting, this task fetches missing (or, with WORD_REFRESH_HOURS, aged) lists,
+# verifies them, swaps them in atomically, then recompiles the pack and the pattern matrix.
+WORD_REFRESH_HOURS = float(os.getenv("WORD_REFRESH_HOURS", "0"))  # 0 = only fetch lists that are missing
+WORD_SOURCES = [
+    # (local file, url, optional pinned sha256, minimum words for the download to be accepted)
+    (ANS_LOCAL,     ANS_URL,           os.getenv("ANSWERS_SHA256"),       500),
+    (ALLOWED_LOCAL, ALLOWED_URL,       os.getenv("ALLOWED_SHA256"),       1000),
+    (BRITISH_LOCAL, BRITISH_WORDS_URL, os.getenv("BRITISH_WORDS_SHA256"), 1),
+]
+_word_task: Optional[asyncio.Task] = None
+
+async def _fetch_bytes(url: str) -> bytes:
+    status, body = await http.get(url, timeout_s=30)
+    if status != 200:
+        raise RuntimeError(f"HTTP {status}")
+    return body
+
+def _checked_marker(path: pathlib.Path) -> pathlib.Path:
+    # sidecar whose mtime is the last successful check; the list's own mtime feeds the pack fingerprint
+    return path.with_name(path.name + ".checked")
+
+async def _refresh_word_source(path: pathlib.Path, url: str, pinned: Optional[str], min_words: int) -> bool:
+    """Download, verify and atomically replace one list. True if the file changed."""
+    if not url:
+        return False
+    if path.exists():
+        marker = _checked_marker(path)
+        last = max(path.stat().st_mtime, marker.stat().st_mtime if marker.exists() else 0)
+        age_h = (time.time() - last) / 3600
+        if WORD_REFRESH_HOURS <= 0 or age_h < WORD_REFRESH_HOURS:
+            return False
+    try:
+        data = await _fetch_bytes(url)
+    except Exception as e:
+        log.warning(f"[words] download of {path.name} failed: {e}")
+        return False
+    digest = hashlib.sha256(data).hexdigest()
+    if pinned and digest != pinned.lower():
+        log.warning(f"[words] {path.name}: checksum mismatch (got {digest[:12]}…), keeping local copy")
+        return False
+    n = len(_parse_words(data.decode("utf-8", errors="replace")))
+    if n < min_words:
+        log.warning(f"[words] {path.name}: download has only {n} words, keeping local copy")
+        return False
+    if path.exists() and hashlib.sha256(path.read_bytes()).hexdigest() == digest:
+        _checked_marker(path).touch()   # fresh, but unchanged
+        return False
+    tmp = path.with_suffix(path.suffix + ".part")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    log.info(f"[words] updated {path.name} ({n} words, sha256 {digest[:12]}…)")
+    return True
+
+def _rebuild_words() -> tuple[WordPack, list[str], list[str], np.ndarray]:
+    """Thread worker: compile the pack and its pattern matrix without touching live globals."""
+    compile_word_pack(WORD_PACK)
+    pack = WordPack(WORD_PACK)
+    guesses, answers = pack.words(), pack.words(pack.mask("answer"))
+    mat = load_pattern_matrix(guesses, answers)
+    if mat is None:
+        mat = build_pattern_matrix(guesses, answers)
+    return pack, guesses, answers, mat
+
+async def word_pipeline():
+    t0 = time.perf_counter()
+    changed = False
+    for path, url, pinned, min_words in WORD_SOURCES:
+        changed |= await _refresh_word_source(path, url, pinned, min_words)
+    if changed or WORDS is None:
+        try:
+            pack, guesses, answers, mat = await asyncio.to_thread(_rebuild_words)
+        except Exception as e:
+            log.warning(f"[words] rebuild failed, keeping current lists: {e}")
+            return
+        install_word_pack(pack)
+        install_patterns(guesses, answers, mat)
+    elif WORDS_READY and not GUESS_INDEX:
+        guesses = WORDS.words()
+        mat = await asyncio.to_thread(build_pattern_matrix, guesses, ANSWERS)
+        install_patterns(guesses, ANSWERS, mat)
+    log.info(f"[words] background refresh finished in {time.perf_counter() - t0:.2f}s (ready={WORDS_READY})")
+    log.info(f"[http] {http.summary()}")
+
+async def _word_pipeline_loop():
+    while True:
+        try:
+            await word_pipeline()
+        except Exception as e:
+            log.warning(f"[words] refresh error: {e}")
+        if WORDS_READY:
+            start_definition_warmup()   # picks up answers added by the refresh
+        if WORD_REFRESH_HOURS <= 0:
+            return
+        await asyncio.sleep(WORD_REFRESH_HOURS * 3600)
+
+def start_word_pipeline():
+    global _word_task
+    if _word_task is None or _word_task.done():
+        _word_task = asyncio.create_task(_word_pipeline_loop())
+
+# -------------------- render --------------------
+# Rows are memoized per (word, pattern) and stored on each guess dict, so a new guess renders
+# exactly one row; the board is a join of ready-made rows plus a cached blank block.
+ROW_CACHE_MAX = 20000
+_row_cache: dict[tuple[str, int], str] = {}
+_blank_cache: dict[int, str] = {}
+_PATTERN_OF_COLORS = {colors: p for p, colors in enumerate(PATTERN_COLORS)}
+
+def render_pattern_row(word: str, pattern: int) -> str:
+    key = (word, pattern)
+    row = _row_cache.get(key)
+    if row is None:
+        if len(_row_cache) >= ROW_CACHE_MAX:
+            _row_cache.clear()
+        row = _row_cache[key] = "".join(render_tile(ch, col) for ch, col in zip(word, PATTERN_COLORS[pattern]))
+    return row
 
 def render_row(word: str, colors: list[str]) -> str:
-    return "".join(render_tile(ch, col) for ch, col in zip(word, colors))
+    p = _PATTERN_OF_COLORS.get(tuple(colors))
+    if p is None:
+        return "".join(render_tile(ch, col) for ch, col in zip(word, colors))
+    return render_pattern_row(word, p)
+
+def _guess_row(g: dict) -> str:
+    if g.get("row_v") != TILE_VERSION:
+        g["row"] = render_pattern_row(g["word"], g["pattern"]) if "pattern" in g else render_row(g["word"], g["colors"])
+        g["row_v"] = TILE_VERSION
+    return g["row"]
+
+def _blank_rows(n: int) -> str:
+    s = _blank_cache.get(n)
+    if s is None:
+        s = _blank_cache[n] = "\n".join([(BLANK_TILE if BLANK_TILE else "⬛") * 5] * n)
+    return s
 
 def render_board(guesses: list[dict], total_rows=5) -> str:
-    rows = [render_row(g["word"], g["colors"]) for g in guesses]
-    blank = BLANK_TILE if BLANK_TILE else "⬛"
-    while len(rows) < total_rows:
-        rows.append(blank*5)
+    rows = [_guess_row(g) for g in guesses]
+    if len(rows) < total_rows:
+        rows.append(_blank_rows(total_rows - len(rows)))
     return "\n".join(rows)
 
+rebuild_tile_table()
+
 # Solo payout 1..5 -> 5..1
 def payout_for_attempt(n: int) -> int:
     return {1:5, 2:4, 3:3, 4:2, 5:1}.get(n, 0)
@@ -336,6 +1031,8 @@ async def migrate_solo_daily_schema(db: aiosqlite.Connection):
 
 
 async def db_init():
+    if getattr(bot, "db", None) is not None:
+        return   # on_ready re-fires on reconnect; keep the open connection and its writer
     bot.db = await aiosqlite.connect(DB_FILE.as_posix())
 
     # --- Core tables (idempotent) ---
@@ -417,10 +1114,45 @@ async def db_init():
         PRIMARY KEY(guild_id, user_id)
     )""")
 
-    await bot.db.execute("""CREATE TABLE IF NOT EXISTS ambient_rolls(
-      guild_id INTEGER NOT NULL,
-      slot     INTEGER NOT NULL,
-      PRIMARY KEY (guild_id, slot)
+    # Last claimed 20-minute ambient-drop slot per guild (one row per guild)
+    await bot.db.execute("""CREATE TABLE IF NOT EXISTS ambient_slot(
+      guild_id INTEGER NOT NULL PRIMARY KEY,
+      slot     INTEGER NOT NULL
+    )""")
+    # migrate from the old one-row-per-slot table
+    async with bot.db.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='ambient_rolls'") as cur:
+        if await cur.fetchone():
+            await bot.db.execute("""INSERT OR IGNORE INTO ambient_slot(guild_id, slot)
+                                    SELECT guild_id, MAX(slot) FROM ambient_rolls GROUP BY guild_id""")
+            await bot.db.execute("DROP TABLE ambient_rolls")
+            log.info("[db] migrated ambient_rolls -> ambient_slot")
+    _ambient_last_slot.clear()
+
+    # Cached word definitions (fail messages); empty definition = "none found"
+    await bot.db.execute("""CREATE TABLE IF NOT EXISTS definitions(
+      word       TEXT NOT NULL PRIMARY KEY,
+      definition TEXT NOT NULL,
+      fetched_ts INTEGER NOT NULL
+    )""")
+
+    # Append-only journal of in-flight games (see "game journal"); compacted on every boot
+    await bot.db.execute("""CREATE TABLE IF NOT EXISTS game_journal(
+      seq  INTEGER PRIMARY KEY AUTOINCREMENT,
+      kind TEXT NOT NULL,
+      key  TEXT NOT NULL,
+      op   TEXT NOT NULL,
+      data TEXT
+    )""")
+
+    # Bulk /role_sync checkpoint (one running job per guild; resumed on restart)
+    await bot.db.execute("""CREATE TABLE IF NOT EXISTS role_sync_job(
+      guild_id          INTEGER NOT NULL PRIMARY KEY,
+      last_user_id      INTEGER NOT NULL DEFAULT 0,
+      status_channel_id INTEGER,
+      status_message_id INTEGER,
+      checked           INTEGER NOT NULL DEFAULT 0,
+      edited            INTEGER NOT NULL DEFAULT 0,
+      started_ts        INTEGER NOT NULL DEFAULT 0
     )""")
 
 
@@ -445,6 +1177,8 @@ async def db_init():
     await add_column_if_missing(bot.db, "inv", "dungeon_tickets_t3", "INTEGER DEFAULT 0")
     await add_column_if_missing(bot.db, "guild_cfg", "suppress_bounty_ping", "INTEGER DEFAULT 0")
     await add_column_if_missing(bot.db, "guild_cfg", "drops_channel_id", "INTEGER")
+    await add_column_if_missing(bot.db, "guild_cfg", "room_backend", "TEXT DEFAULT 'channel'")
+    await add_column_if_missing(bot.db, "guild_cfg", "room_parent_id", "INTEGER")
 
 
 
@@ -458,11 +1192,179 @@ async def db_init():
     except Exception as e:
         log.warning(f"[db] solo_daily schema migration failed (will keep running): {e}")
 
+    # --- group-commit writer (all runtime writes go through db_write / db_commit) ---
+    bot.writer = GroupCommitter(bot.db, interval_s=DB_COMMIT_INTERVAL_MS / 1000, max_batch=DB_COMMIT_MAX_BATCH)
+    bot.writer.start()
+    invalidate_cfg()
+
+
+# ------- group commit --------
+class GroupCommitter:
+    """
+    Shares one COMMIT between every write issued in a short window.
+    Statements run immediately (so the same connection reads them back at once);
+    the caller then parks on a future that resolves when the COMMIT covering it is done.
+    A batch is committed after `interval_s`, or sooner once `max_batch` statements are queued.
+    """
+    def __init__(self, db: aiosqlite.Connection, *, interval_s: float, max_batch: int):
+        self.db = db
+        self.interval_s = max(0.0, interval_s)
+        self.max_batch = max(1, max_batch)
+        self.gate = asyncio.Lock()                    # serializes statement execution vs. COMMIT
+        self._waiters: list[asyncio.Future] = []
+        self._kick = asyncio.Event()
+        self._full = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.commits = 0
+        self.statements = 0
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    def _enqueue(self) -> asyncio.Future:
+        # must be called with the gate held, right after the statement ran
+        fut = asyncio.get_running_loop().create_future()
+        self._waiters.append(fut)
+        self._kick.set()
+        if len(self._waiters) >= self.max_batch:
+            self._full.set()
+        return fut
+
+    async def write(self, sql: str, params=()) -> aiosqlite.Cursor:
+        async with self.gate:
+            cur = await self.db.execute(sql, params)
+            self.statements += 1
+            fut = self._enqueue()
+        await fut
+        return cur
+
+    async def write_fetchone(self, sql: str, params=()):
+        """Like write(), but reads the first RETURNING row before the batch commits."""
+        async with self.gate:
+            async with self.db.execute(sql, params) as cur:
+                row = await cur.fetchone()
+            self.statements += 1
+            fut = self._enqueue()
+        await fut
+        return row
+
+    async def write_many(self, sql: str, rows) -> None:
+        """executemany() that shares the next COMMIT like a single write()."""
+        async with self.gate:
+            await self.db.executemany(sql, rows)
+            self.statements += 1
+            fut = self._enqueue()
+        await fut
+
+    async def durable(self):
+        """Wait for a COMMIT covering everything executed so far on this connection."""
+        async with self.gate:
+            fut = self._enqueue()
+        await fut
+
+    async def _commit_locked(self):
+        batch, self._waiters = self._waiters, []
+        self._kick.clear()
+        self._full.clear()
+        if not batch:
+            return
+        try:
+            await self.db.commit()
+            self.commits += 1
+        except Exception as e:
+            log.warning(f"[db] group commit failed ({len(batch)} waiters): {e}")
+            for f in batch:
+                if not f.done():
+                    f.set_exception(e)
+            return
+        for f in batch:
+            if not f.done():
+                f.set_result(None)
+
+    async def _run(self):
+        while True:
+            await self._kick.wait()
+            if self.interval_s:
+                try:
+                    await asyncio.wait_for(self._full.wait(), timeout=self.interval_s)
+                except asyncio.TimeoutError:
+                    pass
+            try:
+                async with self.gate:
+                    await self._commit_locked()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.warning(f"[db] group commit loop error: {e}")
+
+    @contextlib.asynccontextmanager
+    async def transaction(self):
+        """
+        BEGIN IMMEDIATE … COMMIT on the shared connection. Holds the gate for the whole block,
+        so no other coroutine's statements can land inside it. Rolls back on any exception.
+        Inside the block use the yielded connection (tx_* helpers), never db_write().
+        """
+        async with self.gate:
+            await self._commit_locked()          # settle queued group writes first
+            if self.db.in_transaction:
+                await self.db.commit()
+            await self.db.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.db
+            except BaseException:
+                await self.db.rollback()
+                raise
+            await self.db.commit()
+            self.commits += 1
+
+
+class TxAbort(Exception):
+    """Raise inside `db_transaction()` to roll the flow back; `reason` tells the caller why."""
+    def __init__(self, reason: str = ""):
+        super().__init__(reason)
+        self.reason = reason
+
+
+def db_transaction():
+    """`async with db_transaction() as db:` — one atomic BEGIN IMMEDIATE … COMMIT."""
+    return bot.writer.transaction()
+
+
+async def db_write(sql: str, params=()) -> aiosqlite.Cursor:
+    """Run one write statement; returns once the group commit containing it is durable."""
+    return await bot.writer.write(sql, params)
+
+async def db_write_fetchone(sql: str, params=()):
+    """Run one write statement with RETURNING; returns its first row once durable."""
+    return await bot.writer.write_fetchone(sql, params)
+
+async def db_commit():
+    """Group-commit replacement for `bot.db.commit()` after ad-hoc `bot.db.execute` writes."""
+    await bot.writer.durable()
+
 
 # ------- DB helpers -------
 
-# --- resilient sending helper (handles 5xx like 503 with retries) ---
-async def safe_send(channel: discord.abc.Messageable, content=None, **kwargs):
+# --- outbound message scheduler ---
+# HIGH (the default: replies to what a player just did) is sent straight away, so player-facing
+# latency never waits behind anything. NORMAL/LOW go through per-channel queues drained by one
+# dispatcher: guilds take turns (round robin per class), NORMAL gets SEND_NORMAL_WEIGHT turns
+# for every LOW turn, one message is in flight per channel, and channels that just got a 429
+# (seen through discord.py's rate-limit log lines) are skipped until their retry_after passes.
+# Under pressure LOW text is merged into the previous queued LOW message, or shed.
+SEND_HIGH, SEND_NORMAL, SEND_LOW = 0, 1, 2
+SEND_CONCURRENCY   = int(os.getenv("SEND_CONCURRENCY", "6"))
+SEND_NORMAL_WEIGHT = int(os.getenv("SEND_NORMAL_WEIGHT", "4"))
+SEND_LOW_BACKLOG   = int(os.getenv("SEND_LOW_BACKLOG", "3"))     # queued LOW per channel before merge/shed
+SEND_LOW_TTL_S     = float(os.getenv("SEND_LOW_TTL_S", "120"))   # LOW older than this is dropped unsent
+
+async def _send_with_retries(channel: discord.abc.Messageable, content=None, **kwargs):
     """Send a message with small retries on Discord 5xx."""
     backoffs = [0.6, 1.2, 2.4]  # total ~4.2s worst case
     for i in range(len(backoffs) + 1):
@@ -481,6 +1383,180 @@ async def safe_send(channel: discord.abc.Messageable, content=None, **kwargs):
             # Other errors: surface them so you notice real issues
             raise
 
+class SendScheduler:
+    def __init__(self, *, concurrency: int, normal_weight: int):
+        # priority -> guild_id -> queued items (each: dict channel/content/kwargs/prio/fut/ts)
+        self.queues: dict[int, "OrderedDict[int, deque]"] = {SEND_NORMAL: OrderedDict(), SEND_LOW: OrderedDict()}
+        self.low_pending: dict[int, int] = {}        # channel_id -> queued LOW count
+        self.busy: set[int] = set()                  # channels with a send in flight
+        self.rl_until: dict[int, float] = {}         # channel_id -> monotonic time the 429 wait ends
+        self.global_until = 0.0
+        self.normal_weight = max(1, normal_weight)
+        self._credit = self.normal_weight
+        self._sem = asyncio.Semaphore(max(1, concurrency))
+        self._kick = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._running: set[asyncio.Task] = set()     # in-flight deliveries (strong refs)
+        self.stats = {"sent": 0, "merged": 0, "shed": 0, "429": 0, "global_429": 0}
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    @staticmethod
+    def _mergeable(item: dict) -> bool:
+        return isinstance(item["content"], str) and set(item["kwargs"]) <= {"allowed_mentions"} and item["fut"] is None
+
+    def enqueue(self, channel, content, kwargs: dict, prio: int, wait: bool) -> Optional[asyncio.Future]:
+        cid = getattr(channel, "id", 0)
+        gid = getattr(getattr(channel, "guild", None), "id", 0)
+        fut = asyncio.get_running_loop().create_future() if wait else None
+        item = {"channel": channel, "content": content, "kwargs": kwargs, "prio": prio, "fut": fut, "ts": time.monotonic()}
+        gq = self.queues[prio].setdefault(gid, deque())
+        if prio == SEND_LOW and self.low_pending.get(cid, 0) >= SEND_LOW_BACKLOG:
+            last = next((it for it in reversed(gq) if getattr(it["channel"], "id", 0) == cid), None)
+            if last and self._mergeable(last) and self._mergeable(item) and len(last["content"]) + len(content) < 1900:
+                last["content"] += "\n" + content
+                self.stats["merged"] += 1
+                return None
+            oldest = next((it for it in gq if getattr(it["channel"], "id", 0) == cid), None)
+            if oldest:
+                gq.remove(oldest)
+                self._finish(oldest, None)
+                self.stats["shed"] += 1
+        if prio == SEND_LOW:
+            self.low_pending[cid] = self.low_pending.get(cid, 0) + 1
+        gq.append(item)
+        self.start()
+        self._kick.set()
+        return fut
+
+    def _finish(self, item: dict, result):
+        if item["prio"] == SEND_LOW:
+            cid = getattr(item["channel"], "id", 0)
+            n = self.low_pending.get(cid, 1) - 1
+            if n > 0: self.low_pending[cid] = n
+            else: self.low_pending.pop(cid, None)
+        if item["fut"] and not item["fut"].done():
+            item["fut"].set_result(result)
+
+    def _take(self, prio: int, now: float) -> Optional[dict]:
+        """Next sendable item of this class, taking guilds in turn."""
+        guilds = self.queues[prio]
+        for _ in range(len(guilds)):
+            if not guilds:
+                break
+            gid, gq = next(iter(guilds.items()))
+            guilds.move_to_end(gid)
+            blocked = set()
+            for it in list(gq):
+                cid = getattr(it["channel"], "id", 0)
+                if prio == SEND_LOW and now - it["ts"] > SEND_LOW_TTL_S:
+                    gq.remove(it); self._finish(it, None); self.stats["shed"] += 1
+                    continue
+                if cid in blocked or cid in self.busy or self.rl_until.get(cid, 0) > now:
+                    blocked.add(cid)   # keep per-channel order: nothing behind a blocked item jumps it
+                    continue
+                gq.remove(it)
+                if not gq:
+                    guilds.pop(gid, None)
+                return it
+            if not gq:
+                guilds.pop(gid, None)
+        return None
+
+    def _next(self) -> Optional[dict]:
+        now = time.monotonic()
+        if now < self.global_until:
+            return None
+        order = (SEND_NORMAL, SEND_LOW) if self._credit > 0 else (SEND_LOW, SEND_NORMAL)
+        for prio in order:
+            item = self._take(prio, now)
+            if item:
+                self._credit = self._credit - 1 if prio == SEND_NORMAL else self.normal_weight
+                return item
+        return None
+
+    async def _run(self):
+        while True:
+            await self._sem.acquire()
+            item = self._next()
+            if item is None:
+                self._sem.release()
+                self._kick.clear()
+                waits = [t for t in (*self.rl_until.values(), self.global_until) if t > time.monotonic()]
+                timeout = (min(waits) - time.monotonic()) if waits else None
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._kick.wait(), timeout)
+                continue
+            cid = getattr(item["channel"], "id", 0)
+            self.busy.add(cid)
+            task = asyncio.create_task(self._deliver(item, cid))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _deliver(self, item: dict, cid: int):
+        result = None
+        try:
+            result = await _send_with_retries(item["channel"], item["content"], **item["kwargs"])
+            self.stats["sent"] += 1
+        except Exception as e:
+            if item["fut"] and not item["fut"].done():
+                item["fut"].set_exception(e)
+            else:
+                log.warning(f"[send] queued message to {cid} failed: {e}")
+        finally:
+            self.busy.discard(cid)
+            self._finish(item, result)
+            self._sem.release()
+            self._kick.set()
+
+    def note_rate_limit(self, channel_id: Optional[int], retry_after: float, is_global: bool = False):
+        until = time.monotonic() + retry_after
+        if is_global:
+            self.stats["global_429"] += 1
+            self.global_until = max(self.global_until, until)
+        else:
+            self.stats["429"] += 1
+            if channel_id:
+                self.rl_until[channel_id] = max(self.rl_until.get(channel_id, 0), until)
+        now = time.monotonic()
+        for k in [k for k, t in self.rl_until.items() if t < now]:
+            self.rl_until.pop(k, None)
+
+send_scheduler = SendScheduler(concurrency=SEND_CONCURRENCY, normal_weight=SEND_NORMAL_WEIGHT)
+
+class _RateLimitWatch(logging.Handler):
+    """Feeds discord.py's 429 warnings (which carry the route and retry_after) into the scheduler."""
+    _route = re.compile(r"responded with 429\. Retrying in ([\d.]+) seconds")
+    _channel = re.compile(r"/channels/(\d+)")
+    _global = re.compile(r"Global rate limit has been hit\. Retrying in ([\d.]+) seconds")
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            msg = record.getMessage()
+            if m := self._global.search(msg):
+                send_scheduler.note_rate_limit(None, float(m.group(1)), is_global=True)
+            elif m := self._route.search(msg):
+                ch = self._channel.search(msg)
+                send_scheduler.note_rate_limit(int(ch.group(1)) if ch else None, float(m.group(1)))
+                if ch:
+                    bounty_fanout.note_rate_limit(int(ch.group(1)))
+        except Exception:
+            pass
+
+logging.getLogger("discord.http").addHandler(_RateLimitWatch(logging.WARNING))
+
+async def safe_send(channel: discord.abc.Messageable, content=None, *, priority: int = SEND_HIGH, wait: bool = True, **kwargs):
+    """
+    Send a message (retrying Discord 5xx). HIGH goes out immediately; NORMAL/LOW are queued.
+    With wait=False a queued send returns None at once (fire-and-forget).
+    """
+    if priority == SEND_HIGH:
+        return await _send_with_retries(channel, content, **kwargs)
+    fut = send_scheduler.enqueue(channel, content, kwargs, priority, wait)
+    return await fut if fut else None
+
 
 # ---------- UI helpers: boxed/panel sends ----------
 PANEL_COLOR = 0x2B2D31  # Discord dark-embed graphite
@@ -513,13 +1589,26 @@ async def get_balance(gid: int, uid: int) -> int:
     return row[0] if row else 0
 
 async def change_balance(gid: int, uid: int, delta: int, *, announce_channel_id: Optional[int] = None):
-    await bot.db.execute("""
+    row = await db_write_fetchone("""
       INSERT INTO wallet(guild_id,user_id,balance) VALUES(?,?,?)
-      ON CONFLICT(guild_id,user_id) DO UPDATE SET balance=wallet.balance+excluded.balance""",
+      ON CONFLICT(guild_id,user_id) DO UPDATE SET balance=wallet.balance+excluded.balance
+      RETURNING balance""",
       (gid, uid, delta))
-    await bot.db.commit()
+    new = row[0]
+    await _after_balance_change(gid, uid, announce_channel_id, new - delta, new)
+
+async def _after_balance_change(gid: int, uid: int, channel_id: Optional[int],
+                                old: Optional[int] = None, new: Optional[int] = None):
+    """
+    Side effects of a committed balance change (tier roles). Never raises, never waits on Discord.
+    With old/new balances known, a role sync is queued only when a tier threshold was crossed.
+    """
     try:
-        await _sync_member_roles_after_balance_change(gid, uid, announce_channel_id)
+        if old is not None and new is not None:
+            thresholds = await tier_thresholds(gid)
+            if bisect.bisect_right(thresholds, old) == bisect.bisect_right(thresholds, new):
+                return
+        await _sync_member_roles_after_balance_change(gid, uid, channel_id)
     except Exception as e:
         log.warning(f"role sync after balance change failed: {e}")
 
@@ -529,11 +1618,10 @@ async def get_stones(gid: int, uid: int) -> int:
     return row[0] if row else 0
 
 async def change_stones(gid: int, uid: int, delta: int):
-    await bot.db.execute("""
+    await db_write("""
       INSERT INTO inv(guild_id,user_id,stones) VALUES(?,?,?)
       ON CONFLICT(guild_id,user_id) DO UPDATE SET stones=inv.stones+excluded.stones""",
       (gid, uid, delta))
-    await bot.db.commit()
 
 async def get_badge(gid: int, uid: int) -> int:
     async with bot.db.execute("SELECT badge FROM inv WHERE guild_id=? AND user_id=?", (gid, uid)) as cur:
@@ -541,11 +1629,10 @@ async def get_badge(gid: int, uid: int) -> int:
     return row[0] if row else 0
 
 async def set_badge(gid: int, uid: int, val: int):
-    await bot.db.execute("""
+    await db_write("""
       INSERT INTO inv(guild_id,user_id,badge) VALUES(?,?,?)
       ON CONFLICT(guild_id,user_id) DO UPDATE SET badge=excluded.badge""",
       (gid, uid, val))
-    await bot.db.commit()
 
 async def get_chickens(gid: int, uid: int) -> int:
     async with bot.db.execute("SELECT chickens FROM inv WHERE guild_id=? AND user_id=?", (gid, uid)) as cur:
@@ -553,11 +1640,10 @@ async def get_chickens(gid: int, uid: int) -> int:
     return row[0] if row else 0
 
 async def change_chickens(gid: int, uid: int, delta: int):
-    await bot.db.execute("""
+    await db_write("""
       INSERT INTO inv(guild_id,user_id,chickens) VALUES(?,?,?)
       ON CONFLICT(guild_id,user_id) DO UPDATE SET chickens=inv.chickens+excluded.chickens""",
       (gid, uid, delta))
-    await bot.db.commit()
 
 async def get_protection_until(gid: int, uid: int) -> int:
     async with bot.db.execute("SELECT protected_until_ts FROM inv WHERE guild_id=? AND user_id=?", (gid, uid)) as cur:
@@ -565,11 +1651,10 @@ async def get_protection_until(gid: int, uid: int) -> int:
     return row[0] if row else 0
 
 async def set_protection_until(gid: int, uid: int, ts: int):
-    await bot.db.execute("""
+    await db_write("""
       INSERT INTO inv(guild_id,user_id,protected_until_ts) VALUES(?,?,?)
       ON CONFLICT(guild_id,user_id) DO UPDATE SET protected_until_ts=excluded.protected_until_ts""",
       (gid, uid, ts))
-    await bot.db.commit()
 
 async def get_sniper(gid: int, uid: int) -> int:
     async with bot.db.execute("SELECT sniper FROM inv WHERE guild_id=? AND user_id=?", (gid, uid)) as cur:
@@ -577,11 +1662,10 @@ async def get_sniper(gid: int, uid: int) -> int:
     return row[0] if row else 0
 
 async def set_sniper(gid: int, uid: int, val: int):
-    await bot.db.execute("""
+    await db_write("""
       INSERT INTO inv(guild_id,user_id,sniper) VALUES(?,?,?)
       ON CONFLICT(guild_id,user_id) DO UPDATE SET sniper=excluded.sniper""",
       (gid, uid, val))
-    await bot.db.commit()
 
 async def get_pot(gid: int) -> int:
     async with bot.db.execute("SELECT pot FROM ground WHERE guild_id=?", (gid,)) as cur:
@@ -589,20 +1673,14 @@ async def get_pot(gid: int) -> int:
     return row[0] if row else 0
 
 async def add_to_pot(gid: int, delta: int):
-    await bot.db.execute("""
+    await db_write("""
       INSERT INTO ground(guild_id,pot) VALUES(?,?)
       ON CONFLICT(guild_id) DO UPDATE SET pot=ground.pot+excluded.pot""",
       (gid, delta))
-    await bot.db.commit()
 
 async def pop_all_from_pot(gid: int) -> int:
-    async with bot.db.execute("SELECT pot FROM ground WHERE guild_id=?", (gid,)) as cur:
-        row = await cur.fetchone()
-    amt = row[0] if row else 0
-    if amt > 0:
-        await bot.db.execute("UPDATE ground SET pot=0 WHERE guild_id=?", (gid,))
-        await bot.db.commit()
-    return amt
+    async with db_transaction() as db:
+        return await tx_take_from_pot(db, gid)
 
 async def _get_cd(gid: int, uid: int):
     async with bot.db.execute("SELECT last_pray,last_beg FROM cooldown WHERE guild_id=? AND user_id=?", (gid, uid)) as cur:
@@ -610,58 +1688,67 @@ async def _get_cd(gid: int, uid: int):
     return row if row else (None, None)
 
 async def _set_cd(gid: int, uid: int, field: str, val: str):
-    await bot.db.execute("""
-      INSERT INTO cooldown(guild_id,user_id,last_pray,last_beg) VALUES(?,?,NULL,NULL)
-      ON CONFLICT(guild_id,user_id) DO NOTHING""", (gid, uid))
-    await bot.db.execute(f"UPDATE cooldown SET {field}=? WHERE guild_id=? AND user_id=?", (val, gid, uid))
-    await bot.db.commit()
+    if field not in ("last_pray", "last_beg"):
+        raise ValueError(f"invalid cooldown field: {field}")
+    await db_write(f"""
+      INSERT INTO cooldown(guild_id,user_id,{field}) VALUES(?,?,?)
+      ON CONFLICT(guild_id,user_id) DO UPDATE SET {field}=excluded.{field}""", (gid, uid, val))
+
+# guild_cfg is read on nearly every command, so it lives in process and set_cfg writes through.
+CFG_FIELDS = (
+    "bounty_channel_id", "worldler_role_id", "bounty_role_id", "last_bounty_ts",
+    "solo_category_id", "announcements_channel_id", "last_bounty_hour", "suppress_bounty_ping",
+    "drops_channel_id", "room_backend", "room_parent_id",
+)
+_CFG_INT_DEFAULTS = {"last_bounty_ts": 0, "last_bounty_hour": 0, "suppress_bounty_ping": 0}
+_cfg_cache: dict[int, tuple[float, dict]] = {}  # gid -> (loaded_at, cfg)
 
-async def get_cfg(gid: int):
+def invalidate_cfg(gid: Optional[int] = None):
+    """Drop cached config for one guild (or all). Call when another process changed guild_cfg."""
+    if gid is None:
+        _cfg_cache.clear()
+    else:
+        _cfg_cache.pop(gid, None)
+
+async def _load_cfg(gid: int) -> dict:
     async with bot.db.execute(
-        "SELECT bounty_channel_id, worldler_role_id, bounty_role_id, last_bounty_ts, "
-        "solo_category_id, announcements_channel_id, last_bounty_hour, suppress_bounty_ping, "
-        "drops_channel_id FROM guild_cfg WHERE guild_id=?",
+        f"SELECT {', '.join(CFG_FIELDS)} FROM guild_cfg WHERE guild_id=?",
         (gid,)
     ) as cur:
         row = await cur.fetchone()
-    if row:
-        return {
-            "bounty_channel_id": row[0], "worldler_role_id": row[1], "bounty_role_id": row[2],
-            "last_bounty_ts": row[3] or 0, "solo_category_id": row[4],
-            "announcements_channel_id": row[5], "last_bounty_hour": row[6] or 0,
-            "suppress_bounty_ping": row[7] or 0, "drops_channel_id": row[8],
-        }
-    return {
-        "bounty_channel_id": None, "worldler_role_id": None, "bounty_role_id": None,
-        "last_bounty_ts": 0, "solo_category_id": None, "announcements_channel_id": None,
-        "last_bounty_hour": 0, "suppress_bounty_ping": 0, "drops_channel_id": None,
-    }
+    cfg = dict(zip(CFG_FIELDS, row)) if row else dict.fromkeys(CFG_FIELDS)
+    for k, default in _CFG_INT_DEFAULTS.items():
+        cfg[k] = cfg[k] or default
+    return cfg
+
+async def get_cfg(gid: int):
+    hit = _cfg_cache.get(gid)
+    if hit and (CFG_CACHE_TTL_S <= 0 or time.monotonic() - hit[0] < CFG_CACHE_TTL_S):
+        return dict(hit[1])
+    cfg = await _load_cfg(gid)
+    _cfg_cache[gid] = (time.monotonic(), cfg)
+    return dict(cfg)
 
 async def set_cfg(gid: int, **kwargs):
-    cfg = await get_cfg(gid); cfg.update(kwargs)
-    await bot.db.execute("""
-      INSERT INTO guild_cfg(
-        guild_id, bounty_channel_id, worldler_role_id, bounty_role_id, last_bounty_ts,
-        solo_category_id, announcements_channel_id, last_bounty_hour, suppress_bounty_ping,
-        drops_channel_id
-      )
-      VALUES(?,?,?,?,?,?,?,?,?,?)
-      ON CONFLICT(guild_id) DO UPDATE SET
-        bounty_channel_id=excluded.bounty_channel_id,
-        worldler_role_id=excluded.worldler_role_id,
-        bounty_role_id=excluded.bounty_role_id,
-        last_bounty_ts=excluded.last_bounty_ts,
-        solo_category_id=excluded.solo_category_id,
-        announcements_channel_id=excluded.announcements_channel_id,
-        last_bounty_hour=excluded.last_bounty_hour,
-        suppress_bounty_ping=excluded.suppress_bounty_ping,
-        drops_channel_id=excluded.drops_channel_id
-    """, (
-        gid, cfg["bounty_channel_id"], cfg["worldler_role_id"], cfg["bounty_role_id"],
-        cfg["last_bounty_ts"], cfg["solo_category_id"], cfg["announcements_channel_id"],
-        cfg["last_bounty_hour"], cfg["suppress_bounty_ping"], cfg["drops_channel_id"],
-    ))
-    await bot.db.commit()
+    unknown = set(kwargs) - set(CFG_FIELDS)
+    if unknown:
+        raise ValueError(f"unknown guild_cfg field(s): {', '.join(sorted(unknown))}")
+    cfg = await get_cfg(gid)
+    changed = {k: v for k, v in kwargs.items() if cfg.get(k) != v}
+    if not changed:
+        return
+    cfg.update(changed)
+    _cfg_cache[gid] = (time.monotonic(), cfg)
+    cols = list(changed)
+    try:
+        await db_write(f"""
+          INSERT INTO guild_cfg(guild_id, {', '.join(cols)})
+          VALUES(?{',?' * len(cols)})
+          ON CONFLICT(guild_id) DO UPDATE SET {', '.join(f'{c}=excluded.{c}' for c in cols)}
+        """, (gid, *changed.values()))
+    except Exception:
+        invalidate_cfg(gid)
+        raise
 
 
 
@@ -675,16 +1762,15 @@ async def get_solo_plays_today(gid: int, uid: int, date: str) -> int:
     return row[0] if row else 0
 
 async def inc_solo_plays_today(gid: int, uid: int, date: str):
-    await bot.db.execute("""
+    await db_write("""
       INSERT INTO solo_daily(guild_id,user_id,date,plays) VALUES(?,?,?,1)
       ON CONFLICT(guild_id,user_id,date) DO UPDATE SET plays=solo_daily.plays+1
     """, (gid, uid, date))
-    await bot.db.commit()
 
 # put this alongside the other DB helpers, right after inc_solo_plays_today(...)
 async def dec_solo_plays_on_date(gid: int, uid: int, date: str):
     """Decrement the user's solo play count for a specific UK date (no-op if 0)."""
-    await bot.db.execute(
+    await db_write(
         """
         UPDATE solo_daily
            SET plays = CASE WHEN plays > 0 THEN plays - 1 ELSE 0 END
@@ -692,7 +1778,6 @@ async def dec_solo_plays_on_date(gid: int, uid: int, date: str):
         """,
         (gid, uid, date),
     )
-    await bot.db.commit()
 
 
 # NEW: anti-bully per-day stone count helpers
@@ -703,14 +1788,15 @@ async def get_stone_count_today(gid: int, attacker: int, target: int, date: str)
         row = await cur.fetchone()
     return row[0] if row else 0
 
+_STONE_COUNT_UPSERT = """
+  INSERT INTO stone_daily(guild_id, attacker_id, target_id, date, count)
+  VALUES(?,?,?,?,?)
+  ON CONFLICT(guild_id, attacker_id, target_id, date)
+  DO UPDATE SET count = stone_daily.count + excluded.count
+"""
+
 async def inc_stone_count_today(gid: int, attacker: int, target: int, date: str, delta: int):
-    await bot.db.execute("""
-      INSERT INTO stone_daily(guild_id, attacker_id, target_id, date, count)
-      VALUES(?,?,?,?,?)
-      ON CONFLICT(guild_id, attacker_id, target_id, date)
-      DO UPDATE SET count = stone_daily.count + excluded.count
-    """, (gid, attacker, target, date, delta))
-    await bot.db.commit()
+    await db_write(_STONE_COUNT_UPSERT, (gid, attacker, target, date, delta))
 
 # NEW: Casino pot helpers
 CASINO_BASE_POT = 5  # updated starting/reset pot
@@ -720,16 +1806,14 @@ async def get_casino_pot(gid: int) -> int:
     if row:
         return row[0]
     # init row at base 5
-    await bot.db.execute("INSERT OR IGNORE INTO casino_pot(guild_id, pot) VALUES(?, ?)", (gid, CASINO_BASE_POT))
-    await bot.db.commit()
+    await db_write("INSERT OR IGNORE INTO casino_pot(guild_id, pot) VALUES(?, ?)", (gid, CASINO_BASE_POT))
     return CASINO_BASE_POT
 
 async def set_casino_pot(gid: int, pot_val: int):
-    await bot.db.execute("""
+    await db_write("""
       INSERT INTO casino_pot(guild_id, pot) VALUES(?,?)
       ON CONFLICT(guild_id) DO UPDATE SET pot=excluded.pot
     """, (gid, pot_val))
-    await bot.db.commit()
 
 # ------- streak helpers -------
 async def _get_streak(gid: int, uid: int):
@@ -757,19 +1841,33 @@ async def update_streak_on_play(gid: int, uid: int, today_str: str):
         except Exception:
             cur = 1
     best = max(best, cur)
-    await bot.db.execute("""
+    await db_write("""
       INSERT INTO solo_streak(guild_id,user_id,last_date,cur,best) VALUES(?,?,?,?,?)
       ON CONFLICT(guild_id,user_id) DO UPDATE SET
         last_date=excluded.last_date,
         cur=excluded.cur,
         best=CASE WHEN excluded.cur>solo_streak.best THEN excluded.cur ELSE solo_streak.best END
     """, (gid, uid, today_str, cur, best))
-    await bot.db.commit()
 
 # ------- stats helpers (for leaderboards) -------
 STAT_FIELDS = {"bounties_won", "stones_thrown", "stoned_received", "solo_fails", "snipes", "sniped"}
 
-async def inc_stat(gid: int, uid: int, field: str, delta: int = 1):
+_STAT_UPSERT = """
+    INSERT INTO stats(
+        guild_id, user_id,
+        bounties_won, stones_thrown, stoned_received, solo_fails, snipes, sniped
+    )
+    VALUES(?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(guild_id, user_id) DO UPDATE SET
+        bounties_won    = stats.bounties_won    + excluded.bounties_won,
+        stones_thrown   = stats.stones_thrown   + excluded.stones_thrown,
+        stoned_received = stats.stoned_received + excluded.stoned_received,
+        solo_fails      = stats.solo_fails      + excluded.solo_fails,
+        snipes          = stats.snipes          + excluded.snipes,
+        sniped          = stats.sniped          + excluded.sniped
+"""
+
+def _stat_upsert(gid: int, uid: int, field: str, delta: int):
     """
     Robust UPSERT that applies the delta on first insert AND on updates.
     We insert a row with zeros except the target field set to `delta`,
@@ -788,20 +1886,7 @@ async def inc_stat(gid: int, uid: int, field: str, delta: int = 1):
     }
     vals[field] = int(delta)
 
-    await bot.db.execute("""
-        INSERT INTO stats(
-            guild_id, user_id,
-            bounties_won, stones_thrown, stoned_received, solo_fails, snipes, sniped
-        )
-        VALUES(?, ?, ?, ?, ?, ?, ?, ?)
-        ON CONFLICT(guild_id, user_id) DO UPDATE SET
-            bounties_won    = stats.bounties_won    + excluded.bounties_won,
-            stones_thrown   = stats.stones_thrown   + excluded.stones_thrown,
-            stoned_received = stats.stoned_received + excluded.stoned_received,
-            solo_fails      = stats.solo_fails      + excluded.solo_fails,
-            snipes          = stats.snipes          + excluded.snipes,
-            sniped          = stats.sniped          + excluded.sniped
-    """, (
+    return _STAT_UPSERT, (
         gid, uid,
         vals["bounties_won"],
         vals["stones_thrown"],
@@ -809,8 +1894,10 @@ async def inc_stat(gid: int, uid: int, field: str, delta: int = 1):
         vals["solo_fails"],
         vals["snipes"],
         vals["sniped"],
-    ))
-    await bot.db.commit()
+    )
+
+async def inc_stat(gid: int, uid: int, field: str, delta: int = 1):
+    await db_write(*_stat_upsert(gid, uid, field, delta))
 
 
 
@@ -833,6 +1920,91 @@ async def get_my_stat(gid: int, uid: int, field: str) -> int:
         row = await cur.fetchone()
     return int(row[0]) if row else 0
 
+# ------- transactional helpers (only inside `async with db_transaction() as db`) -------
+INV_COLUMNS = {"stones", "badge", "chickens", "sniper", "protected_until_ts",
+               "dungeon_tickets_t1", "dungeon_tickets_t2", "dungeon_tickets_t3"}
+
+def _inv_col(column: str) -> str:
+    if column not in INV_COLUMNS:
+        raise ValueError(f"invalid inv column: {column}")
+    return column
+
+async def _tx_scalar(db: aiosqlite.Connection, sql: str, params=(), default=0):
+    async with db.execute(sql, params) as cur:
+        row = await cur.fetchone()
+    return row[0] if row and row[0] is not None else default
+
+async def tx_credit(db: aiosqlite.Connection, gid: int, uid: int, amount: int) -> int:
+    """Add to a wallet (creating it); returns the new balance."""
+    async with db.execute("""
+      INSERT INTO wallet(guild_id,user_id,balance) VALUES(?,?,?)
+      ON CONFLICT(guild_id,user_id) DO UPDATE SET balance=wallet.balance+excluded.balance
+      RETURNING balance""", (gid, uid, amount)) as cur:
+        row = await cur.fetchone()
+    return row[0]
+
+async def tx_debit(db: aiosqlite.Connection, gid: int, uid: int, amount: int) -> Optional[int]:
+    """Debit only if the wallet covers it; returns the new balance, or None if it can't."""
+    async with db.execute("""
+      UPDATE wallet SET balance=balance-?
+      WHERE guild_id=? AND user_id=? AND balance>=?
+      RETURNING balance""", (amount, gid, uid, amount)) as cur:
+        row = await cur.fetchone()
+    return row[0] if row else None
+
+async def tx_add_inv(db: aiosqlite.Connection, gid: int, uid: int, column: str, delta: int) -> int:
+    """Add to an inventory counter (creating the row); returns the new count."""
+    col = _inv_col(column)
+    async with db.execute(f"""
+      INSERT INTO inv(guild_id,user_id,{col}) VALUES(?,?,?)
+      ON CONFLICT(guild_id,user_id) DO UPDATE SET {col}=COALESCE(inv.{col},0)+excluded.{col}
+      RETURNING {col}""", (gid, uid, delta)) as cur:
+        row = await cur.fetchone()
+    return row[0]
+
+async def tx_take_inv(db: aiosqlite.Connection, gid: int, uid: int, column: str, amount: int) -> Optional[int]:
+    """Remove `amount` only if owned; returns what's left, or None if they don't have enough."""
+    col = _inv_col(column)
+    async with db.execute(f"""
+      UPDATE inv SET {col}={col}-?
+      WHERE guild_id=? AND user_id=? AND COALESCE({col},0)>=?
+      RETURNING {col}""", (amount, gid, uid, amount)) as cur:
+        row = await cur.fetchone()
+    return row[0] if row else None
+
+async def tx_claim_flag(db: aiosqlite.Connection, gid: int, uid: int, column: str) -> bool:
+    """Flip a one-time item (badge/sniper) from 0 to 1. False if it was already owned."""
+    col = _inv_col(column)
+    async with db.execute(f"""
+      INSERT INTO inv(guild_id,user_id,{col}) VALUES(?,?,1)
+      ON CONFLICT(guild_id,user_id) DO UPDATE SET {col}=1 WHERE COALESCE(inv.{col},0)=0
+      RETURNING {col}""", (gid, uid)) as cur:
+        row = await cur.fetchone()
+    return row is not None
+
+async def tx_add_to_pot(db: aiosqlite.Connection, gid: int, delta: int) -> int:
+    async with db.execute("""
+      INSERT INTO ground(guild_id,pot) VALUES(?,?)
+      ON CONFLICT(guild_id) DO UPDATE SET pot=ground.pot+excluded.pot
+      RETURNING pot""", (gid, delta)) as cur:
+        row = await cur.fetchone()
+    return row[0]
+
+async def tx_take_from_pot(db: aiosqlite.Connection, gid: int, amount: Optional[int] = None) -> int:
+    """Take up to `amount` (everything if None) from the ground pot; returns what was taken."""
+    pot = await _tx_scalar(db, "SELECT pot FROM ground WHERE guild_id=?", (gid,))
+    take = pot if amount is None else min(max(0, int(amount)), pot)
+    if take > 0:
+        await db.execute("UPDATE ground SET pot=pot-? WHERE guild_id=?", (take, gid))
+    return take
+
+async def tx_inc_stat(db: aiosqlite.Connection, gid: int, uid: int, field: str, delta: int = 1):
+    await db.execute(*_stat_upsert(gid, uid, field, delta))
+
+async def tx_inc_stone_count(db: aiosqlite.Connection, gid: int, attacker: int, target: int, date: str, delta: int):
+    await db.execute(_STONE_COUNT_UPSERT, (gid, attacker, target, date, delta))
+
+
 # -------------------- role tiers --------------------
 def bot_can_manage_role(guild: discord.Guild, role: discord.Role) -> bool:
     me = guild.me
@@ -850,6 +2022,7 @@ async def ensure_worldler_role(guild: discord.Guild) -> int:
             return 0
         role = await guild.create_role(name=WORLDLER_ROLE_NAME, reason="Wordle World membership role")
     await set_cfg(guild.id, worldler_role_id=role.id)
+    seed_worldler_members(guild, role.id)
     return role.id
 
 async def ensure_bounty_role(guild: discord.Guild) -> int:
@@ -866,56 +2039,170 @@ async def ensure_bounty_role(guild: discord.Guild) -> int:
     await set_cfg(guild.id, bounty_role_id=role.id)
     return role.id
 
+# -------------------- worldler membership index --------------------
+# guild_id -> user ids holding the Worldler role; seeded from the member cache and kept
+# current by gateway member/role events, so the guards never hit REST.
+worldler_members: dict[int, set[int]] = {}
+
+def seed_worldler_members(guild: discord.Guild, role_id: Optional[int]) -> set[int]:
+    role = guild.get_role(role_id) if role_id else None
+    ids = {m.id for m in role.members} if role else set()
+    worldler_members[guild.id] = ids
+    return ids
+
 async def is_worldler(guild: discord.Guild, member: discord.abc.User) -> bool:
+    ids = worldler_members.get(guild.id)
+    if ids is not None and member.id in ids:
+        return True
     cfg = await get_cfg(guild.id)
     rid = cfg["worldler_role_id"]
     if not rid:
         return False
-    try:
-        m = guild.get_member(member.id) or await guild.fetch_member(member.id)
-        return any(r.id == rid for r in m.roles)
-    except Exception:
-        return False
+    if ids is None:
+        ids = seed_worldler_members(guild, rid)
+        if member.id in ids:
+            return True
+    # Self-heal from whatever Member object we already hold (never a REST fetch)
+    m = member if isinstance(member, discord.Member) else guild.get_member(member.id)
+    if m is not None and m.get_role(rid) is not None:
+        ids.add(member.id)
+        return True
+    return False
+
+@bot.event
+async def on_member_update(before: discord.Member, after: discord.Member):
+    rid = (await get_cfg(after.guild.id))["worldler_role_id"]
+    if not rid:
+        return
+    ids = worldler_members.setdefault(after.guild.id, set())
+    if after.get_role(rid) is not None:
+        ids.add(after.id)
+    else:
+        ids.discard(after.id)
+
+@bot.event
+async def on_raw_member_remove(payload: discord.RawMemberRemoveEvent):
+    worldler_members.get(payload.guild_id, set()).discard(payload.user.id)
+
+@bot.event
+async def on_guild_role_delete(role: discord.Role):
+    if role.id == (await get_cfg(role.guild.id))["worldler_role_id"]:
+        worldler_members[role.guild.id] = set()
+
+@bot.event
+async def on_guild_remove(guild: discord.Guild):
+    worldler_members.pop(guild.id, None)
+    timers.cancel(("bounty_hour", guild.id))
+    for cid in room_pool.pop(guild.id, []):
+        pooled_rooms.discard(cid)
+    if any(n.startswith("wl_") for n in set_guild_emojis(guild.id, [])):
+        build_emoji_lookup()
+
+@bot.event
+async def on_guild_emojis_update(guild: discord.Guild, before, after):
+    changed = set_guild_emojis(guild.id, after)
+    if any(n.startswith("wl_") for n in changed):
+        build_emoji_lookup()
+
+# guild_id -> [(role_id, min_balance)] sorted by min_balance; dropped whenever role_tier changes
+_tier_cache: dict[int, list[tuple[int, int]]] = {}
+
+def invalidate_tiers(gid: Optional[int] = None):
+    if gid is None:
+        _tier_cache.clear()
+    else:
+        _tier_cache.pop(gid, None)
+
+async def get_tier_rows(gid: int) -> list[tuple[int, int]]:
+    rows = _tier_cache.get(gid)
+    if rows is None:
+        async with bot.db.execute("SELECT role_id,min_balance FROM role_tier WHERE guild_id=? ORDER BY min_balance ASC",(gid,)) as cur:
+            rows = [(r[0], r[1]) for r in await cur.fetchall()]
+        _tier_cache[gid] = rows
+    return rows
+
+async def tier_thresholds(gid: int) -> list[int]:
+    return [min_bal for _, min_bal in await get_tier_rows(gid)]
 
 async def sync_member_role_tiers(guild: discord.Guild, member: discord.Member):
     if not await is_worldler(guild, member):
         return
-    async with bot.db.execute("SELECT role_id,min_balance FROM role_tier WHERE guild_id=? ORDER BY min_balance ASC",(guild.id,)) as cur:
-        rows = await cur.fetchall()
-    if not rows: return
-    manageable=[]
-    for role_id, min_bal in rows:
-        role = guild.get_role(role_id)
-        if role and bot_can_manage_role(guild, role):
-            manageable.append((role, min_bal))
+    manageable = await manageable_tiers(guild)
     if not manageable: return
 
-    async with bot.db.execute("SELECT balance FROM wallet WHERE guild_id=? AND user_id=?", (guild.id, member.id)) as cur:
-        rr = await cur.fetchone()
-    bal = rr[0] if rr else 0
+    bal = await get_balance(guild.id, member.id)
+    roles = tier_roles_for(member, manageable, bal)
+    if roles is None:
+        return
+    try: await member.edit(roles=roles, reason="Wordle World tier sync")
+    except Exception as e: log.warning(f"tier role edit failed: {e}")
+
+async def manageable_tiers(guild: discord.Guild) -> list[tuple[discord.Role, int]]:
+    out = []
+    for role_id, min_bal in await get_tier_rows(guild.id):
+        role = guild.get_role(role_id)
+        if role and bot_can_manage_role(guild, role):
+            out.append((role, min_bal))
+    return out
 
+def tier_roles_for(member: discord.Member, manageable: list[tuple[discord.Role, int]], bal: int) -> Optional[list[discord.Role]]:
+    """Full role list the member should have for `bal`, or None if their tier roles already match."""
     want_ids = {r.id for (r, minimum) in manageable if bal >= minimum}
     tier_ids = {r.id for (r, _) in manageable}
     have_ids = {r.id for r in member.roles}
-
-    to_add = [guild.get_role(rid) for rid in (want_ids - have_ids) if guild.get_role(rid)]
-    to_remove = [guild.get_role(rid) for rid in ((tier_ids - want_ids) & have_ids) if guild.get_role(rid)]
-
-    if to_add:
-        try: await member.add_roles(*to_add, reason="Wordle World tier sync")
-        except Exception as e: log.warning(f"add_roles failed: {e}")
-    if to_remove:
-        try: await member.remove_roles(*to_remove, reason="Wordle World tier sync")
-        except Exception as e: log.warning(f"remove_roles failed: {e}")
+    if (have_ids & tier_ids) == want_ids:
+        return None
+    # One PATCH with the full role list instead of add_roles + remove_roles
+    roles = [r for r in member.roles if not r.is_default() and r.id not in tier_ids]
+    roles += [r for (r, _) in manageable if r.id in want_ids]
+    return roles
+
+# (guild_id, user_id) -> monotonic time the sync is due; re-queueing pushes it back (debounce),
+# but never past ROLE_SYNC_MAX_DELAY_S after the first queueing (_role_sync_first)
+_role_sync_due: dict[tuple[int, int], float] = {}
+_role_sync_first: dict[tuple[int, int], float] = {}
+_role_sync_kick = asyncio.Event()
+_role_sync_task: Optional[asyncio.Task] = None
+
+def queue_role_sync(gid: int, uid: int):
+    global _role_sync_task
+    now = time.monotonic()
+    first = _role_sync_first.setdefault((gid, uid), now)
+    _role_sync_due[(gid, uid)] = min(now + ROLE_SYNC_DEBOUNCE_S, first + ROLE_SYNC_MAX_DELAY_S)
+    _role_sync_kick.set()
+    if _role_sync_task is None or _role_sync_task.done():
+        _role_sync_task = asyncio.create_task(_role_sync_worker())
+
+async def _role_sync_worker():
+    while True:
+        if not _role_sync_due:
+            _role_sync_kick.clear()
+            await _role_sync_kick.wait()
+            continue
+        wait = min(_role_sync_due.values()) - time.monotonic()
+        if wait > 0:
+            _role_sync_kick.clear()
+            try:
+                await asyncio.wait_for(_role_sync_kick.wait(), timeout=wait)
+            except asyncio.TimeoutError:
+                pass
+            continue
+        now = time.monotonic()
+        for key in [k for k, due in _role_sync_due.items() if due <= now]:
+            _role_sync_due.pop(key, None)
+            _role_sync_first.pop(key, None)
+            gid, uid = key
+            guild = bot.get_guild(gid)
+            if not guild:
+                continue
+            try:
+                member = guild.get_member(uid) or await guild.fetch_member(uid)
+                await sync_member_role_tiers(guild, member)
+            except Exception as e:
+                log.warning(f"[roles] tier sync for {uid} in {gid} failed: {e}")
 
 async def _sync_member_roles_after_balance_change(gid: int, uid: int, channel_id: Optional[int]):
-    guild = discord.utils.get(bot.guilds, id=gid)
-    if not guild: return
-    try:
-        member = guild.get_member(uid) or await guild.fetch_member(uid)
-    except Exception:
-        return
-    await sync_member_role_tiers(guild, member)
+    queue_role_sync(gid, uid)
 
 async def ensure_default_tiers(guild: discord.Guild):
     for idx, (name, min_bal) in enumerate(DEFAULT_TIERS):
@@ -925,27 +2212,173 @@ async def ensure_default_tiers(guild: discord.Guild):
                 log.warning(f"[tiers] Missing Manage Roles in guild {guild.id}")
                 return
             role = await guild.create_role(name=name, reason="Wordle World auto tier")
-        await bot.db.execute("""
+        await db_write("""
           INSERT INTO role_tier(guild_id,role_id,min_balance) VALUES(?,?,?)
           ON CONFLICT(guild_id,role_id) DO UPDATE SET min_balance=excluded.min_balance
         """, (guild.id, role.id, int(min_bal)))
-    await bot.db.commit()
+    invalidate_tiers(guild.id)
 
 # -------------------- state --------------------
-solo_games: dict[Tuple[int,int,int], dict] = {}     # (gid, cid, uid) -> {answer, guesses[], max, legend, origin_cid}
-bounty_games: dict[int, dict] = {}                  # gid -> {answer, channel_id, started_at}
+# channel_id -> {kind: {game keys}} for every channel that has a live game; lets on_message route
+# a guess with one lookup. The game maps below keep it current on every insert/pop.
+channel_interest: dict[int, dict[str, set]] = {}
+
+def _interest_add(cid: int, kind: str, key):
+    channel_interest.setdefault(cid, {}).setdefault(kind, set()).add(key)
+
+def _interest_drop(cid: int, kind: str, key):
+    kinds = channel_interest.get(cid)
+    if kinds and key in kinds.get(kind, ()):
+        kinds[kind].discard(key)
+        if not kinds[kind]:
+            del kinds[kind]
+        if not kinds:
+            del channel_interest[cid]
+
+class GameIndex(dict):
+    """A game map that registers each game's channel in `channel_interest` as it is added/removed."""
+    def __init__(self, kind: str, channel_of):
+        super().__init__()
+        self.kind = kind
+        self.channel_of = channel_of   # (key, game) -> channel id
+
+    def __setitem__(self, key, game):
+        if key in self:
+            self.pop(key)
+        super().__setitem__(key, game)
+        _interest_add(self.channel_of(key, game), self.kind, key)
+        journal_put(self.kind, key, game)
+
+    def __delitem__(self, key):
+        self.pop(key)
+
+    def pop(self, key, *default):
+        if key not in self:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        game = super().pop(key)
+        _interest_drop(self.channel_of(key, game), self.kind, key)
+        journal_del(self.kind, key)
+        return game
+
+solo_games: dict[Tuple[int,int,int], dict] = GameIndex("solo", lambda k, g: k[1])      # (gid, cid, uid) -> {answer, guesses[], max, legend, origin_cid}
+bounty_games: dict[int, dict] = GameIndex("bounty", lambda k, g: g["channel_id"])     # gid -> {answer, channel_id, started_at}
 pending_bounties: dict[int, dict] = {}              # gid -> {message_id, channel_id, users:set, hour_idx}
-duels: dict[int, dict] = {}                         # duel_id -> data
+duels: dict[int, dict] = {}                         # duel_id -> data (only active duels are in channel_interest)
 _next_duel_id = 1
 solo_channels: dict[Tuple[int,int], int] = {}       # (gid, uid) -> channel_id
 
 # NEW: Casino (Word Pot)
-casino_games: dict[Tuple[int,int,int], dict] = {}   # (gid, cid, uid) -> {answer, guesses[], max=3, legend, origin_cid, staked:int}
+casino_games: dict[Tuple[int,int,int], dict] = GameIndex("casino", lambda k, g: k[1])   # (gid, cid, uid) -> {answer, guesses[], max=3, legend, origin_cid, staked:int}
 casino_channels: dict[Tuple[int,int], int] = {}     # (gid, uid) -> channel_id
 
 # -------------------- DUNGEON globals --------------------
 pending_dungeon_gates_by_msg: dict[int, dict] = {}   # gate_msg_id -> {...}
-dungeon_games: dict[int, dict] = {}                  # ch_id -> game dict
+dungeon_games: dict[int, dict] = GameIndex("dungeon", lambda k, g: k)   # ch_id -> game dict
+
+# -------------------- game journal --------------------
+# Append-only log of every in-flight game so a restart can rebuild the maps above (recover_games).
+# op "put" = snapshot of the game (guesses stored as words), "guess" = one more word, "del" = over.
+# Kinds: solo, casino, bounty, dungeon (written by GameIndex), pending_bounty, duel, gate.
+# Records are buffered and flushed in order through the group committer; the table is rewritten
+# as one snapshot per live game on boot and every JOURNAL_COMPACT_ROWS rows.
+JOURNAL_COMPACT_ROWS = int(os.getenv("JOURNAL_COMPACT_ROWS", "20000"))
+_JOURNAL_SKIP = {"live", "view", "guesses", "legend", "legend_masks", "settled"}   # runtime-only or derived
+_JOURNAL_SETS = {"participants", "users", "snipers_tried"}
+_JOURNAL_INSERT = "INSERT INTO game_journal(kind, key, op, data) VALUES(?,?,?,?)"
+_journal_buf: deque = deque()
+_journal_lock = asyncio.Lock()
+_journal_task: Optional[asyncio.Task] = None
+_journal_rows = 0
+_journal_restoring = False   # recover_games() re-inserts games without journaling them again
+
+def _journal_snapshot(game: dict) -> dict:
+    out = {k: (sorted(v) if isinstance(v, set) else v) for k, v in game.items() if k not in _JOURNAL_SKIP}
+    g = game.get("guesses")
+    if isinstance(g, list):
+        out["words"] = [x["word"] for x in g]
+    elif isinstance(g, dict):   # duels: uid -> guesses
+        out["words"] = {str(u): [x["word"] for x in gl] for u, gl in g.items()}
+    return out
+
+def _journal_row(kind: str, key, op: str, data=None) -> tuple:
+    return (kind, json.dumps(key), op, None if data is None else json.dumps(data, separators=(",", ":")))
+
+def journal(kind: str, key, op: str, data=None):
+    global _journal_task
+    if _journal_restoring:
+        return
+    _journal_buf.append(_journal_row(kind, key, op, data))
+    if _journal_task is None or _journal_task.done():
+        _journal_task = asyncio.create_task(journal_flush())
+
+def journal_put(kind: str, key, game: dict):
+    journal(kind, key, "put", _journal_snapshot(game))
+
+def journal_del(kind: str, key):
+    journal(kind, key, "del")
+
+async def journal_flush():
+    """Write everything buffered so far (in order); compacts once the table has grown enough."""
+    global _journal_rows
+    async with _journal_lock:
+        while _journal_buf:
+            rows = list(_journal_buf)
+            _journal_buf.clear()
+            try:
+                await bot.writer.write_many(_JOURNAL_INSERT, rows)
+                _journal_rows += len(rows)
+            except Exception as e:
+                log.warning(f"[journal] dropped {len(rows)} records: {e}")
+        if _journal_rows >= JOURNAL_COMPACT_ROWS:
+            await _journal_compact_locked()
+
+def _journal_live_rows() -> list[tuple]:
+    rows = []
+    for kind, games in (("solo", solo_games), ("casino", casino_games), ("bounty", bounty_games),
+                        ("pending_bounty", pending_bounties), ("dungeon", dungeon_games), ("gate", pending_dungeon_gates_by_msg)):
+        rows += [_journal_row(kind, k, "put", _journal_snapshot(g)) for k, g in games.items()]
+    for did, d in duels.items():
+        if d["state"] in ("pending", "accepting", "active"):
+            snap = _journal_snapshot(d)
+            if snap["state"] == "accepting":
+                snap["state"] = "pending"   # escrow not committed; a committed accept is already "active"
+            rows.append(_journal_row("duel", did, "put", snap))
+    return rows
+
+async def _journal_compact_locked():
+    global _journal_rows
+    rows = []
+    try:
+        async with db_transaction() as db:
+            # snapshot under the gate: transactions that journal their own records (duel escrow,
+            # payouts) update memory before committing, so none can land between this and the DELETE
+            _journal_buf.clear()    # the snapshot below already reflects these
+            rows = _journal_live_rows()
+            await db.execute("DELETE FROM game_journal")
+            await db.executemany(_JOURNAL_INSERT, rows)
+        _journal_rows = len(rows)
+    except Exception as e:
+        log.warning(f"[journal] compaction failed: {e}")
+
+async def journal_compact():
+    async with _journal_lock:
+        await _journal_compact_locked()
+
+async def journal_settle(kind: str, key, finish, pay=None):
+    """
+    End a game: `pay(db)` and the game's `del` record commit in one transaction, so a crash can't
+    restore a game that was already paid out. `finish()` drops the game from memory before the
+    commit. Returns what `pay` returned. Callers claim the game first (game["settled"]) so two
+    racing winners can't both get here.
+    """
+    await journal_flush()   # the game's earlier records must land before its del
+    async with db_transaction() as db:
+        out = await pay(db) if pay else None
+        await db.execute(_JOURNAL_INSERT, _journal_row(kind, key, "del"))
+        finish()
+    return out
 
 
 # ---- Announce cards (UI/UX) ----
@@ -969,6 +2402,81 @@ def make_card(title: str, description: Optional[str] = None, *, fields: Optional
     return emb
 
 
+# ---- Live boards (one message per game, edited in place) ----
+LIVE_EDIT_INTERVAL_S = float(os.getenv("LIVE_EDIT_INTERVAL_S", "1.0"))  # min gap between edits of one board
+
+class LiveBoard:
+    """
+    A game's single board message. update() never blocks: it stores the newest embed and a
+    background flush edits the message at most once per LIVE_EDIT_INTERVAL_S, so guesses that
+    arrive faster than that collapse into one edit showing the latest state.
+    """
+    def __init__(self, channel: discord.abc.Messageable):
+        self.channel = channel
+        self.message: Optional[discord.Message] = None
+        self._pending: Optional[discord.Embed] = None
+        self._task: Optional[asyncio.Task] = None
+        self._last = 0.0
+        self.edits = 0
+
+    async def post(self, embed: discord.Embed, content: Optional[str] = None, **kwargs) -> Optional[discord.Message]:
+        self.message = await safe_send(self.channel, content, embed=embed, **kwargs)
+        self._last = time.monotonic()
+        return self.message
+
+    def update(self, embed: discord.Embed):
+        self._pending = embed
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush())
+
+    async def settle(self, embed: Optional[discord.Embed] = None):
+        """Push the final state and wait until it is on screen (call before deleting the channel)."""
+        if embed is not None:
+            self.update(embed)
+        if self._task:
+            await self._task
+
+    async def _flush(self):
+        while self._pending is not None:
+            wait = self._last + LIVE_EDIT_INTERVAL_S - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            emb, self._pending = self._pending, None
+            try:
+                if self.message is None:
+                    await self.post(emb)
+                    continue
+                await self.message.edit(embed=emb)
+                self.edits += 1
+            except discord.NotFound:
+                self.message = None          # board was deleted: repost on the next update
+            except discord.HTTPException as e:
+                log.warning(f"[board] edit failed in {getattr(self.channel, 'id', '?')}: {e}")
+            self._last = time.monotonic()
+
+def board_embed(game: dict, title: str, *, status: str = "", color: Optional[int] = None) -> discord.Embed:
+    desc = render_board(game["guesses"], total_rows=game["max"])
+    legend = game_legend(game)
+    if legend:
+        desc += f"\n\n{legend}"
+    emb = discord.Embed(title=title, description=desc, color=(color if color is not None else CARD_COLOR_DEFAULT))
+    if status:
+        emb.add_field(name="Status", value=status, inline=False)
+    return emb
+
+def live_board(game: dict, channel: discord.abc.Messageable) -> LiveBoard:
+    board = game.get("live")
+    if board is None or getattr(board.channel, "id", None) != getattr(channel, "id", None):
+        board = game["live"] = LiveBoard(channel)
+    return board
+
+def candidates_note(game: dict) -> str:
+    if not SHOW_CANDIDATES_LEFT or not game["guesses"]:
+        return ""
+    left = len(remaining_answers(game["guesses"]))
+    return f"\n-# {left} possible answer{'s' if left != 1 else ''} left"
+
+
 COLOR_PRIORITY = {"gray":0, "yellow":1, "green":2}
 
 def update_legend(legend: dict[str,str], word: str, colors: list[str]):
@@ -978,6 +2486,62 @@ def update_legend(legend: dict[str,str], word: str, colors: list[str]):
             legend[ch] = col
 
 ALPHABET = list("abcdefghijklmnopqrstuvwxyz")
+_LEGEND_SLOT = {"green": 0, "yellow": 1, "gray": 2}
+
+def apply_guess(game: dict, word: str, pattern: int) -> list[str]:
+    """Append a scored guess: renders its row once and updates legend + legend bitmasks in O(5)."""
+    colors = pattern_colors(pattern)
+    game["guesses"].append({
+        "word": word, "colors": colors, "pattern": pattern,
+        "row": render_pattern_row(word, pattern), "row_v": TILE_VERSION,
+    })
+    legend = game["legend"]
+    update_legend(legend, word, colors)
+    masks = game.get("legend_masks") or _legend_masks(legend)
+    for ch in set(word):
+        bit = 1 << (ord(ch) - 97)
+        masks = [m & ~bit for m in masks]
+        masks[_LEGEND_SLOT[legend[ch]]] |= bit
+    game["legend_masks"] = masks
+    return colors
+
+def _legend_masks(legend: dict[str, str]) -> list[int]:
+    masks = [0, 0, 0]
+    for ch, col in legend.items():
+        masks[_LEGEND_SLOT[col]] |= 1 << (ord(ch) - 97)
+    return masks
+
+def _legend_text(green: int, yellow: int, gray: int) -> str:
+    key = (green, yellow, gray)
+    text = _legend_cache.get(key)
+    if text is not None:
+        return text
+    used = green | yellow | gray
+    if not used:
+        text = ""
+    else:
+        letters = lambda mask: [ch for i, ch in enumerate(ALPHABET) if mask >> i & 1]
+        parts = []
+        if green:
+            parts.append("**Correct**: " + " ".join(render_tile(ch, "green") for ch in letters(green)))
+        if yellow:
+            parts.append("**Present**: " + " ".join(render_tile(ch, "yellow") for ch in letters(yellow)))
+        if gray:
+            # show ABSENT with RED tiles
+            parts.append("**Absent**: " + " ".join(render_tile(ch, "red") for ch in letters(gray)))
+        not_used = letters(~used & ((1 << 26) - 1))
+        if not_used:
+            parts.append("**Not used**: " + " ".join(render_tile(ch, "gray") for ch in not_used))
+        text = "\n".join(parts)
+    if len(_legend_cache) >= ROW_CACHE_MAX:
+        _legend_cache.clear()
+    _legend_cache[key] = text
+    return text
+
+def game_legend(game: dict) -> str:
+    """Legend for a game whose guesses went through apply_guess (cached per letter state)."""
+    masks = game.get("legend_masks") or _legend_masks(game.get("legend", {}))
+    return _legend_text(*masks)
 
 def legend_overview(legend: dict[str, str], guesses: Optional[list[dict]] = None) -> str:
     """Render the legend:
@@ -985,43 +2549,7 @@ def legend_overview(legend: dict[str, str], guesses: Optional[list[dict]] = None
        - Absent (shown with RED tiles)
        - Not used (letters never guessed; shown with GREY tiles)
     """
-    if not legend:
-        # still show Not used if we have guesses
-        used_letters = set()
-        if guesses:
-            for g in guesses:
-                used_letters.update(g.get("word", ""))
-        else:
-            return ""
-    else:
-        greens  = sorted([ch for ch, c in legend.items() if c == "green"])
-        yellows = sorted([ch for ch, c in legend.items() if c == "yellow"])
-        grays   = sorted([ch for ch, c in legend.items() if c == "gray"])
-
-    # Determine which letters are not used yet
-    if guesses:
-        used_letters = set()
-        for g in guesses:
-            used_letters.update(g.get("word", ""))
-    else:
-        used_letters = set(legend.keys())
-
-    not_used = [ch for ch in "abcdefghijklmnopqrstuvwxyz" if ch not in used_letters]
-
-    parts = []
-    if legend:
-        if greens:
-            parts.append("**Correct**: " + " ".join(render_tile(ch, "green") for ch in greens))
-        if yellows:
-            parts.append("**Present**: " + " ".join(render_tile(ch, "yellow") for ch in yellows))
-        if grays:
-            # show ABSENT with RED tiles
-            parts.append("**Absent**: " + " ".join(render_tile(ch, "red") for ch in grays))
-
-    if not_used:
-        parts.append("**Not used**: " + " ".join(render_tile(ch, "gray") for ch in not_used))
-
-    return "\n".join(parts)
+    return _legend_text(*_legend_masks(legend))
 
 
 
@@ -1077,44 +2605,152 @@ def load_fail_quips() -> list[str]:
 FAIL_QUIPS = load_fail_quips()
 
 # -------------------- definitions (on fail) --------------------
-_definition_cache: dict[str, str] = {}
+# Lookup order: local dictionary file -> in-memory LRU -> SQLite `definitions` -> dictionaryapi.dev.
+# Answers are prefetched as soon as a game picks them, so the fail message normally hits a cache.
+DEFINITIONS_FILE   = pathlib.Path(os.getenv("DEFINITIONS_FILE", "definitions.tsv"))  # word<TAB>definition
+DEF_CACHE_SIZE     = int(os.getenv("DEF_CACHE_SIZE", "4096"))
+DEF_TTL_S          = int(float(os.getenv("DEF_TTL_DAYS", "30")) * 86400)
+DEF_MISS_TTL_S     = int(float(os.getenv("DEF_MISS_TTL_HOURS", "24")) * 3600)   # "no definition" answers
+DEF_WARMUP         = os.getenv("DEF_WARMUP", "0") == "1"   # opt-in: ~2.3k requests to the public API
+DEF_WARMUP_DELAY_S = float(os.getenv("DEF_WARMUP_DELAY_S", "0.5"))
+
+_local_definitions: dict[str, str] = {}
+_definition_cache: "OrderedDict[str, tuple[str, float]]" = OrderedDict()   # word -> (definition, expires_ts)
+_definition_inflight: dict[str, asyncio.Future] = {}
+_prefetch_tasks: set[asyncio.Task] = set()
+
+def _clamp_definition(d: str) -> str:
+    # Clamp to a reasonable length
+    return (d[:220] + "…") if len(d) > 220 else d
+
+def load_local_definitions(path: pathlib.Path = DEFINITIONS_FILE) -> dict[str, str]:
+    out = {}
+    if not path.exists():
+        return out
+    try:
+        for line in path.read_text(encoding="utf-8").splitlines():
+            word, sep, text = line.partition("\t")
+            if sep and word.strip() and text.strip():
+                out[word.strip().lower()] = _clamp_definition(text.strip())
+        log.info(f"[defs] loaded {len(out)} local definitions from {path}")
+    except Exception as e:
+        log.warning(f"[defs] failed to read {path}: {e}")
+    return out
 
-def _fetch_definition_sync(word: str) -> str:
-    """Fetch a short definition using the free dictionary API. Cached. Returns '' if unavailable."""
+async def _fetch_definition(word: str) -> Optional[str]:
+    """Fetch a short definition using the free dictionary API. '' if the word has none, None on error."""
     w = word.lower()
-    if w in _definition_cache:
-        return _definition_cache[w]
     try:
-        r = requests.get(f"https://api.dictionaryapi.dev/api/v2/entries/en/{w}", timeout=8)
-        if r.status_code != 200:
-            _definition_cache[w] = ""
+        # a fail message may be waiting on this: 8s for everything, like the old single request
+        status, body = await http.get(f"{DICTIONARY_API_URL}/{w}", deadline_s=8)
+        if status == 404:
             return ""
-        data = r.json()
+        if status != 200:
+            raise RuntimeError(f"HTTP {status}")
+        data = json.loads(body)
         # Walk to the first definition
         if isinstance(data, list) and data:
-            meanings = data[0].get("meanings", [])
-            for m in meanings:
+            for m in data[0].get("meanings", []):
                 defs = m.get("definitions", [])
-                if defs:
-                    d = defs[0].get("definition", "")
-                    if d:
-                        # Clamp to a reasonable length
-                        d = (d[:220] + "…") if len(d) > 220 else d
-                        _definition_cache[w] = d
-                        return d
+                if defs and defs[0].get("definition"):
+                    return _clamp_definition(defs[0]["definition"])
+        return ""
     except Exception as e:
         log.warning(f"[defs] lookup failed for {w}: {e}")
-    _definition_cache[w] = ""
-    return ""
+        return None
+
+def _remember_definition(w: str, d: str, fetched_ts: float):
+    _definition_cache[w] = (d, fetched_ts + (DEF_TTL_S if d else DEF_MISS_TTL_S))
+    _definition_cache.move_to_end(w)
+    while len(_definition_cache) > DEF_CACHE_SIZE:
+        _definition_cache.popitem(last=False)
+
+async def _load_definition(w: str) -> str:
+    async with bot.db.execute("SELECT definition, fetched_ts FROM definitions WHERE word=?", (w,)) as cur:
+        row = await cur.fetchone()
+    now = int(time.time())
+    if row and now < row[1] + (DEF_TTL_S if row[0] else DEF_MISS_TTL_S):
+        _remember_definition(w, row[0], row[1])
+        return row[0]
+    d = await _fetch_definition(w)
+    if d is None:
+        return row[0] if row else ""   # network trouble: serve stale, don't cache the failure
+    _remember_definition(w, d, now)
+    await db_write("""
+      INSERT INTO definitions(word, definition, fetched_ts) VALUES(?,?,?)
+      ON CONFLICT(word) DO UPDATE SET definition=excluded.definition, fetched_ts=excluded.fetched_ts
+    """, (w, d, now))
+    return d
 
 async def fetch_definition(word: str) -> str:
-    return await asyncio.to_thread(_fetch_definition_sync, word)
+    """Short definition for `word`, or '' if none is known. Concurrent lookups share one fetch."""
+    w = word.lower()
+    if w in _local_definitions:
+        return _local_definitions[w]
+    hit = _definition_cache.get(w)
+    if hit and time.time() < hit[1]:
+        _definition_cache.move_to_end(w)
+        return hit[0]
+    fut = _definition_inflight.get(w)
+    if fut:
+        return await asyncio.shield(fut)
+    fut = asyncio.get_running_loop().create_future()
+    _definition_inflight[w] = fut
+    d = ""
+    try:
+        d = await _load_definition(w)
+    except Exception as e:
+        log.warning(f"[defs] {w}: {e}")
+    finally:
+        _definition_inflight.pop(w, None)
+        fut.set_result(d)
+    return d
+
+def prefetch_definition(word: str):
+    """Warm the definition cache in the background."""
+    w = word.lower()
+    hit = _definition_cache.get(w)
+    if w in _local_definitions or w in _definition_inflight or (hit and time.time() < hit[1]):
+        return
+    task = asyncio.create_task(fetch_definition(w))
+    _prefetch_tasks.add(task)
+    task.add_done_callback(_prefetch_tasks.discard)
+
+def pick_answer() -> str:
+    answer = random.choice(ANSWERS)
+    prefetch_definition(answer)
+    return answer
+
+async def definition_warmup():
+    """Fill the definitions table for answers it doesn't know yet (one at a time, rate-limited)."""
+    if not DEF_WARMUP:
+        return
+    async with bot.db.execute("SELECT word FROM definitions") as cur:
+        known = {r[0] for r in await cur.fetchall()}
+    todo = [w for w in ANSWERS if w not in known and w not in _local_definitions]
+    if not todo:
+        return
+    log.info(f"[defs] warm-up: fetching {len(todo)} definitions")
+    for w in todo:
+        await fetch_definition(w)
+        await asyncio.sleep(DEF_WARMUP_DELAY_S)
+    log.info("[defs] warm-up finished")
+
+_warmup_task: Optional[asyncio.Task] = None
+
+def start_definition_warmup():
+    global _warmup_task
+    if _warmup_task is None or _warmup_task.done():
+        _warmup_task = asyncio.create_task(definition_warmup())
+
+with boot_stage("local definitions"):
+    _local_definitions = load_local_definitions()
 
 # -------------------- guards --------------------
 async def guard_worldler_inter(inter: discord.Interaction) -> bool:
     if inter.command and inter.command.name in {
         "immigrate","help","worldle_resync","worldle_bounty_setchannel",
-        "worldle_set_category","worldle_set_announce","streaks","mystreak"
+        "worldle_set_category","worldle_set_rooms","worldle_set_announce","streaks","mystreak"
     }:
         return True
     if not inter.guild:
@@ -1125,15 +2761,142 @@ async def guard_worldler_inter(inter: discord.Interaction) -> bool:
     await inter.response.send_message(f"You need the **{WORLDLER_ROLE_NAME}** role. Use `/immigrate` to join Wordle World!", ephemeral=True)
     return False
 
+WORDS_LOADING_MSG = "⏳ The word lists are still loading — try again in a minute."
+
+async def guard_words_inter(inter: discord.Interaction) -> bool:
+    """Only for commands that pick an answer or score guesses."""
+    if WORDS_READY:
+        return True
+    await inter.response.send_message(WORDS_LOADING_MSG, ephemeral=True)
+    return False
+
 async def guard_worldler_msg(msg: discord.Message) -> bool:
     if not msg.guild: return False
     if msg.author.bot: return False
     return await is_worldler(msg.guild, msg.author)
 
+# -------------------- room pool (reusable private game rooms) --------------------
+# Creating and deleting channels is slow and heavily rate-limited, so each guild keeps a few
+# idle rooms (hidden, named worldle-room-N) in its solo category. Starting a game is one
+# overwrite edit on an idle room; finishing purges it and puts it back. Rooms are recognised
+# by name, so the pool survives restarts. With no solo category (or ROOM_POOL_SIZE=0) games
+# fall back to one-off channels.
+ROOM_POOL_SIZE = int(os.getenv("ROOM_POOL_SIZE", "3"))
+ROOM_THREAD_ARCHIVE_MIN = int(os.getenv("ROOM_THREAD_ARCHIVE_MIN", "60"))   # 60/1440/4320/10080
+GAME_ROOM_TYPES = (discord.TextChannel, discord.Thread)
+ROOM_PREFIX = "worldle-room-"
+room_pool: dict[int, list[int]] = {}      # guild_id -> idle room channel ids
+pooled_rooms: set[int] = set()            # every room the pool owns (idle or in use)
+_room_refills: dict[int, asyncio.Task] = {}
+
+def _idle_room_overwrites(guild: discord.Guild) -> dict:
+    return {
+        guild.default_role: discord.PermissionOverwrite(view_channel=False, mention_everyone=False),
+        guild.me: discord.PermissionOverwrite(view_channel=True, send_messages=True, read_message_history=True,
+                                              manage_channels=True, manage_messages=True, mention_everyone=False),
+    }
+
+async def _reset_room(ch: discord.TextChannel) -> bool:
+    """Wipe a room's messages and lock it back to bot-only."""
+    try:
+        await ch.purge(limit=500, reason="Wordle World room recycled")
+        idle = _idle_room_overwrites(ch.guild)
+        if ch.overwrites != idle:
+            await ch.edit(overwrites=idle, reason="Wordle World room recycled")
+        return True
+    except discord.HTTPException as e:
+        log.warning(f"[rooms] reset of {ch.id} failed: {e}")
+        return False
+
+async def take_room(guild: discord.Guild, overwrites: dict, reason: str) -> Optional[discord.TextChannel]:
+    """Hand out an idle pooled room with the game's overwrites applied (one API call), or None."""
+    idle = room_pool.get(guild.id) or []
+    ch = None
+    while idle and ch is None:
+        cand = guild.get_channel(idle.pop())
+        if not isinstance(cand, discord.TextChannel):
+            continue
+        try:
+            await cand.edit(overwrites=overwrites, reason=reason)
+            ch = cand
+        except discord.HTTPException as e:
+            log.warning(f"[rooms] could not assign {cand.id}: {e}")
+            pooled_rooms.discard(cand.id)
+    start_room_refill(guild)
+    return ch
+
+async def _make_thread_room(guild: discord.Guild, cfg: dict, member: discord.Member, name: str, reason: str) -> Optional[discord.Thread]:
+    """Private thread under the guild's room parent (the 'thread' room backend). None if unusable."""
+    parent = guild.get_channel(cfg["room_parent_id"]) if cfg.get("room_parent_id") else None
+    if not isinstance(parent, discord.TextChannel):
+        return None
+    try:
+        th = await parent.create_thread(name=name, type=discord.ChannelType.private_thread, invitable=False,
+                                        auto_archive_duration=ROOM_THREAD_ARCHIVE_MIN, reason=reason)
+        await th.add_user(member)
+        return th
+    except discord.HTTPException as e:
+        log.warning(f"[rooms] thread room in {parent.id} failed, using a channel: {e}")
+        return None
+
+def get_room(guild: discord.Guild, cid: Optional[int]):
+    """A game room by id: text channel or thread."""
+    return guild.get_channel_or_thread(cid) if cid else None
+
+async def release_room(ch: "discord.TextChannel | discord.Thread", reason: str):
+    """Return a pooled room to the pool; thread rooms are locked and archived; other channels are deleted."""
+    if isinstance(ch, discord.Thread):
+        try:
+            await ch.edit(archived=True, locked=True, reason=reason)
+        except Exception:
+            pass
+        return
+    gid = ch.guild.id
+    # keep up to 2x the target idle, so a refill that raced this game doesn't cost a create + delete per game
+    if ch.id in pooled_rooms and len(room_pool.get(gid, [])) < 2 * ROOM_POOL_SIZE and await _reset_room(ch):
+        room_pool.setdefault(gid, []).append(ch.id)
+        return
+    pooled_rooms.discard(ch.id)
+    try:
+        await ch.delete(reason=reason)
+    except Exception:
+        pass
+
+def start_room_refill(guild: discord.Guild):
+    task = _room_refills.get(guild.id)
+    if ROOM_POOL_SIZE > 0 and (task is None or task.done()):
+        _room_refills[guild.id] = asyncio.create_task(_refill_rooms(guild))
+
+async def _refill_rooms(guild: discord.Guild):
+    try:
+        cfg = await get_cfg(guild.id)
+        cat = guild.get_channel(cfg["solo_category_id"]) if cfg.get("solo_category_id") else None
+        if not isinstance(cat, discord.CategoryChannel) or not guild.me.guild_permissions.manage_channels:
+            return
+        idle = room_pool.setdefault(guild.id, [])
+        # adopt rooms left over from a previous run
+        for ch in cat.text_channels:
+            if ch.name.startswith(ROOM_PREFIX) and ch.id not in pooled_rooms and len(idle) < ROOM_POOL_SIZE:
+                if await _reset_room(ch):
+                    pooled_rooms.add(ch.id)
+                    idle.append(ch.id)
+        taken = {c.name for c in guild.text_channels}
+        n = 1
+        while len(idle) < ROOM_POOL_SIZE:
+            while f"{ROOM_PREFIX}{n}" in taken:
+                n += 1
+            ch = await guild.create_text_channel(name=f"{ROOM_PREFIX}{n}", overwrites=_idle_room_overwrites(guild),
+                                                 category=cat, reason="Wordle World room pool")
+            taken.add(ch.name)
+            pooled_rooms.add(ch.id)
+            idle.append(ch.id)
+    except Exception as e:
+        log.warning(f"[rooms] refill for guild {guild.id} failed: {e}")
+
 # -------------------- SOLO (private rooms + daily cap + announcements + streak touch) --------------------
 def _key(gid, cid, uid): return (gid, cid, uid)
 
-async def _make_private_solo_channel(invocation_channel: discord.TextChannel, member: discord.Member) -> Optional[discord.TextChannel]:
+async def _make_private_solo_channel(invocation_channel: discord.TextChannel, member: discord.Member) -> Optional["discord.TextChannel | discord.Thread"]:
     guild = invocation_channel.guild
     me = guild.me
     if not me or not me.guild_permissions.manage_channels:
@@ -1148,21 +2911,26 @@ async def _make_private_solo_channel(invocation_channel: discord.TextChannel, me
     if category and not isinstance(category, discord.CategoryChannel):
         category = None
 
+    overwrites = {
+        **_idle_room_overwrites(guild),
+        member: discord.PermissionOverwrite(view_channel=True, send_messages=True, read_message_history=True, mention_everyone=False),
+    }
+    if worldler_role:
+        overwrites[worldler_role] = discord.PermissionOverwrite(view_channel=True, send_messages=False, read_message_history=True, mention_everyone=False)
     base = re.sub(r"[^a-zA-Z0-9]+", "-", member.display_name).strip("-").lower() or f"user-{member.id}"
     base = f"{base}-worldle"
+    if cfg.get("room_backend") == "thread":
+        room = await _make_thread_room(guild, cfg, member, base, reason="Wordle World solo")
+    else:
+        room = await take_room(guild, overwrites, reason="Wordle World solo")
+    if room:
+        return room
+
     name = base
     i = 2
     while discord.utils.get(guild.text_channels, name=name):
         name = f"{base}-{i}"; i += 1
 
-    overwrites = {
-        guild.default_role: discord.PermissionOverwrite(view_channel=False, mention_everyone=False),
-        member: discord.PermissionOverwrite(view_channel=True, send_messages=True, read_message_history=True, mention_everyone=False),
-        me: discord.PermissionOverwrite(view_channel=True, send_messages=True, read_message_history=True, manage_channels=True, mention_everyone=False),
-    }
-    if worldler_role:
-        overwrites[worldler_role] = discord.PermissionOverwrite(view_channel=True, send_messages=False, read_message_history=True, mention_everyone=False)
-
     ch = await guild.create_text_channel(name=name, overwrites=overwrites, category=category, reason="Wordle World solo")
     return ch
 
@@ -1220,6 +2988,7 @@ async def _announce_result(
         ch,
         embed=emb,
         allowed_mentions=discord.AllowedMentions(users=True, roles=False, everyone=False),
+        priority=SEND_LOW, wait=False,
     )
 
 
@@ -1231,6 +3000,9 @@ async def _announce_result(
 
 async def solo_start(invocation_channel: discord.TextChannel, user: discord.Member) -> Optional[discord.TextChannel]:
     gid, uid = invocation_channel.guild.id, user.id
+    if not WORDS_READY:
+        await invocation_channel.send(WORDS_LOADING_MSG, delete_after=20)
+        return None
     today = uk_today_str()  # UK-local reset
 
     plays = await get_solo_plays_today(gid, uid, today)
@@ -1240,8 +3012,8 @@ async def solo_start(invocation_channel: discord.TextChannel, user: discord.Memb
 
     existing_cid = solo_channels.get((gid, uid))
     if existing_cid and _key(gid, existing_cid, uid) in solo_games:
-        ch = invocation_channel.guild.get_channel(existing_cid)
-        if isinstance(ch, discord.TextChannel):
+        ch = get_room(invocation_channel.guild, existing_cid)
+        if isinstance(ch, GAME_ROOM_TYPES):
             await invocation_channel.send(f"{user.mention} you already have a game running: {ch.mention}", allowed_mentions=discord.AllowedMentions.none())
             return ch
         else:
@@ -1252,7 +3024,7 @@ async def solo_start(invocation_channel: discord.TextChannel, user: discord.Memb
         return None
 
     solo_games[_key(gid, ch.id, uid)] = {
-        "answer": random.choice(ANSWERS),
+        "answer": pick_answer(),
         "guesses": [],
         "max": 5,
         "legend": {},
@@ -1266,14 +3038,16 @@ async def solo_start(invocation_channel: discord.TextChannel, user: discord.Memb
     if plays == 0:
         await update_streak_on_play(gid, uid, today)
 
-    board = render_board(solo_games[_key(gid, ch.id, uid)]["guesses"])
+    game = solo_games[_key(gid, ch.id, uid)]
     left = 5 - (plays + 1)
-    await ch.send(
-        f"{user.mention} 🎮 **Your Wordle is ready!** (today’s uses left after this: **{left}**)\n"
-        f"You have **5 tries**.\nPayouts if you solve: 1st=5, 2nd=4, 3rd=3, 4th=2, 5th=1.",
+    await live_board(game, ch).post(
+        board_embed(game, "🎮 Solo Worldle", status=f"Attempt **1/{game['max']}** — solve now for **{payout_for_attempt(1)}**."),
+        content=(
+            f"{user.mention} 🎮 **Your Wordle is ready!** (today’s uses left after this: **{left}**)\n"
+            f"You have **5 tries**.\nPayouts if you solve: 1st=5, 2nd=4, 3rd=3, 4th=2, 5th=1."
+        ),
         allowed_mentions=discord.AllowedMentions(users=[user])
     )
-    await ch.send(board)
     return ch
 
 
@@ -1281,7 +3055,7 @@ async def solo_start(invocation_channel: discord.TextChannel, user: discord.Memb
 async def solo_guess(channel: discord.TextChannel, user: discord.Member, word: str):
     gid, cid, uid = channel.guild.id, channel.id, user.id
     game = solo_games.get(_key(gid,cid,uid))
-    if not game:
+    if not game or game.get("settled"):
         await channel.send(f"{user.mention} no game here. Start with `w` or `/worldle`.", allowed_mentions=discord.AllowedMentions.none())
         return
 
@@ -1293,14 +3067,13 @@ async def solo_guess(channel: discord.TextChannel, user: discord.Member, word: s
     if len(game["guesses"]) >= game["max"]:
         await channel.send("Out of tries! Start a new one with `w`."); return
 
-    colors = score_guess(cleaned, game["answer"])
-    game["guesses"].append({"word": cleaned, "colors": colors})
-    update_legend(game["legend"], cleaned, colors)
+    pattern = score_pattern(cleaned, game["answer"])
+    apply_guess(game, cleaned, pattern)
+    journal("solo", _key(gid, cid, uid), "guess", cleaned)
 
     board = render_board(game["guesses"])
     attempt = len(game["guesses"])
-
-    await channel.send(board)
+    live = live_board(game, channel)
 
     def _cleanup():
         solo_games.pop(_key(gid,cid,uid), None)
@@ -1308,71 +3081,230 @@ async def solo_guess(channel: discord.TextChannel, user: discord.Member, word: s
             solo_channels.pop((gid, uid), None)
 
     if cleaned == game["answer"]:
+        game["settled"] = True   # a sniper's shot landing meanwhile must not pay too
+        payout = payout_for_attempt(attempt)
+        bal_new = await journal_settle("solo", _key(gid, cid, uid), _cleanup,
+                                       lambda db: tx_credit(db, gid, uid, payout))
+        if payout:
+            await _after_balance_change(gid, uid, cid, bal_new - payout, bal_new)
+        origin_cid = game.get("origin_cid")
+        ans = game["answer"].upper()
+
+        await live.settle(board_embed(
+            game, "🎮 Solo Worldle — Solved",
+            status=f"🎉 {user.mention} solved it on attempt **{attempt}**! **Word: {ans}** · Payout **{payout} {EMO_SHEKEL()}**. Balance **{bal_new}**.",
+            color=CARD_COLOR_SUCCESS,
+        ))
+
+        emb = make_card(
+            title="🏁 Solo — Finished",
+            description=f"{user.mention} solved **{ans}** in **{attempt}** tries and earned **{payout} {EMO_SHEKEL()}**.",
+            fields=[("Board", board, False)],  # <-- no code block
+            color=CARD_COLOR_SUCCESS,
+        )
+        await _announce_result(channel.guild, origin_cid, content="", embed=emb)
+
+        await release_room(channel, reason="Wordle World solo finished (win)")
+        return
+
+    if attempt == game["max"]:
+        ans_raw = game["answer"]
+        ans = ans_raw.upper()
+        origin_cid = game.get("origin_cid")
+        quip = random.choice(FAIL_QUIPS)
+        definition = await fetch_definition(ans_raw)
+        _cleanup()
+        await inc_stat(gid, uid, "solo_fails", 1)
+        bal_now = await get_balance(gid, uid)
+        def_line = f"\n📖 Definition: {definition}" if definition else ""
+        await live.settle(board_embed(
+            game, "🎮 Solo Worldle — Failed",
+            status=f"❌ Out of tries. The word was **{ans}** — {quip}{def_line}\nBalance **{bal_now}**.",
+            color=CARD_COLOR_FAIL,
+        ))
+
+        fields = [("Board", board, False)]
+        if definition:
+            fields.append(("Definition", definition, False))
+        emb = make_card(
+            title="💀 Solo — Failed",
+            description=f"{user.mention} failed their Worldle. The word was **{ans}** — {quip}",
+            fields=fields,
+            color=CARD_COLOR_FAIL,
+        )
+        await _announce_result(channel.guild, origin_cid, content="", embed=emb)
+
+        await release_room(channel, reason="Wordle World solo finished (out of tries)")
+        return
+
+    next_attempt = attempt + 1
+    payout = payout_for_attempt(next_attempt)
+    live.update(board_embed(
+        game, "🎮 Solo Worldle",
+        status=f"Attempt **{attempt}/{game['max']}** — If you solve on attempt **{next_attempt}**, payout will be **{payout}**.{candidates_note(game)}",
+    ))
+
+
+
+
+# -------------------- QUICK SOLO (ephemeral, no room) --------------------
+# The whole game is one ephemeral message: a Guess button opens a modal and every guess edits
+# that message in place. Same daily cap, payouts and streak touch as room solos; only the final
+# result card is posted publicly.
+# unanswered this long = forfeit; capped below Discord's 15-minute interaction token so the
+# forfeit can still reveal the answer on the ephemeral message
+QUICK_IDLE_S = min(840.0, float(os.getenv("QUICK_IDLE_S", "840")))
+quick_games: dict[Tuple[int, int], dict] = {}              # (gid, uid) -> {answer, guesses[], max, legend, origin_cid, view}
+
+class QuickGuessModal(discord.ui.Modal, title="Your guess"):
+    word = discord.ui.TextInput(label="5-letter word", min_length=5, max_length=5, placeholder="CRANE")
+
+    async def on_submit(self, interaction: discord.Interaction):
+        await quick_guess(interaction, str(self.word.value))
+
+class QuickSoloView(discord.ui.View):
+    def __init__(self, gid: int, uid: int):
+        super().__init__(timeout=QUICK_IDLE_S)
+        self.key = (gid, uid)
+        self.inter: Optional[discord.Interaction] = None   # last interaction that drew the game message
+
+    @discord.ui.button(label="Guess", style=discord.ButtonStyle.primary, emoji="⌨️")
+    async def guess_btn(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if self.key not in quick_games:
+            return await interaction.response.edit_message(content="This game is over.", view=None)
+        await interaction.response.send_modal(QuickGuessModal())
+
+    @discord.ui.button(label="Give up", style=discord.ButtonStyle.secondary)
+    async def give_up_btn(self, interaction: discord.Interaction, button: discord.ui.Button):
+        game = quick_games.pop(self.key, None)
+        if not game:
+            return await interaction.response.edit_message(content="This game is over.", view=None)
+        await _quick_fail(interaction, game, "🏳️ You gave up.")
+
+    async def on_timeout(self):
+        game = quick_games.get(self.key)
+        if game and game.get("view") is self and self.inter:
+            quick_games.pop(self.key, None)
+            await _quick_fail(self.inter, game, "⏲️ Timed out.", responded=True)
+
+async def quick_start(inter: discord.Interaction):
+    gid, uid = inter.guild.id, inter.user.id
+    if (gid, uid) in quick_games:
+        return await inter.response.send_message("You already have a quick game open — use its **Guess** button.", ephemeral=True)
+    today = uk_today_str()
+    plays = await get_solo_plays_today(gid, uid, today)
+    if plays >= 5:
+        return await inter.response.send_message("You've reached your **5 solo games** for today. Resets at **00:00 UK time**.", ephemeral=True)
+
+    view = QuickSoloView(gid, uid)
+    game = quick_games[(gid, uid)] = {
+        "answer": pick_answer(), "guesses": [], "max": 5, "legend": {},
+        "origin_cid": inter.channel_id, "start_date": today, "view": view,
+    }
+    await inc_solo_plays_today(gid, uid, today)
+    if plays == 0:
+        await update_streak_on_play(gid, uid, today)
+    await inter.response.send_message(
+        f"🎮 **Quick Wordle** (today’s uses left after this: **{5 - (plays + 1)}**) — "
+        f"payouts 1st=5, 2nd=4, 3rd=3, 4th=2, 5th=1.",
+        embed=board_embed(game, "🎮 Quick Wordle", status="Press **Guess** to play."),
+        view=view, ephemeral=True,
+    )
+    view.inter = inter
+
+async def quick_guess(inter: discord.Interaction, word: str):
+    gid, uid = inter.guild.id, inter.user.id
+    game = quick_games.get((gid, uid))
+    if not game:
+        return await inter.response.edit_message(content="This game is over.", view=None)
+
+    cleaned = "".join(ch for ch in word.lower().strip() if ch.isalpha())
+    problem = None
+    if len(cleaned) != 5:
+        problem = "Guess must be **exactly 5 letters**."
+    elif not is_valid_guess(cleaned):
+        problem = f"`{cleaned.upper()}` is not in the Wordle dictionary (UK variants supported)."
+    game["view"].inter = inter
+    if problem:
+        return await inter.response.edit_message(embed=board_embed(game, "🎮 Quick Wordle", status=problem), view=game["view"])
+
+    apply_guess(game, cleaned, score_pattern(cleaned, game["answer"]))
+    attempt = len(game["guesses"])
+
+    if cleaned == game["answer"]:
+        quick_games.pop((gid, uid), None)
+        game["view"].stop()
+        await inter.response.defer()
         payout = payout_for_attempt(attempt)
         if payout:
-            await change_balance(gid, uid, payout, announce_channel_id=cid)
+            await change_balance(gid, uid, payout)
         bal_new = await get_balance(gid, uid)
-        origin_cid = game.get("origin_cid")
         ans = game["answer"].upper()
-        _cleanup()
-
-        await channel.send(
-            f"🎉 {user.mention} solved it on attempt **{attempt}**! **Word: {ans}** · Payout **{payout} {EMO_SHEKEL()}**. Balance **{bal_new}**.",
-            allowed_mentions=discord.AllowedMentions.none()
-        )
-
+        await inter.edit_original_response(embed=board_embed(
+            game, "🎮 Quick Wordle — Solved",
+            status=f"🎉 Solved on attempt **{attempt}**! **Word: {ans}** · Payout **{payout} {EMO_SHEKEL()}**. Balance **{bal_new}**.",
+            color=CARD_COLOR_SUCCESS,
+        ), view=None)
         emb = make_card(
             title="🏁 Solo — Finished",
-            description=f"{user.mention} solved **{ans}** in **{attempt}** tries and earned **{payout} {EMO_SHEKEL()}**.",
-            fields=[("Board", board, False)],  # <-- no code block
+            description=f"{inter.user.mention} solved **{ans}** in **{attempt}** tries and earned **{payout} {EMO_SHEKEL()}**.",
+            fields=[("Board", render_board(game["guesses"]), False)],
             color=CARD_COLOR_SUCCESS,
         )
-        await _announce_result(channel.guild, origin_cid, content="", embed=emb)
-
-        try: await channel.delete(reason="Wordle World solo finished (win)")
-        except Exception: pass
+        await _announce_result(inter.guild, game.get("origin_cid"), content="", embed=emb)
         return
 
     if attempt == game["max"]:
-        ans_raw = game["answer"]
-        ans = ans_raw.upper()
-        origin_cid = game.get("origin_cid")
-        quip = random.choice(FAIL_QUIPS)
-        definition = await fetch_definition(ans_raw)
-        _cleanup()
-        await inc_stat(gid, uid, "solo_fails", 1)
-        bal_now = await get_balance(gid, uid)
-        def_line = f"\n📖 Definition: {definition}" if definition else ""
-        await channel.send(f"❌ Out of tries. The word was **{ans}** — {quip}{def_line}\nBalance **{bal_now}**.")
-
-        fields = [("Board", board, False)]
-        if definition:
-            fields.append(("Definition", definition, False))
-        emb = make_card(
-            title="💀 Solo — Failed",
-            description=f"{user.mention} failed their Worldle. The word was **{ans}** — {quip}",
-            fields=fields,
-            color=CARD_COLOR_FAIL,
-        )
-        await _announce_result(channel.guild, origin_cid, content="", embed=emb)
-
-        try: await channel.delete(reason="Wordle World solo finished (out of tries)")
-        except Exception: pass
+        quick_games.pop((gid, uid), None)
+        await _quick_fail(inter, game, "❌ Out of tries.")
         return
 
     next_attempt = attempt + 1
-    legend = legend_overview(game["legend"], game["guesses"])
-    payout = payout_for_attempt(next_attempt)
-    msg = f"Attempt **{attempt}/{game['max']}** — If you solve on attempt **{next_attempt}**, payout will be **{payout}**."
-    if legend: msg += f"\n{legend}"
-    await channel.send(msg)
-
-
+    await inter.response.edit_message(embed=board_embed(
+        game, "🎮 Quick Wordle",
+        status=f"Attempt **{attempt}/{game['max']}** — If you solve on attempt **{next_attempt}**, payout will be **{payout_for_attempt(next_attempt)}**.{candidates_note(game)}",
+    ), view=game["view"])
+
+async def _quick_fail(inter: discord.Interaction, game: dict, headline: str, *, responded: bool = False):
+    """Finish a quick game as a loss (out of tries, given up or timed out); the game is already unregistered.
+    `responded`: `inter` was answered earlier (timeout), so only its message is edited."""
+    game["view"].stop()
+    if not responded:
+        await inter.response.defer()
+    gid, uid = inter.guild.id, inter.user.id
+    ans_raw = game["answer"]
+    ans = ans_raw.upper()
+    quip = random.choice(FAIL_QUIPS)
+    definition = await fetch_definition(ans_raw)
+    await inc_stat(gid, uid, "solo_fails", 1)
+    bal_now = await get_balance(gid, uid)
+    def_line = f"\n📖 Definition: {definition}" if definition else ""
+    try:
+        await inter.edit_original_response(embed=board_embed(
+            game, "🎮 Quick Wordle — Failed",
+            status=f"{headline} The word was **{ans}** — {quip}{def_line}\nBalance **{bal_now}**.",
+            color=CARD_COLOR_FAIL,
+        ), view=None)
+    except discord.HTTPException as e:
+        log.warning(f"[quick] could not update the game message for {uid}: {e}")
+    fields = [("Board", render_board(game["guesses"]), False)]
+    if definition:
+        fields.append(("Definition", definition, False))
+    emb = make_card(
+        title="💀 Solo — Failed",
+        description=f"{inter.user.mention} failed their Worldle. The word was **{ans}** — {quip}",
+        fields=fields,
+        color=CARD_COLOR_FAIL,
+    )
+    await _announce_result(inter.guild, game.get("origin_cid"), content="", embed=emb)
 
 
 # -------------------- CASINO: Word Pot (new) --------------------
 async def casino_start_word_pot(invocation_channel: discord.TextChannel, user: discord.Member) -> Optional[discord.TextChannel]:
     gid, uid = invocation_channel.guild.id, user.id
+    if not WORDS_READY:
+        await invocation_channel.send(WORDS_LOADING_MSG, delete_after=20)
+        return None
 
     bal = await get_balance(gid, uid)
     if bal < 1:
@@ -1381,8 +3313,8 @@ async def casino_start_word_pot(invocation_channel: discord.TextChannel, user: d
 
     existing_cid = casino_channels.get((gid, uid))
     if existing_cid and _key(gid, existing_cid, uid) in casino_games:
-        ch = invocation_channel.guild.get_channel(existing_cid)
-        if isinstance(ch, discord.TextChannel):
+        ch = get_room(invocation_channel.guild, existing_cid)
+        if isinstance(ch, GAME_ROOM_TYPES):
             await invocation_channel.send(f"{user.mention} you already have a Word Pot game running: {ch.mention}", allowed_mentions=discord.AllowedMentions.none())
             return ch
         else:
@@ -1396,27 +3328,29 @@ async def casino_start_word_pot(invocation_channel: discord.TextChannel, user: d
     await change_balance(gid, uid, -1, announce_channel_id=ch.id)
 
     casino_games[_key(gid, ch.id, uid)] = {
-        "answer": random.choice(ANSWERS), "guesses": [], "max": 3, "legend": {}, "origin_cid": invocation_channel.id, "staked": 1
+        "answer": pick_answer(), "guesses": [], "max": 3, "legend": {}, "origin_cid": invocation_channel.id, "staked": 1
     }
     casino_channels[(gid, uid)] = ch.id
 
     pot = await get_casino_pot(gid)
-    board = render_board(casino_games[_key(gid, ch.id, uid)]["guesses"], total_rows=3)
-    await ch.send(
-        f"{user.mention} 🎰 **Word Pot** is live!\n"
-        f"• Entry: **1 {EMO_SHEKEL()}** (already paid)\n"
-        f"• Current Pot: **{pot} {EMO_SHEKEL()}** (resets to {CASINO_BASE_POT} on win)\n"
-        f"• You have **3 tries** — solve within 3 to **win the pot**.\n"
-        f"If you fail, your entry adds **+1** to the pot.",
+    game = casino_games[_key(gid, ch.id, uid)]
+    await live_board(game, ch).post(
+        board_embed(game, "🎰 Word Pot", status=f"Attempt **1/3** — solve within **3** to win **{pot} {EMO_SHEKEL()}**."),
+        content=(
+            f"{user.mention} 🎰 **Word Pot** is live!\n"
+            f"• Entry: **1 {EMO_SHEKEL()}** (already paid)\n"
+            f"• Current Pot: **{pot} {EMO_SHEKEL()}** (resets to {CASINO_BASE_POT} on win)\n"
+            f"• You have **3 tries** — solve within 3 to **win the pot**.\n"
+            f"If you fail, your entry adds **+1** to the pot."
+        ),
         allowed_mentions=discord.AllowedMentions(users=[user])
     )
-    await ch.send(board)
     return ch
 
 async def casino_guess(channel: discord.TextChannel, user: discord.Member, word: str):
     gid, cid, uid = channel.guild.id, channel.id, user.id
     game = casino_games.get(_key(gid, cid, uid))
-    if not game:
+    if not game or game.get("settled"):
         await safe_send(channel, f"{user.mention} no Word Pot game here. Start with `/worldle_casino`.",
                         allowed_mentions=discord.AllowedMentions.none())
         return
@@ -1432,13 +3366,13 @@ async def casino_guess(channel: discord.TextChannel, user: discord.Member, word:
         await safe_send(channel, "Out of tries! Start a new one with `/worldle_casino`.")
         return
 
-    colors = score_guess(cleaned, game["answer"])
-    game["guesses"].append({"word": cleaned, "colors": colors})
-    update_legend(game["legend"], cleaned, colors)
+    pattern = score_pattern(cleaned, game["answer"])
+    apply_guess(game, cleaned, pattern)
+    journal("casino", _key(gid, cid, uid), "guess", cleaned)
     attempt = len(game["guesses"])
 
     board = render_board(game["guesses"], total_rows=3)
-    await safe_send(channel, board)
+    live = live_board(game, channel)
 
     def _cleanup():
         casino_games.pop(_key(gid, cid, uid), None)
@@ -1447,19 +3381,25 @@ async def casino_guess(channel: discord.TextChannel, user: discord.Member, word:
 
     # WIN
     if cleaned == game["answer"]:
-        pot = await get_casino_pot(gid)
-        await change_balance(gid, uid, pot, announce_channel_id=cid)
-        bal_new = await get_balance(gid, uid)
+        game["settled"] = True
+        async def _pay(db):
+            # take the pot and reset it in the same transaction as the credit and the del
+            pot = await _tx_scalar(db, "SELECT pot FROM casino_pot WHERE guild_id=?", (gid,), CASINO_BASE_POT)
+            await db.execute("""
+              INSERT INTO casino_pot(guild_id, pot) VALUES(?,?)
+              ON CONFLICT(guild_id) DO UPDATE SET pot=excluded.pot""", (gid, CASINO_BASE_POT))
+            return pot, await tx_credit(db, gid, uid, pot)
+        pot, bal_new = await journal_settle("casino", _key(gid, cid, uid), _cleanup, _pay)
+        await _after_balance_change(gid, uid, cid, bal_new - pot, bal_new)
         ans = game["answer"].upper()
         origin_cid = game.get("origin_cid")
-        _cleanup()
-        await set_casino_pot(gid, CASINO_BASE_POT)
 
-        await safe_send(
-            channel,
-            f"🏆 {user.mention} solved **{ans}** on attempt **{attempt}** and **WON {pot} {EMO_SHEKEL()}**! "
-            f"Pot resets to **{CASINO_BASE_POT}**. (Balance: {bal_new})"
-        )
+        await live.settle(board_embed(
+            game, "🎰 Word Pot — WIN",
+            status=f"🏆 {user.mention} solved **{ans}** on attempt **{attempt}** and **WON {pot} {EMO_SHEKEL()}**! "
+                   f"Pot resets to **{CASINO_BASE_POT}**. (Balance: {bal_new})",
+            color=CARD_COLOR_SUCCESS,
+        ))
 
         emb = make_card(
             title="🎰 Word Pot — WIN",
@@ -1472,10 +3412,7 @@ async def casino_guess(channel: discord.TextChannel, user: discord.Member, word:
         )
         await _announce_result(channel.guild, origin_cid, content="", embed=emb)
 
-        try:
-            await channel.delete(reason="Word Pot finished (win)")
-        except Exception:
-            pass
+        await release_room(channel, reason="Word Pot finished (win)")
         return
 
     # FAIL (out of tries)
@@ -1491,11 +3428,12 @@ async def casino_guess(channel: discord.TextChannel, user: discord.Member, word:
         origin_cid = game.get("origin_cid")
         _cleanup()
 
-        await safe_send(
-            channel,
-            f"❌ Out of tries. The word was **{ans}** — {quip}{f'\\n📖 Definition: {definition}' if definition else ''}\n"
-            f"The pot increases to **{new_pot} {EMO_SHEKEL()}**."
-        )
+        await live.settle(board_embed(
+            game, "🎰 Word Pot — Failed",
+            status=f"❌ Out of tries. The word was **{ans}** — {quip}{f'\\n📖 Definition: {definition}' if definition else ''}\n"
+                   f"The pot increases to **{new_pot} {EMO_SHEKEL()}**.",
+            color=CARD_COLOR_FAIL,
+        ))
 
         fields = [("Board", board, False), ("Pot", f"Now **{new_pot} {EMO_SHEKEL()}**", True)]
         if definition:
@@ -1509,18 +3447,11 @@ async def casino_guess(channel: discord.TextChannel, user: discord.Member, word:
         )
         await _announce_result(channel.guild, origin_cid, content="", embed=emb)
 
-        try:
-            await channel.delete(reason="Word Pot finished (fail)")
-        except Exception:
-            pass
+        await release_room(channel, reason="Word Pot finished (fail)")
         return
 
-    # mid-game hint
-    legend = legend_overview(game["legend"], game["guesses"])
-    msg = f"Attempt **{attempt}/3** — solve within **3** to win the pot."
-    if legend:
-        msg += f"\n{legend}"
-    await safe_send(channel, msg)
+    # mid-game status
+    live.update(board_embed(game, "🎰 Word Pot", status=f"Attempt **{attempt}/3** — solve within **3** to win the pot."))
 
 
 
@@ -1622,6 +3553,7 @@ def build_help_pages(guild_name: str | None = None) -> list[discord.Embed]:
         "You get **5 solo games per day**."
     )
     emb.add_field(name="Start", value="• **`w`** or **/worldle**", inline=False)
+    emb.add_field(name="Quick (no room)", value="• **/worldle_quick** — play in a private pop-up, guesses via the **Guess** button", inline=False)
     emb.add_field(name="Guess", value="• **`g APPLE`** or **/worldle_guess word:APPLE**", inline=False)
     emb.add_field(
         name="Payouts",
@@ -1698,6 +3630,7 @@ def build_help_pages(guild_name: str | None = None) -> list[discord.Embed]:
     # 10) Admin / Setup
     emb = discord.Embed(title="Admin / Setup")
     emb.add_field(name="Solo Rooms Category", value="• **/worldle_set_category**", inline=False)
+    emb.add_field(name="Rooms as Threads", value="• **/worldle_set_rooms** (channels or private threads)", inline=False)
     emb.add_field(name="Announcements Channel", value="• **/worldle_set_announce**", inline=False)
     emb.add_field(name="Bounty Channel", value="• **/worldle_bounty_setchannel**", inline=False)
     emb.add_field(name="Resync Commands", value="• **/worldle_resync**", inline=False)
@@ -1715,8 +3648,32 @@ def build_help_pages(guild_name: str | None = None) -> list[discord.Embed]:
 
 # -------------------- GLOBALS --------------------
 
-# ---- Dailies panel state (place near other globals) ----
-dailies_msg_ids: set[int] = set()   # message IDs of active /dailies panels
+# ---- Reaction registry ----
+# message_id -> (kind, ctx, expires_ts) for every message whose reactions we act on.
+# on_raw_reaction_add resolves each event with one dict lookup; unrelated reactions stop there.
+REACTION_TTL_S = int(os.getenv("REACTION_TTL_HOURS", "24")) * 3600
+reaction_registry: dict[int, tuple[str, object, float]] = {}
+_reaction_sweep_at = 1024
+
+def register_reaction(message_id: int, kind: str, ctx=None, ttl_s: float = REACTION_TTL_S):
+    global _reaction_sweep_at
+    reaction_registry[message_id] = (kind, ctx, time.time() + ttl_s)
+    if len(reaction_registry) >= _reaction_sweep_at:
+        now = time.time()
+        for mid in [m for m, e in reaction_registry.items() if e[2] < now]:
+            del reaction_registry[mid]
+        _reaction_sweep_at = max(1024, 2 * len(reaction_registry))
+
+def unregister_reaction(message_id: Optional[int]):
+    if message_id:
+        reaction_registry.pop(message_id, None)
+
+def lookup_reaction(message_id: int) -> Optional[tuple[str, object, float]]:
+    entry = reaction_registry.get(message_id)
+    if entry and entry[2] < time.time():
+        del reaction_registry[message_id]
+        return None
+    return entry
 
 
 # -------------------- BOUNTY (hourly GMT + reaction gate; manual now uses gate too) --------------------
@@ -1859,111 +3816,9 @@ class DailiesView(discord.ui.View):
 
 
 
-async def dailies_reaction_listener(payload: discord.RawReactionActionEvent):
-    """Independent reaction handler for /dailies panels only."""
-    try:
-        if payload.user_id == (bot.user.id if bot.user else 0):
-            return
-        if payload.message_id not in dailies_msg_ids:
-            return
-
-        guild = discord.utils.get(bot.guilds, id=payload.guild_id)
-        if not guild:
-            return
-        try:
-            member = guild.get_member(payload.user_id) or await guild.fetch_member(payload.user_id)
-        except Exception:
-            return
-        if not member or member.bot or not await is_worldler(guild, member):
-            return
-
-        channel = guild.get_channel(payload.channel_id) if hasattr(payload, "channel_id") else None
-        if not isinstance(channel, discord.TextChannel):
-            # Fallback: try fetching via the message
-            try:
-                channel = await guild.fetch_channel(payload.channel_id)
-            except Exception:
-                return
-
-        emoji_name = payload.emoji.name
-
-        # React: 🧩 = Start Solo
-        if emoji_name == "🧩":
-            ch = await solo_start(channel, member)
-            if isinstance(ch, discord.TextChannel):
-                await safe_send(
-                    channel,
-                    f"🧩 {member.mention} your solo room is {ch.mention}.",
-                    allowed_mentions=discord.AllowedMentions(users=True, roles=False, everyone=False)
-                )
-
-        # React: 🛐 = Pray
-        elif emoji_name == "🛐":
-            gid, uid = guild.id, member.id
-            today = uk_today_str()
-            last_pray, _ = await _get_cd(gid, uid)
-            if last_pray == today:
-                await safe_send(channel, f"🛐 {member.mention} you already prayed today.", 
-                                allowed_mentions=discord.AllowedMentions(users=True, roles=False, everyone=False))
-            else:
-                await change_balance(gid, uid, 5, announce_channel_id=channel.id)
-                await _set_cd(gid, uid, "last_pray", today)
-                bal = await get_balance(gid, uid)
-                await safe_send(channel, f"🛐 {member.mention} +5 {EMO_SHEKEL()} — Balance **{bal}**",
-                                allowed_mentions=discord.AllowedMentions(users=True, roles=False, everyone=False))
-
-        # React: 🙇 = Beg
-        elif emoji_name == "🙇":
-            gid, uid = guild.id, member.id
-            today = uk_today_str()
-            _, last_beg = await _get_cd(gid, uid)
-            if last_beg == today:
-                await safe_send(channel, f"🙇 {member.mention} you already begged today.",
-                                allowed_mentions=discord.AllowedMentions(users=True, roles=False, everyone=False))
-            else:
-                await change_stones(gid, uid, 5)
-                await _set_cd(gid, uid, "last_beg", today)
-                stones = await get_stones(gid, uid)
-                await safe_send(channel, f"🙇 {member.mention} {EMO_STONE()} +5 Stones — You now have **{stones}**.",
-                                allowed_mentions=discord.AllowedMentions(users=True, roles=False, everyone=False))
-
-        # React: 🎰 = Word Pot
-        elif emoji_name == "🎰":
-            ch = await casino_start_word_pot(channel, member)
-            if isinstance(ch, discord.TextChannel):
-                await safe_send(
-                    channel,
-                    f"🎰 {member.mention} Word Pot room: {ch.mention}",
-                    allowed_mentions=discord.AllowedMentions(users=True, roles=False, everyone=False)
-                )
-
-        # Tidy up: remove the user’s reaction so others can easily use it too
-        try:
-            msg = await channel.fetch_message(payload.message_id)
-            await msg.remove_reaction(payload.emoji, member)
-        except Exception:
-            pass
-
-    except Exception as e:
-        log.warning(f"[dailies] reaction handler error: {e}")
-
-
-
-async def dailies_raw_reaction_add(payload: discord.RawReactionActionEvent):
-    """Independent reaction handler for /dailies panels only (and refresh the panel)."""
+async def dailies_raw_reaction_add(payload: discord.RawReactionActionEvent, guild: discord.Guild, ctx=None):
+    """Reaction shortcuts on a /dailies panel (and refresh the panel)."""
     try:
-        # Only handle reactions on dailies panels we sent
-        if payload.message_id not in dailies_msg_ids:
-            return
-
-        # Ignore the bot's own reactions
-        if bot.user and payload.user_id == bot.user.id:
-            return
-
-        guild = discord.utils.get(bot.guilds, id=payload.guild_id)
-        if not guild:
-            return
-
         try:
             member = guild.get_member(payload.user_id) or await guild.fetch_member(payload.user_id)
         except Exception:
@@ -2068,7 +3923,7 @@ async def dailies_cmd(inter: discord.Interaction):
     # (Optional) keep the reaction shortcuts you already had
     try:
         msg = await inter.original_response()
-        dailies_msg_ids.add(msg.id)
+        register_reaction(msg.id, "dailies")
         for emo in ("🧩", "🛐", "🙇", "🎰"):
             try:
                 await msg.add_reaction(emo)
@@ -2099,9 +3954,11 @@ def _bounty_emoji_matches(emoji: discord.PartialEmoji) -> bool:
         return emoji.name == "🎯"
     return (emoji.name or "").lower() == target_name
 
-async def _post_bounty_prompt(guild: discord.Guild, channel: discord.TextChannel, hour_idx: int):
+async def _post_bounty_prompt(guild: discord.Guild, channel: discord.TextChannel, hour_idx: int, *, priority: int = SEND_HIGH):
     if guild.id in pending_bounties or guild.id in bounty_games:
         return False
+    if not WORDS_READY:
+        return False
 
     cfg = await get_cfg(guild.id)
     suppress_ping = int(cfg.get("suppress_bounty_ping", 0)) == 1
@@ -2126,7 +3983,10 @@ async def _post_bounty_prompt(guild: discord.Guild, channel: discord.TextChannel
         content=role_mention or None,
         embed=emb,
         allowed_mentions=discord.AllowedMentions(users=False, roles=(not suppress_ping), everyone=False),
+        priority=priority,
     )
+    if msg is None:
+        return False
 
     try:
         await msg.add_reaction(em)
@@ -2141,6 +4001,9 @@ async def _post_bounty_prompt(guild: discord.Guild, channel: discord.TextChannel
         "hour_idx": hour_idx,
         "expires_at": gmt_now_s() + BOUNTY_EXPIRE_S,
     }
+    register_reaction(msg.id, "bounty", guild.id, ttl_s=BOUNTY_EXPIRE_S + 300)
+    journal_put("pending_bounty", guild.id, pending_bounties[guild.id])
+    timers.schedule(("bounty_prompt", guild.id), pending_bounties[guild.id]["expires_at"], _bounty_prompt_expired, guild.id)
     await set_cfg(guild.id, last_bounty_hour=hour_idx)
     return True
 
@@ -2152,13 +4015,14 @@ async def _post_bounty_prompt(guild: discord.Guild, channel: discord.TextChannel
 async def _start_bounty_after_gate(guild: discord.Guild, channel_id: int):
     if guild.id in bounty_games:
         return
-    answer = random.choice(ANSWERS)
+    answer = pick_answer()
     bounty_games[guild.id] = {
         "answer": answer,
         "channel_id": channel_id,
         "started_at": gmt_now_s(),
         "expires_at": gmt_now_s() + BOUNTY_EXPIRE_S,
     }
+    timers.schedule(("bounty_expire", guild.id), bounty_games[guild.id]["expires_at"], _bounty_expired, guild.id)
     await set_cfg(guild.id, last_bounty_ts=gmt_now_s(), suppress_bounty_ping=0)  # re-enable pings
     ch = guild.get_channel(channel_id)
     if isinstance(ch, discord.TextChannel):
@@ -2232,7 +4096,7 @@ async def worldle_bounty_guess(inter: discord.Interaction, word: str):
     # Start cooldown now that we accepted a valid guess
     last_bounty_guess_ts[key] = now_s
 
-    colors = score_guess(cleaned, game["answer"])
+    colors = pattern_colors(score_pattern(cleaned, game["answer"]))
     row = render_row(cleaned, colors)
 
     # live feedback in the bounty channel
@@ -2240,14 +4104,23 @@ async def worldle_bounty_guess(inter: discord.Interaction, word: str):
 
     if cleaned == game["answer"]:
         gid, uid = inter.guild.id, inter.user.id
-        await change_balance(gid, uid, BOUNTY_PAYOUT, announce_channel_id=game["channel_id"])
-        await inc_stat(gid, uid, "bounties_won", 1)
-        bal = await get_balance(gid, uid)
+        # claim it: another correct guess (or the expiry) may have landed while we replied
+        if bounty_games.get(gid) is not game or game.get("settled"):
+            return await inter.followup.send("Too late — this bounty is already over.")
+        game["settled"] = True
+
+        def _finish():
+            bounty_games.pop(gid, None)
+            timers.cancel(("bounty_expire", gid))
+
+        async def _pay(db):
+            await tx_inc_stat(db, gid, uid, "bounties_won", 1)
+            return await tx_credit(db, gid, uid, BOUNTY_PAYOUT)
+        bal = await journal_settle("bounty", gid, _finish, _pay)
+        await _after_balance_change(gid, uid, game["channel_id"], bal - BOUNTY_PAYOUT, bal)
 
-        # capture & clear
         ans_raw = game["answer"]
         ans_up = ans_raw.upper()
-        del bounty_games[gid]
 
         # small confirmation in-channel
         await inter.followup.send(
@@ -2276,257 +4149,362 @@ async def worldle_bounty_guess(inter: discord.Interaction, word: str):
 
 
 
-@tasks.loop(seconds=20)
-async def bounty_loop():
-    now = gmt_now_s()
-    hour_idx = current_hour_index_gmt()
-    within_window = (now % 3600) < 40
-
-    # 1) Expire pending (not armed) prompts
-    for gid, pend in list(pending_bounties.items()):
-        try:
-            if now >= pend.get("expires_at", 0):
-                pending_bounties.pop(gid, None)
-                guild = discord.utils.get(bot.guilds, id=gid)
-                if not guild:
-                    continue
-                ch = guild.get_channel(pend["channel_id"])
-
-                # Suppress next-hour bounty ping
-                try:
-                    await set_cfg(guild.id, suppress_bounty_ping=1)
-                except Exception:
-                    pass
+# Deadlines on `timers`: ("bounty_prompt", gid) prompt expiry, ("bounty_arm", gid) arm countdown,
+# ("bounty_expire", gid) armed bounty expiry, ("bounty_hour", gid) next hourly prompt.
+async def _bounty_prompt_expired(gid: int):
+    pend = pending_bounties.get(gid)
+    if not pend or gmt_now_s() < pend.get("expires_at", 0):
+        return
+    pending_bounties.pop(gid, None)
+    journal_del("pending_bounty", gid)
+    unregister_reaction(pend["message_id"])
+    timers.cancel(("bounty_arm", gid))
+    guild = bot.get_guild(gid)
+    if not guild:
+        return
+    ch = guild.get_channel(pend["channel_id"])
 
-                # +1 to Word Pot
-                pot = await get_casino_pot(gid)
-                new_pot = pot + 1
-                await set_casino_pot(gid, new_pot)
+    # Suppress next-hour bounty ping
+    try:
+        await set_cfg(guild.id, suppress_bounty_ping=1)
+    except Exception:
+        pass
 
-                if isinstance(ch, discord.TextChannel):
-                    emb = make_panel(
-                        title="⏲️ Bounty prompt expired",
-                        description=f"+1 {EMO_SHEKEL()} to **Word Pot** (now **{new_pot}**).",
-                    )
-                    try:
-                        msg = await ch.fetch_message(pend["message_id"])
-                        await msg.reply(embed=emb)
-                    except Exception:
-                        await safe_send(ch, embed=emb)
-        except Exception as e:
-            log.warning(f"bounty_loop pending expiry error (guild {gid}): {e}")
+    # +1 to Word Pot
+    pot = await get_casino_pot(gid)
+    new_pot = pot + 1
+    await set_casino_pot(gid, new_pot)
 
-    # 1.5) NEW: Arm any prompts whose countdown finished
-    for gid, pend in list(pending_bounties.items()):
+    if isinstance(ch, discord.TextChannel):
+        emb = make_panel(
+            title="⏲️ Bounty prompt expired",
+            description=f"+1 {EMO_SHEKEL()} to **Word Pot** (now **{new_pot}**).",
+        )
         try:
-            arm_at = pend.get("arming_at")
-            if arm_at and now >= arm_at and len(pend.get("users", set())) >= 2:
-                guild = discord.utils.get(bot.guilds, id=gid)
-                if not guild:
-                    continue
-                ch = guild.get_channel(pend["channel_id"])
-                if isinstance(ch, discord.TextChannel):
-                    try:
-                        msg = await ch.fetch_message(pend["message_id"])
-                        await msg.reply("🔔 **Arming now!**")
-                    except Exception:
-                        await safe_send(ch, "🔔 **Arming now!**")
-
-                channel_id = pend["channel_id"]
-                pending_bounties.pop(gid, None)
-                await _start_bounty_after_gate(guild, channel_id)
-        except Exception as e:
-            log.warning(f"bounty_loop arming error (guild {gid}): {e}")
+            msg = await ch.fetch_message(pend["message_id"])
+            await msg.reply(embed=emb)
+        except Exception:
+            await safe_send(ch, embed=emb)
 
-    # 2) Expire ARMED bounties
-    for gid, game in list(bounty_games.items()):
+async def _bounty_arm_due(gid: int):
+    """Arm a prompt whose countdown finished."""
+    pend = pending_bounties.get(gid)
+    arm_at = pend.get("arming_at") if pend else None
+    if not arm_at or gmt_now_s() < arm_at or len(pend.get("users", set())) < 2:
+        return
+    guild = bot.get_guild(gid)
+    if not guild:
+        return
+    ch = guild.get_channel(pend["channel_id"])
+    if isinstance(ch, discord.TextChannel):
         try:
-            if now >= game.get("expires_at", 0):
-                bounty_games.pop(gid, None)
-                guild = discord.utils.get(bot.guilds, id=gid)
-                if not guild:
-                    continue
-                ch = guild.get_channel(game["channel_id"])
+            msg = await ch.fetch_message(pend["message_id"])
+            await msg.reply("🔔 **Arming now!**")
+        except Exception:
+            await safe_send(ch, "🔔 **Arming now!**")
+
+    channel_id = pend["channel_id"]
+    pending_bounties.pop(gid, None)
+    journal_del("pending_bounty", gid)
+    unregister_reaction(pend["message_id"])
+    timers.cancel(("bounty_prompt", gid))
+    await _start_bounty_after_gate(guild, channel_id)
+
+async def _bounty_expired(gid: int):
+    """Expire an ARMED bounty nobody solved."""
+    game = bounty_games.get(gid)
+    if not game or game.get("settled") or gmt_now_s() < game.get("expires_at", 0):
+        return
+    bounty_games.pop(gid, None)
+    guild = bot.get_guild(gid)
+    if not guild:
+        return
+    ch = guild.get_channel(game["channel_id"])
 
-                # Suppress next-hour ping
-                try:
-                    await set_cfg(guild.id, suppress_bounty_ping=1)
-                except Exception:
-                    pass
+    # Suppress next-hour ping
+    try:
+        await set_cfg(guild.id, suppress_bounty_ping=1)
+    except Exception:
+        pass
 
-                # +1 to Word Pot
-                pot = await get_casino_pot(gid)
-                new_pot = pot + 1
-                await set_casino_pot(gid, new_pot)
+    # +1 to Word Pot
+    pot = await get_casino_pot(gid)
+    new_pot = pot + 1
+    await set_casino_pot(gid, new_pot)
 
-                if isinstance(ch, discord.TextChannel):
-                    emb = make_panel(
-                        title="⏲️ Bounty expired",
-                        description=(
-                            f"No solve in **{BOUNTY_EXPIRE_MIN} minutes**.\n"
-                            f"+1 {EMO_SHEKEL()} to **Word Pot** (now **{new_pot}**)."
-                        ),
-                    )
-                    await safe_send(ch, embed=emb)
-        except Exception as e:
-            log.warning(f"bounty_loop active expiry error (guild {gid}): {e}")
+    if isinstance(ch, discord.TextChannel):
+        emb = make_panel(
+            title="⏲️ Bounty expired",
+            description=(
+                f"No solve in **{BOUNTY_EXPIRE_MIN} minutes**.\n"
+                f"+1 {EMO_SHEKEL()} to **Word Pot** (now **{new_pot}**)."
+            ),
+        )
+        await safe_send(ch, embed=emb)
 
-    # 3) Drop a NEW bounty prompt this hour
-    for guild in bot.guilds:
-        try:
-            if guild.id in bounty_games or guild.id in pending_bounties:
-                continue
-            cfg = await get_cfg(guild.id)
-            if cfg.get("last_bounty_hour", 0) == hour_idx:
-                continue
-            if not within_window:
-                continue
-            ch = await _find_bounty_channel(guild)
-            if not ch:
-                continue
-            await _post_bounty_prompt(guild, ch, hour_idx)
-        except Exception as e:
-            log.warning(f"bounty loop error {guild.id}: {e}")
+# ---- hourly fan-out ----
+# Each guild posts at a fixed offset into the hour (crc32 of its id, so it survives restarts),
+# spreading prompts over BOUNTY_FANOUT_WINDOW_S instead of bursting at :00. A small worker pool
+# does the posting at NORMAL send priority so gameplay replies keep going out first.
+BOUNTY_FANOUT_WINDOW_S = max(1, min(3000, int(os.getenv("BOUNTY_FANOUT_WINDOW_S", "600"))))
+BOUNTY_FANOUT_CONCURRENCY = max(1, int(os.getenv("BOUNTY_FANOUT_CONCURRENCY", "3")))
+
+def bounty_offset_s(guild_id: int) -> int:
+    return zlib.crc32(str(guild_id).encode()) % BOUNTY_FANOUT_WINDOW_S
 
+def schedule_bounty_hour(guild_id: int):
+    """Queue this guild's next hourly prompt (this hour if its slot is still ahead)."""
+    hour_idx = current_hour_index_gmt()
+    when = hour_idx * 3600 + bounty_offset_s(guild_id)
+    if when <= gmt_now_s():
+        when += 3600
+    timers.schedule(("bounty_hour", guild_id), when, _bounty_hour_due, guild_id)
+
+async def _bounty_hour_due(gid: int):
+    timers.schedule(("bounty_hour", gid), (current_hour_index_gmt() + 1) * 3600 + bounty_offset_s(gid), _bounty_hour_due, gid)
+    bounty_fanout.submit(gid, current_hour_index_gmt())
+
+async def _bounty_hour_post(gid: int, hour_idx: int) -> bool:
+    """Drop a NEW bounty prompt this hour."""
+    guild = bot.get_guild(gid)
+    if not guild or guild.id in bounty_games or guild.id in pending_bounties:
+        return False
+    if hour_idx != current_hour_index_gmt():
+        return False   # backlog ran past the hour; the next slot covers it
+    cfg = await get_cfg(guild.id)
+    if cfg.get("last_bounty_hour", 0) == hour_idx:
+        return False
+    ch = await _find_bounty_channel(guild)
+    if not ch:
+        return False
+    bounty_fanout.inflight[ch.id] = hour_idx
+    try:
+        return await _post_bounty_prompt(guild, ch, hour_idx, priority=SEND_NORMAL)
+    finally:
+        bounty_fanout.inflight.pop(ch.id, None)
+
+class BountyFanout:
+    """Bounded-concurrency worker for hourly prompts, with a per-hour duration / 429 report.
+    429s are counted only on channels with a prompt in flight; global 429s are process-wide."""
+
+    def __init__(self, concurrency: int):
+        self.concurrency = concurrency
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.hours: dict[int, dict] = {}
+        self._workers: list[asyncio.Task] = []
+        self.inflight: dict[int, int] = {}   # channel id -> hour of the prompt being posted there
+        self.last_report = ""
+
+    def note_rate_limit(self, channel_id: int):
+        h = self.hours.get(self.inflight.get(channel_id, -1))
+        if h is not None:
+            h["429"] += 1
+
+    def submit(self, gid: int, hour_idx: int):
+        h = self.hours.get(hour_idx)
+        if h is None:
+            h = self.hours[hour_idx] = {
+                "queued": 0, "done": 0, "posted": 0, "errors": 0, "max_wait_s": 0.0, "last_done": 0.0,
+                "429": 0, "global_429": send_scheduler.stats["global_429"],
+            }
+            timers.schedule(("bounty_fanout_report", hour_idx), hour_idx * 3600 + BOUNTY_FANOUT_WINDOW_S + 60,
+                            self.report, hour_idx)
+        h["queued"] += 1
+        self.queue.put_nowait((gid, hour_idx, time.time()))
+        self._workers = [w for w in self._workers if not w.done()]
+        while len(self._workers) < self.concurrency:
+            self._workers.append(asyncio.create_task(self._worker()))
+
+    async def _worker(self):
+        while True:
+            gid, hour_idx, queued_at = await self.queue.get()
+            h = self.hours.get(hour_idx, {"done": 0, "posted": 0, "errors": 0, "max_wait_s": 0.0})
+            h["max_wait_s"] = max(h["max_wait_s"], time.time() - queued_at)
+            try:
+                if await _bounty_hour_post(gid, hour_idx):
+                    h["posted"] += 1
+            except Exception as e:
+                h["errors"] += 1
+                log.warning(f"[bounty] hourly prompt failed (guild {gid}): {e}")
+            finally:
+                h["done"] += 1
+                h["last_done"] = time.time()
+                self.queue.task_done()
+
+    async def report(self, hour_idx: int):
+        h = self.hours.get(hour_idx)
+        if not h:
+            return
+        if h["done"] < h["queued"]:
+            timers.schedule(("bounty_fanout_report", hour_idx), time.time() + 30, self.report, hour_idx)
+            return
+        self.hours.pop(hour_idx, None)
+        self.last_report = (
+            f"hour {hour_idx}: {h['posted']}/{h['queued']} prompts posted, {h['errors']} errors, "
+            f"finished {h['last_done'] - hour_idx * 3600:.0f}s into the hour, max queue wait {h['max_wait_s']:.1f}s, "
+            f"{h['429']} 429s on prompt posts, {send_scheduler.stats['global_429'] - h['global_429']} process-wide global 429s"
+        )
+        log.info(f"[bounty] fan-out {self.last_report}")
 
+bounty_fanout = BountyFanout(BOUNTY_FANOUT_CONCURRENCY)
 
+# -------------------- Reactions: bounty + dungeon (FULL) --------------------
+async def _react_bounty(payload: discord.RawReactionActionEvent, guild: discord.Guild, gid: int):
+    pend = pending_bounties.get(gid)
+    if not pend or payload.message_id != pend["message_id"] or not _bounty_emoji_matches(payload.emoji):
+        return
+    try:
+        member = guild.get_member(payload.user_id) or await guild.fetch_member(payload.user_id)
+    except Exception:
+        member = None
+    if member and not member.bot and await is_worldler(guild, member):
+        pend["users"].add(member.id)
+        journal_put("pending_bounty", gid, pend)
+        if len(pend["users"]) >= 2 and not pend.get("arming_at"):
+            pend["arming_at"] = gmt_now_s() + BOUNTY_ARM_DELAY_S
+            timers.schedule(("bounty_arm", gid), pend["arming_at"], _bounty_arm_due, gid)
+            journal_put("pending_bounty", gid, pend)
+            ch = guild.get_channel(pend["channel_id"])
+            try:
+                if isinstance(ch, discord.TextChannel):
+                    msg = await ch.fetch_message(pend["message_id"])
+                    names = []
+                    for uid in list(pend["users"])[:2]:
+                        m = guild.get_member(uid) or await guild.fetch_member(uid)
+                        names.append(m.mention if m else f"<@{uid}>")
+                    await msg.reply(f"✅ Bounty joined by {', '.join(names)} — arming in **{BOUNTY_ARM_DELAY_S}s**.")
+            except Exception:
+                pass
 
+async def _react_dungeon_gate(payload: discord.RawReactionActionEvent, guild: discord.Guild, gate: dict):
+    if not _dungeon_join_emoji_matches(payload.emoji):
+        return
+    try:
+        member = guild.get_member(payload.user_id) or await guild.fetch_member(payload.user_id)
+    except Exception:
+        member = None
+    if member and (not member.bot) and await is_worldler(guild, member):
+        gate["participants"].add(member.id)
+        journal_put("gate", payload.message_id, gate)
+        dch = get_room(guild, gate["dungeon_channel_id"])
+        if isinstance(dch, GAME_ROOM_TYPES):
+            try:
+                if isinstance(dch, discord.Thread):
+                    await dch.add_user(member)
+                else:
+                    await dch.set_permissions(member, view_channel=True, send_messages=True, read_message_history=True)
+                g = dungeon_games.get(dch.id)
+                if g:
+                    g["participants"].add(member.id)
+                    journal_put("dungeon", dch.id, g)
+                gmsg_id = g.get("welcome_msg_id") if g else None
+                if gmsg_id:
+                    msg = await dch.fetch_message(gmsg_id)
+                    names = []
+                    for uid in sorted(g["participants"]):
+                        try:
+                            mm = guild.get_member(uid) or await guild.fetch_member(uid)
+                            names.append(mm.mention if mm else f"<@{uid}>")
+                        except Exception:
+                            names.append(f"<@{uid}>")
+                    await msg.edit(content="🌀 **Dungeon — Tier {}**\nParticipants: {}\n\nWhen ready, the **owner** clicks 🔒 to start."
+                                   .format(g["tier"], ", ".join(names)))
+            except Exception:
+                pass
+        try:
+            gate_ch = guild.get_channel(gate["gate_channel_id"])
+            if isinstance(gate_ch, discord.TextChannel):
+                m = guild.get_member(payload.user_id) or await guild.fetch_member(payload.user_id)
+                await safe_send(gate_ch, f"{EMO_DUNGEON()} {m.mention} **joined the dungeon**.",
+                                allowed_mentions=discord.AllowedMentions(users=True, roles=False, everyone=False),
+                                priority=SEND_LOW, wait=False)
+        except Exception:
+            pass
 
+async def _react_dungeon_lock(payload: discord.RawReactionActionEvent, guild: discord.Guild, ch_id: int):
+    """Owner locks 🔒 on the welcome message to start."""
+    game = dungeon_games.get(ch_id)
+    if not game or payload.message_id != game.get("welcome_msg_id") or not _lock_emoji_matches(payload.emoji):
+        return
+    if payload.user_id != game.get("owner_id"):
+        return
+    unregister_reaction(payload.message_id)
+    mid = game.get("gate_msg_id")
+    if mid in pending_dungeon_gates_by_msg:
+        pending_dungeon_gates_by_msg.pop(mid, None)
+        journal_del("gate", mid)
+    unregister_reaction(mid)
+    ch = get_room(guild, ch_id)
+    if isinstance(ch, GAME_ROOM_TYPES):
+        # In-room notice
+        await ch.send("🔒 **Gate closed.** No further joins. The dungeon begins!")
+        # NEW: public announcement in the configured announcements channel
+        try:
+            await _announce_result(
+                guild,
+                game.get("origin_cid"),
+                f"{EMO_DUNGEON()} **Dungeon gate closed** — Tier {game.get('tier')} has **started** in {ch.mention}. Good luck, adventurers!"
+            )
+        except Exception:
+            pass
+    await _dungeon_start_round(game)
 
-@bounty_loop.before_loop
-async def _before_bounty_loop():
-    await bot.wait_until_ready()
+async def _react_dungeon_decision(payload: discord.RawReactionActionEvent, guild: discord.Guild, ch_id: int):
+    """Owner decision (⏩ continue / 💰 cash out)."""
+    game = dungeon_games.get(ch_id)
+    if not game or payload.message_id != game.get("decision_msg_id") or game.get("state") != "await_decision":
+        return
+    if payload.user_id != game.get("owner_id"):
+        return
+    ch = get_room(guild, ch_id)
+    if _continue_emoji_matches(payload.emoji):
+        unregister_reaction(payload.message_id)
+        game["decision_msg_id"] = None
+        if isinstance(ch, GAME_ROOM_TYPES):
+            await ch.send("⏩ **Continuing…**")
+        await _dungeon_start_round(game)
+        return
+    if _cashout_emoji_matches(payload.emoji):
+        pool = max(0, game.get("pool", 0))
+        await _dungeon_settle_and_close(game, pool, note="💰 **Cashed out in time.**")
+
+REACTION_HANDLERS = {
+    "dailies": dailies_raw_reaction_add,
+    "bounty": _react_bounty,
+    "dungeon_gate": _react_dungeon_gate,
+    "dungeon_lock": _react_dungeon_lock,
+    "dungeon_decision": _react_dungeon_decision,
+}
 
-# -------------------- Reactions: bounty + dungeon (FULL) --------------------
 @bot.event
 async def on_raw_reaction_add(payload: discord.RawReactionActionEvent):
-    gid = payload.guild_id
-    if gid is None or (bot.user and payload.user_id == bot.user.id):
+    entry = lookup_reaction(payload.message_id)
+    if entry is None or payload.guild_id is None or (bot.user and payload.user_id == bot.user.id):
         return
-    guild = discord.utils.get(bot.guilds, id=gid)
+    guild = bot.get_guild(payload.guild_id)
     if not guild:
         return
-
-    # --- DAILIES PANEL HOOK (safe early exit if not a /dailies message) ---
+    kind, ctx, _ = entry
     try:
-        await dailies_raw_reaction_add(payload)
+        await REACTION_HANDLERS[kind](payload, guild, ctx)
     except Exception as e:
-        log.warning(f"[dailies] reaction proxy error: {e}")
-    # ----------------------------------------------------------------------
-
-    # ---------- BOUNTY (existing gate) ----------
-    pend = pending_bounties.get(gid)
-    if pend and payload.message_id == pend["message_id"] and _bounty_emoji_matches(payload.emoji):
-        try:
-            member = guild.get_member(payload.user_id) or await guild.fetch_member(payload.user_id)
-        except Exception:
-            member = None
-        if member and not member.bot and await is_worldler(guild, member):
-            pend["users"].add(member.id)
-            if len(pend["users"]) >= 2:
-                channel_id = pend["channel_id"]
-                ch = guild.get_channel(channel_id)
-                try:
-                    if isinstance(ch, discord.TextChannel):
-                        msg = await ch.fetch_message(pend["message_id"])
-                        names = []
-                        for uid in list(pend["users"])[:2]:
-                            m = guild.get_member(uid) or await guild.fetch_member(uid)
-                            names.append(m.mention if m else f"<@{uid}>")
-                        await msg.reply(f"✅ Bounty armed by {', '.join(names)}. Good luck!")
-                except Exception:
-                    pass
-                pending_bounties.pop(gid, None)
-                await _start_bounty_after_gate(guild, channel_id)
-        return
-
-    # ---------- DUNGEON: join gate ----------
-    gate = pending_dungeon_gates_by_msg.get(payload.message_id)
-    if gate and _dungeon_join_emoji_matches(payload.emoji):
-        try:
-            member = guild.get_member(payload.user_id) or await guild.fetch_member(payload.user_id)
-        except Exception:
-            member = None
-        if member and (not member.bot) and await is_worldler(guild, member):
-            gate["participants"].add(member.id)
-            dch = guild.get_channel(gate["dungeon_channel_id"])
-            if isinstance(dch, discord.TextChannel):
-                try:
-                    await dch.set_permissions(member, view_channel=True, send_messages=True, read_message_history=True)
-                    g = dungeon_games.get(dch.id)
-                    if g:
-                        g["participants"].add(member.id)
-                    gmsg_id = g.get("welcome_msg_id") if g else None
-                    if gmsg_id:
-                        msg = await dch.fetch_message(gmsg_id)
-                        names = []
-                        for uid in sorted(g["participants"]):
-                            try:
-                                mm = guild.get_member(uid) or await guild.fetch_member(uid)
-                                names.append(mm.mention if mm else f"<@{uid}>")
-                            except Exception:
-                                names.append(f"<@{uid}>")
-                        await msg.edit(content="🌀 **Dungeon — Tier {}**\nParticipants: {}\n\nWhen ready, the **owner** clicks 🔒 to start."
-                                       .format(g["tier"], ", ".join(names)))
-                except Exception:
-                    pass
-            try:
-                gate_ch = guild.get_channel(gate["gate_channel_id"])
-                if isinstance(gate_ch, discord.TextChannel):
-                    m = guild.get_member(payload.user_id) or await guild.fetch_member(payload.user_id)
-                    await gate_ch.send(f"{EMO_DUNGEON()} {m.mention} **joined the dungeon**.", allowed_mentions=discord.AllowedMentions(users=True, roles=False, everyone=False))
-            except Exception:
-                pass
-        return
-
-    # ---------- DUNGEON: owner locks 🔒 to start ----------
-    for ch_id, game in list(dungeon_games.items()):
-        if payload.message_id == game.get("welcome_msg_id") and _lock_emoji_matches(payload.emoji):
-            if payload.user_id != game.get("owner_id"):
-                return
-            mid = game.get("gate_msg_id")
-            if mid in pending_dungeon_gates_by_msg:
-                pending_dungeon_gates_by_msg.pop(mid, None)
-            ch = guild.get_channel(ch_id)
-            if isinstance(ch, discord.TextChannel):
-                # In-room notice
-                await ch.send("🔒 **Gate closed.** No further joins. The dungeon begins!")
-                # NEW: public announcement in the configured announcements channel
-                try:
-                    await _announce_result(
-                        guild,
-                        game.get("origin_cid"),
-                        f"{EMO_DUNGEON()} **Dungeon gate closed** — Tier {game.get('tier')} has **started** in {ch.mention}. Good luck, adventurers!"
-                    )
-                except Exception:
-                    pass
-            await _dungeon_start_round(game)
-            return
-
-    # ---------- DUNGEON: owner decision (⏩ continue / 💰 cash out) ----------
-    for ch_id, game in list(dungeon_games.items()):
-        if payload.message_id == game.get("decision_msg_id") and game.get("state") == "await_decision":
-            if payload.user_id != game.get("owner_id"):
-                return
-            ch = guild.get_channel(ch_id)
-            if _continue_emoji_matches(payload.emoji):
-                game["decision_msg_id"] = None
-                if isinstance(ch, discord.TextChannel):
-                    await ch.send("⏩ **Continuing…**")
-                await _dungeon_start_round(game)
-                return
-            if _cashout_emoji_matches(payload.emoji):
-                pool = max(0, game.get("pool", 0))
-                await _dungeon_settle_and_close(game, pool, note="💰 **Cashed out in time.**")
-                return
-
-
+        log.warning(f"[reactions] {kind} handler error: {e}")
 
+@bot.event
+async def on_raw_message_delete(payload: discord.RawMessageDeleteEvent):
+    unregister_reaction(payload.message_id)
 
+@bot.event
+async def on_raw_bulk_message_delete(payload: discord.RawBulkMessageDeleteEvent):
+    for mid in payload.message_ids:
+        unregister_reaction(mid)
 
 @bot.event
 async def on_raw_reaction_remove(payload: discord.RawReactionActionEvent):
     """Opt-out: removing the 🎯 reaction before arming removes you from the pending pool."""
+    entry = lookup_reaction(payload.message_id)
+    if entry is None or entry[0] != "bounty":
+        return
     gid = payload.guild_id
     if gid is None:
         return
@@ -2540,10 +4518,13 @@ async def on_raw_reaction_remove(payload: discord.RawReactionActionEvent):
     uid = payload.user_id
     if uid and uid in pend.get("users", set()):
         pend["users"].discard(uid)
+        journal_put("pending_bounty", gid, pend)
 
         # NEW: if countdown was running but we dropped below 2, cancel it
         if pend.get("arming_at") and len(pend["users"]) < 2:
             pend["arming_at"] = None
+            timers.cancel(("bounty_arm", gid))
+            journal_put("pending_bounty", gid, pend)
             try:
                 guild = discord.utils.get(bot.guilds, id=gid)
                 ch = guild.get_channel(pend["channel_id"])
@@ -2581,8 +4562,7 @@ async def on_raw_reaction_remove(payload: discord.RawReactionActionEvent):
 EMO_DUNGEON_NAME = os.getenv("WW_DUNGEON_NAME", "ww_dungeon")
 
 def EMO_DUNGEON() -> str:
-    e = discord.utils.find(lambda em: em.name.lower() == EMO_DUNGEON_NAME.lower(), bot.emojis)
-    return str(e) if e else "🌀"  # fallback
+    return get_named_emoji(EMO_DUNGEON_NAME) or "🌀"  # fallback
 
 def _dungeon_join_emoji_matches(emoji: discord.PartialEmoji) -> bool:
     if emoji.is_unicode_emoji():
@@ -2606,11 +4586,10 @@ async def get_dungeon_tickets_t1(gid: int, uid: int) -> int:
     return row[0] if row else 0
 
 async def change_dungeon_tickets_t1(gid: int, uid: int, delta: int):
-    await bot.db.execute("""
+    await db_write("""
       INSERT INTO inv(guild_id,user_id,dungeon_tickets_t1) VALUES(?,?,?)
       ON CONFLICT(guild_id,user_id) DO UPDATE SET dungeon_tickets_t1=inv.dungeon_tickets_t1+excluded.dungeon_tickets_t1
     """, (gid, uid, delta))
-    await bot.db.commit()
 
 async def get_dungeon_tickets_t2(gid: int, uid: int) -> int:
     async with bot.db.execute("SELECT dungeon_tickets_t2 FROM inv WHERE guild_id=? AND user_id=?", (gid, uid)) as cur:
@@ -2618,11 +4597,10 @@ async def get_dungeon_tickets_t2(gid: int, uid: int) -> int:
     return row[0] if row else 0
 
 async def change_dungeon_tickets_t2(gid: int, uid: int, delta: int):
-    await bot.db.execute("""
+    await db_write("""
       INSERT INTO inv(guild_id,user_id,dungeon_tickets_t2) VALUES(?,?,?)
       ON CONFLICT(guild_id,user_id) DO UPDATE SET dungeon_tickets_t2=inv.dungeon_tickets_t2+excluded.dungeon_tickets_t2
     """, (gid, uid, delta))
-    await bot.db.commit()
 
 async def get_dungeon_tickets_t3(gid: int, uid: int) -> int:
     async with bot.db.execute("SELECT dungeon_tickets_t3 FROM inv WHERE guild_id=? AND user_id=?", (gid, uid)) as cur:
@@ -2630,14 +4608,13 @@ async def get_dungeon_tickets_t3(gid: int, uid: int) -> int:
     return row[0] if row else 0
 
 async def change_dungeon_tickets_t3(gid: int, uid: int, delta: int):
-    await bot.db.execute("""
+    await db_write("""
       INSERT INTO inv(guild_id,user_id,dungeon_tickets_t3) VALUES(?,?,?)
       ON CONFLICT(guild_id,user_id) DO UPDATE SET dungeon_tickets_t3=inv.dungeon_tickets_t3+excluded.dungeon_tickets_t3
     """, (gid, uid, delta))
-    await bot.db.commit()
 
 # -------------------- DUNGEON channel factory --------------------
-async def _make_dungeon_channel(invocation_channel: discord.TextChannel, owner: discord.Member) -> Optional[discord.TextChannel]:
+async def _make_dungeon_channel(invocation_channel: discord.TextChannel, owner: discord.Member) -> Optional["discord.TextChannel | discord.Thread"]:
     guild = invocation_channel.guild
     me = guild.me
     if not me or not me.guild_permissions.manage_channels:
@@ -2652,21 +4629,26 @@ async def _make_dungeon_channel(invocation_channel: discord.TextChannel, owner:
     if category and not isinstance(category, discord.CategoryChannel):
         category = None
 
+    overwrites = {
+        **_idle_room_overwrites(guild),
+        owner: discord.PermissionOverwrite(view_channel=True, send_messages=True, read_message_history=True, mention_everyone=False),
+    }
+    if worldler_role:
+        overwrites[worldler_role] = discord.PermissionOverwrite(view_channel=True, send_messages=False, read_message_history=True, mention_everyone=False)
     base = re.sub(r"[^a-zA-Z0-9]+", "-", owner.display_name).strip("-").lower() or f"user-{owner.id}"
     base = f"{base}-dungeon"
+    if cfg.get("room_backend") == "thread":
+        room = await _make_thread_room(guild, cfg, owner, base, reason="Wordle Dungeon")
+    else:
+        room = await take_room(guild, overwrites, reason="Wordle Dungeon")
+    if room:
+        return room
+
     name = base
     i = 2
     while discord.utils.get(guild.text_channels, name=name):
         name = f"{base}-{i}"; i += 1
 
-    overwrites = {
-        guild.default_role: discord.PermissionOverwrite(view_channel=False, mention_everyone=False),
-        owner: discord.PermissionOverwrite(view_channel=True, send_messages=True, read_message_history=True, mention_everyone=False),
-        me: discord.PermissionOverwrite(view_channel=True, send_messages=True, read_message_history=True, manage_channels=True, mention_everyone=False),
-    }
-    if worldler_role:
-        overwrites[worldler_role] = discord.PermissionOverwrite(view_channel=True, send_messages=False, read_message_history=True, mention_everyone=False)
-
     ch = await guild.create_text_channel(name=name, overwrites=overwrites, category=category, reason="Wordle Dungeon")
     return ch
 
@@ -2679,7 +4661,7 @@ def _dungeon_mult_for_tier(tier: int) -> int:
     return 1 if tier == 3 else 2 if tier == 2 else 3  # T3 base, T2 double, T1 triple
 
 def _dungeon_new_answer() -> str:
-    return random.choice(ANSWERS)
+    return pick_answer()
 
 async def _dungeon_settle_and_close(game: dict, payout_each: int, note: str):
     gid = game["guild_id"]
@@ -2689,15 +4671,35 @@ async def _dungeon_settle_and_close(game: dict, payout_each: int, note: str):
     part_ids = sorted(game.get("participants", set()))
     num_parts = len(part_ids)
 
-    ch = discord.utils.get(bot.get_all_channels(), id=ch_id)
-    guild = ch.guild if isinstance(ch, discord.TextChannel) else discord.utils.get(bot.guilds, id=gid)
+    ch = bot.get_channel(ch_id)
+    guild = ch.guild if isinstance(ch, GAME_ROOM_TYPES) else discord.utils.get(bot.guilds, id=gid)
 
-    # pay
-    for uid in part_ids:
-        try:
-            await change_balance(gid, uid, payout_each, announce_channel_id=ch_id)
-        except Exception:
-            pass
+    # pay (once, all-or-nothing), closing the game in the same transaction
+    if game.get("settled"):
+        return
+    game["settled"] = True
+
+    def _drop():
+        dungeon_games.pop(ch_id, None)
+        for mid, g in list(pending_dungeon_gates_by_msg.items()):
+            if g.get("dungeon_channel_id") == ch_id:
+                pending_dungeon_gates_by_msg.pop(mid, None)
+                journal_del("gate", mid)
+        for mid in (game.get("gate_msg_id"), game.get("welcome_msg_id"), game.get("decision_msg_id")):
+            unregister_reaction(mid)
+
+    async def _pay(db):
+        if payout_each <= 0:
+            return {}
+        return {uid: await tx_credit(db, gid, uid, payout_each) for uid in part_ids}
+    try:
+        new_bals = await journal_settle("dungeon", ch_id, _drop, _pay)
+    except Exception as e:
+        log.warning(f"dungeon payout failed for guild {gid}: {e}")
+        _drop()
+    else:
+        for uid, new in new_bals.items():
+            await _after_balance_change(gid, uid, ch_id, new - payout_each, new)
 
     # participants (mentions)
     names = []
@@ -2715,7 +4717,7 @@ async def _dungeon_settle_and_close(game: dict, payout_each: int, note: str):
     solved_block = "—" if not solved_list else "\n".join(f"• **{w}**" for w in solved_list)
 
     # In-channel wrap-up
-    if isinstance(ch, discord.TextChannel):
+    if isinstance(ch, GAME_ROOM_TYPES):
         emb = make_panel(
             title=f"Dungeon Finished — Tier {tier}",
             description=note,
@@ -2752,20 +4754,12 @@ async def _dungeon_settle_and_close(game: dict, payout_each: int, note: str):
             if ann_id:
                 ann_ch = guild.get_channel(ann_id)
                 if isinstance(ann_ch, discord.TextChannel):
-                    await safe_send(ann_ch, embed=summary_emb)
+                    await safe_send(ann_ch, embed=summary_emb, priority=SEND_LOW, wait=False)
         except Exception:
             pass
 
-    dungeon_games.pop(ch_id, None)
-    for mid, g in list(pending_dungeon_gates_by_msg.items()):
-        if g.get("dungeon_channel_id") == ch_id:
-            pending_dungeon_gates_by_msg.pop(mid, None)
-
-    if isinstance(ch, discord.TextChannel):
-        try:
-            await ch.delete(reason="Dungeon closed")
-        except Exception:
-            pass
+    if isinstance(ch, GAME_ROOM_TYPES):
+        await release_room(ch, reason="Dungeon closed")
 
 
 
@@ -2779,17 +4773,20 @@ async def _dungeon_start_round(game: dict):
     game["answer"] = _dungeon_new_answer()
     game["guesses"] = []
     game["legend"] = {}
+    game["legend_masks"] = [0, 0, 0]
     game["max"] = _dungeon_max_for_tier(game["tier"])
     game["state"] = "active"
+    game["decision_msg_id"] = None
+    journal_put("dungeon", game["channel_id"], game)
 
-    ch = discord.utils.get(bot.get_all_channels(), id=game["channel_id"])
-    if isinstance(ch, discord.TextChannel):
-        await ch.send(
-            f"🗝️ **New Wordle begins!** Tier **{game['tier']}** — you have **{game['max']} tries**.\n"
-            f"Guess with `g APPLE` here."
-        )
-        blank_board = render_board([], total_rows=game["max"])
-        await ch.send(blank_board)
+    ch = bot.get_channel(game["channel_id"])
+    if isinstance(ch, GAME_ROOM_TYPES):
+        # fresh board message per round; earlier rounds stay in the history above it
+        game["live"] = LiveBoard(ch)
+        await game["live"].post(board_embed(
+            game, f"🗝️ Dungeon Round {len(game['solved_rounds']) + 1} — Tier {game['tier']}",
+            status=f"**New Wordle begins!** You have **{game['max']} tries**. Guess with `g APPLE` here.",
+        ))
 
 
 
@@ -2816,13 +4813,12 @@ async def dungeon_guess(channel: discord.TextChannel, author: discord.Member, wo
         await safe_send(channel, "Out of tries for this round.")
         return
 
-    colors = score_guess(cleaned, game["answer"])
-    game["guesses"].append({"word": cleaned, "colors": colors})
-    update_legend(game["legend"], cleaned, colors)
-
-    board = render_board(game["guesses"], total_rows=game["max"])
-    await safe_send(channel, board)
+    pattern = score_pattern(cleaned, game["answer"])
+    apply_guess(game, cleaned, pattern)
+    journal("dungeon", ch_id, "guess", cleaned)
 
+    live = live_board(game, channel)
+    title = f"🗝️ Dungeon Round {len(game.get('solved_rounds', [])) + 1} — Tier {game['tier']}"
     attempt = len(game["guesses"])
     if cleaned == game["answer"]:
         base = payout_for_attempt(attempt)
@@ -2847,15 +4843,14 @@ async def dungeon_guess(channel: discord.TextChannel, author: discord.Member, wo
             await change_dungeon_tickets_t1(game["guild_id"], author.id, 1)
             loot_msgs.append("+1 Ticket (Tier 1)")
 
-        legend = legend_overview(game["legend"])
         extra = f" 🎁 Loot: {' · '.join(loot_msgs)}" if loot_msgs else ""
-        await safe_send(channel,
+        live.update(board_embed(game, title, status=f"✅ **Solved on attempt {attempt}!**", color=CARD_COLOR_SUCCESS))
+        # summary and decision share one message; the reactions go on it
+        msg = await safe_send(channel,
             f"✅ **Solved on attempt {attempt}!** Added **+{gained} {EMO_SHEKEL()}** to the dungeon pool "
-            f"(now **{game['pool']}**).{extra}\n"
-            f"{legend}\n\n"
+            f"(now **{game['pool']}**).{extra}\n\n"
             f"**Owner**: react **⏩** to **Continue** or **💰** to **Cash Out** for everyone."
         )
-        msg = await safe_send(channel, "⏩ Continue or 💰 Cash Out?")
         try:
             await msg.add_reaction("⏩")
             await msg.add_reaction("💰")
@@ -2863,20 +4858,23 @@ async def dungeon_guess(channel: discord.TextChannel, author: discord.Member, wo
             pass
         game["decision_msg_id"] = msg.id
         game["state"] = "await_decision"
+        register_reaction(msg.id, "dungeon_decision", channel.id)
+        journal_put("dungeon", ch_id, game)
         return
 
     if attempt == game["max"]:
         from math import ceil
+        await live.settle(board_embed(game, title, status="❌ Out of tries.", color=CARD_COLOR_FAIL))
         half_each = ceil(max(0, game.get("pool", 0)) / 2)
         await _dungeon_settle_and_close(game, half_each, note="❌ Round failed; reward halved (rounded up).")
         return
 
     next_attempt = attempt + 1
     payout = payout_for_attempt(next_attempt) * _dungeon_mult_for_tier(game["tier"])
-    hint = legend_overview(game["legend"])
-    txt = f"Attempt **{attempt}/{game['max']}** — Solve on attempt **{next_attempt}** to add **+{payout}** to the pool."
-    if hint: txt += f"\n{hint}"
-    await safe_send(channel, txt)
+    live.update(board_embed(
+        game, title,
+        status=f"Attempt **{attempt}/{game['max']}** — Solve on attempt **{next_attempt}** to add **+{payout}** to the pool.",
+    ))
 
 
 
@@ -2892,6 +4890,7 @@ async def dungeon_guess(channel: discord.TextChannel, author: discord.Member, wo
 ])
 async def worldle_dungeon_open(inter: discord.Interaction, tier: app_commands.Choice[int]):
     if not await guard_worldler_inter(inter): return
+    if not await guard_words_inter(inter): return
     if not inter.guild or not inter.channel: return
     gid, uid = inter.guild.id, inter.user.id
     t = tier.value
@@ -2961,6 +4960,8 @@ async def worldle_dungeon_open(inter: discord.Interaction, tier: app_commands.Ch
         "tier": t,
         "state": "gate_open",
     }
+    register_reaction(join_msg.id, "dungeon_gate", pending_dungeon_gates_by_msg[join_msg.id])
+    journal_put("gate", join_msg.id, pending_dungeon_gates_by_msg[join_msg.id])
 
     # Spooky welcome in dungeon channel with lock control
     welcome_txt = (
@@ -2981,6 +4982,8 @@ async def worldle_dungeon_open(inter: discord.Interaction, tier: app_commands.Ch
 
     dungeon_games[ch.id]["gate_msg_id"] = join_msg.id
     dungeon_games[ch.id]["welcome_msg_id"] = welcome.id
+    register_reaction(welcome.id, "dungeon_lock", ch.id)
+    journal_put("dungeon", ch.id, dungeon_games[ch.id])
 
     await inter.followup.send(f"Opened {ch.mention} and posted a **join gate** here. Players must react {EMO_DUNGEON()} to join.")
 
@@ -2993,15 +4996,27 @@ def _new_duel_id() -> int:
     did = _next_duel_id; _next_duel_id += 1; return did
 
 def _duel_in_channel(ch_id: int) -> Optional[int]:
-    for k, d in duels.items():
-        if d["state"]=="active" and d["channel_id"] == ch_id:
-            return k
+    for k in channel_interest.get(ch_id, {}).get("duel", ()):
+        return k
     return None
 
+def _set_duel_state(d: dict, state: str):
+    """Change a duel's state; active duels are indexed by channel for the message router."""
+    d["state"] = state
+    if state == "active":
+        _interest_add(d["channel_id"], "duel", d["id"])
+    else:
+        _interest_drop(d["channel_id"], "duel", d["id"])
+    if state in ("pending", "active"):
+        journal_put("duel", d["id"], d)
+    elif state != "accepting":
+        journal_del("duel", d["id"])
+
 @tree.command(name="worldle_challenge", description="Challenge a player to a Wordle duel for a stake.")
 @app_commands.describe(user="Opponent", amount="Stake (shekels)")
 async def worldle_challenge(inter: discord.Interaction, user: discord.Member, amount: int):
     if not await guard_worldler_inter(inter): return
+    if not await guard_words_inter(inter): return
     if not inter.guild or not inter.channel: return
     if user.bot or user.id == inter.user.id:
         return await inter.response.send_message("Pick a real opponent (not yourself/bots).", ephemeral=True)
@@ -3023,6 +5038,7 @@ async def worldle_challenge(inter: discord.Interaction, user: discord.Member, am
         "answer": None, "turn": None,
         "guesses": {inter.user.id: [], user.id: []},
     }
+    journal_put("duel", did, duels[did])
     await inter.response.send_message(
         f"⚔️ Duel **#{did}** created: {inter.user.mention} challenges {user.mention} for **{amount} {EMO_SHEKEL()}**.\n"
         f"{user.mention}, accept with `/worldle_accept id:{did}` or decline with `/worldle_cancel id:{did}`.",
@@ -3033,6 +5049,7 @@ async def worldle_challenge(inter: discord.Interaction, user: discord.Member, am
 @app_commands.describe(id="Duel ID")
 async def worldle_accept(inter: discord.Interaction, id: int):
     if not await guard_worldler_inter(inter): return
+    if not await guard_words_inter(inter): return
     d = duels.get(id)
     if not d or d["state"] != "pending":
         return await inter.response.send_message("No such pending duel.", ephemeral=True)
@@ -3042,21 +5059,35 @@ async def worldle_accept(inter: discord.Interaction, id: int):
     if inter.user.id != d["target_id"]:
         return await inter.response.send_message("Only the challenged player can accept.", ephemeral=True)
     if time.time() - d["created"] > 10*60:
-        d["state"] = "cancelled"
+        _set_duel_state(d, "cancelled")
         return await inter.response.send_message("That duel expired.", ephemeral=True)
 
     gid, cid = d["guild_id"], d["channel_id"]
     a, b, stake = d["challenger_id"], d["target_id"], d["stake"]
-    if await get_balance(gid, a) < stake or await get_balance(gid, b) < stake:
-        d["state"] = "cancelled"
+    # Claim the duel before awaiting so a double-click can't escrow twice.
+    _set_duel_state(d, "accepting")
+    answer, turn = pick_answer(), random.choice([a, b])
+    try:
+        await journal_flush()   # the escrow's journal record must land after everything before it
+        async with db_transaction() as db:
+            bal_a = await tx_debit(db, gid, a, stake)
+            bal_b = await tx_debit(db, gid, b, stake) if bal_a is not None else None
+            if bal_a is None or bal_b is None:
+                raise TxAbort("funds")
+            # journal the started duel in the same transaction as the escrow, so the pot survives a crash
+            d.update(pot=stake * 2, answer=answer, turn=turn)
+            await db.execute(_JOURNAL_INSERT, _journal_row("duel", id, "put", _journal_snapshot({**d, "state": "active"})))
+            _set_duel_state(d, "active")   # before the commit, so a compaction never sees it "accepting"
+    except TxAbort:
+        _set_duel_state(d, "cancelled")
         return await inter.response.send_message("One of you no longer has enough shekels. Duel cancelled.", ephemeral=True)
+    except Exception:
+        d.update(pot=0, answer=None, turn=None)
+        _set_duel_state(d, "pending")
+        raise
 
-    await change_balance(gid, a, -stake, announce_channel_id=cid)
-    await change_balance(gid, b, -stake, announce_channel_id=cid)
-    d["pot"] = stake * 2
-    d["answer"] = random.choice(ANSWERS)
-    d["turn"] = random.choice([a, b])
-    d["state"] = "active"
+    await _after_balance_change(gid, a, cid, bal_a + stake, bal_a)
+    await _after_balance_change(gid, b, cid, bal_b + stake, bal_b)
 
     ch = inter.channel
     starter = f"<@{d['turn']}>"
@@ -3090,21 +5121,27 @@ async def worldle_duel_guess(inter: discord.Interaction, id: int, word: str):
     if not is_valid_guess(cleaned):
         return await inter.response.send_message("That’s not in the Wordle dictionary (UK variants supported).", ephemeral=True)
 
-    colors = score_guess(cleaned, d["answer"])
-    d["guesses"][uid].append({"word": cleaned, "colors": colors})
+    pattern = score_pattern(cleaned, d["answer"])
+    colors = pattern_colors(pattern)
+    d["guesses"][uid].append({"word": cleaned, "colors": colors, "pattern": pattern})
     row = render_row(cleaned, colors)
 
     ch = inter.channel
     if cleaned == d["answer"]:
+        if d.get("settled"):   # a double-submitted winning guess
+            return await inter.response.send_message("This duel is already over.", ephemeral=True)
+        d["settled"] = True
         await ch.send(row)
-        await change_balance(d["guild_id"], uid, d["pot"], announce_channel_id=d["channel_id"])
-        bal = await get_balance(d["guild_id"], uid)
-        await ch.send(f"🏁 Duel **#{id}**: {inter.user.mention} guessed **{d['answer'].upper()}** and wins the pot **{d['pot']} {EMO_SHEKEL()}**! (Balance: {bal})")
-        d["state"] = "finished"
+        gid, pot = d["guild_id"], d["pot"]
+        bal = await journal_settle("duel", id, lambda: _set_duel_state(d, "finished"),
+                                   lambda db: tx_credit(db, gid, uid, pot))
+        await _after_balance_change(gid, uid, d["channel_id"], bal - pot, bal)
+        await ch.send(f"🏁 Duel **#{id}**: {inter.user.mention} guessed **{d['answer'].upper()}** and wins the pot **{pot} {EMO_SHEKEL()}**! (Balance: {bal})")
         return await inter.response.send_message("You win!", ephemeral=True)
 
     other = d["challenger_id"] if uid == d["target_id"] else d["target_id"]
     d["turn"] = other
+    journal("duel", id, "guess", {"u": uid, "w": cleaned})
     await ch.send(row)
     await ch.send(f"**Duel #{id}** — It’s now <@{other}>'s turn.")
     await inter.response.send_message("Move submitted.", ephemeral=True)
@@ -3121,7 +5158,7 @@ async def worldle_cancel(inter: discord.Interaction, id: int):
         return await inter.response.send_message(f"Use this in {ch.mention if ch else 'the duel channel'}.", ephemeral=True)
     if inter.user.id not in (d["challenger_id"], d["target_id"]):
         return await inter.response.send_message("Only participants can cancel.", ephemeral=True)
-    d["state"] = "cancelled"
+    _set_duel_state(d, "cancelled")
     await inter.response.send_message("Duel cancelled.", ephemeral=True)
 
 # -------------------- Economy / items --------------------
@@ -3164,6 +5201,12 @@ SHOP_ITEMS = {
 # Controls shop item order & /buy choices
 SHOP_ORDER = ["stone", "badge", "chicken", "sniper", "ticket_t3"]
 
+# inv column each shop item lives in (buy/sell)
+SHOP_INV_COLUMN = {
+    "stone": "stones", "badge": "badge", "chicken": "chickens",
+    "sniper": "sniper", "ticket_t3": "dungeon_tickets_t3",
+}
+
 
 @tree.command(name="shop", description="Show the shop.")
 async def shop(inter: discord.Interaction):
@@ -3191,27 +5234,37 @@ async def buy(inter: discord.Interaction, item: app_commands.Choice[str], amount
         return await inter.response.send_message("Amount must be positive.", ephemeral=True)
 
     key, gid, uid, cid = item.value, inter.guild.id, inter.user.id, inter.channel_id
+    col = SHOP_INV_COLUMN.get(key)
+    if not col:
+        return await inter.response.send_message("This item isn't wired yet.", ephemeral=True)
     price = SHOP_ITEMS[key]["price"]
     cost = price * amount
-    bal = await get_balance(gid, uid)
-    if bal < cost:
+    one_time = key in ("badge", "sniper")
+
+    # one round-trip: ownership check + conditional debit + grant, all or nothing
+    try:
+        async with db_transaction() as db:
+            if one_time and not await tx_claim_flag(db, gid, uid, col):
+                raise TxAbort("owned")
+            bal = await tx_debit(db, gid, uid, cost)
+            if bal is None:
+                raise TxAbort("funds")
+            count = 1 if one_time else await tx_add_inv(db, gid, uid, col, amount)
+    except TxAbort as e:
+        if e.reason == "owned":
+            what = "badge" if key == "badge" else "Sniper"
+            return await inter.response.send_message(f"You already own the {what}.", ephemeral=True)
         return await inter.response.send_message(
-            f"Not enough shekels. Cost **{cost} {EMO_SHEKEL()}**, you have **{bal}**.", ephemeral=True
+            f"Not enough shekels. Cost **{cost} {EMO_SHEKEL()}**, you have **{await get_balance(gid, uid)}**.", ephemeral=True
         )
+    await _after_balance_change(gid, uid, cid, bal + cost, bal)
 
     if key == "stone":
-        await change_balance(gid, uid, -cost, announce_channel_id=cid)
-        await change_stones(gid, uid, amount)
-        stones = await get_stones(gid, uid)
         return await inter.response.send_message(
-            f"{EMO_STONE()} Bought **{amount} Stone(s)** (−{cost}). Stones: **{stones}**. Balance: **{await get_balance(gid, uid)}**"
+            f"{EMO_STONE()} Bought **{amount} Stone(s)** (−{cost}). Stones: **{count}**. Balance: **{bal}**"
         )
 
     if key == "badge":
-        if await get_badge(gid, uid) >= 1:
-            return await inter.response.send_message("You already own the badge.", ephemeral=True)
-        await change_balance(gid, uid, -cost, announce_channel_id=cid)
-        await set_badge(gid, uid, 1)
         rid = await ensure_bounty_role(inter.guild)
         try:
             m = inter.guild.get_member(uid) or await inter.guild.fetch_member(uid)
@@ -3224,31 +5277,19 @@ async def buy(inter: discord.Interaction, item: app_commands.Choice[str], amount
         )
 
     if key == "chicken":
-        await change_balance(gid, uid, -cost, announce_channel_id=cid)
-        await change_chickens(gid, uid, amount)
         return await inter.response.send_message(
-            f"{EMO_CHICKEN()} Bought **{amount} Fried Chicken** (−{cost}). You have **{await get_chickens(gid, uid)}**."
+            f"{EMO_CHICKEN()} Bought **{amount} Fried Chicken** (−{cost}). You have **{count}**."
         )
 
     if key == "sniper":
-        if await get_sniper(gid, uid) >= 1:
-            return await inter.response.send_message("You already own the Sniper.", ephemeral=True)
-        await change_balance(gid, uid, -cost, announce_channel_id=cid)
-        await set_sniper(gid, uid, 1)
         return await inter.response.send_message(
             f"{EMO_SNIPER()} You bought the **Sniper** (−{cost}). You can now use `/snipe` (costs {SNIPER_SNIPE_COST} per shot)."
         )
 
-    if key == "ticket_t3":
-        # Dungeon Ticket (Tier 3) — purchasable
-        await change_balance(gid, uid, -cost, announce_channel_id=cid)
-        await change_dungeon_tickets_t3(gid, uid, amount)
-        count = await get_dungeon_tickets_t3(gid, uid)
-        return await inter.response.send_message(
-            f"{EMO_DUNGEON()} Bought **{amount} Tier-3 Dungeon Ticket(s)** (−{cost}). You now have **{count}**."
-        )
-
-    await inter.response.send_message("This item isn't wired yet.", ephemeral=True)
+    # Dungeon Ticket (Tier 3) — purchasable
+    await inter.response.send_message(
+        f"{EMO_DUNGEON()} Bought **{amount} Tier-3 Dungeon Ticket(s)** (−{cost}). You now have **{count}**."
+    )
 
 
 @tree.command(name="sell", description="Sell items back to the shop for the same price.")
@@ -3268,23 +5309,40 @@ async def sell(inter: discord.Interaction, item: app_commands.Choice[str], amoun
     if amount <= 0: 
         return await inter.response.send_message("Amount must be positive.", ephemeral=True)
     key, gid, uid, cid = item.value, inter.guild.id, inter.user.id, inter.channel_id
+    col = SHOP_INV_COLUMN.get(key)
+    if not col:
+        return await inter.response.send_message("Can't sell that.", ephemeral=True)
+    if key == "sniper" and amount != 1:
+        return await inter.response.send_message("You can only sell one Sniper.", ephemeral=True)
+    qty = 1 if key in ("badge", "sniper") else amount
+    refund = {
+        "stone": PRICE_STONE, "badge": PRICE_BADGE, "chicken": PRICE_CHICK,
+        "sniper": PRICE_SNIPER, "ticket_t3": 5,
+    }[key] * qty
+
+    # take the item only if owned, then credit — one atomic round-trip
+    try:
+        async with db_transaction() as db:
+            if await tx_take_inv(db, gid, uid, col, qty) is None:
+                raise TxAbort("missing")
+            bal = await tx_credit(db, gid, uid, refund)
+    except TxAbort:
+        missing = {
+            "stone": "You don't have that many stones.",
+            "badge": "You don't own the badge.",
+            "chicken": "You don't have that many fried chicken.",
+            "sniper": "You don't own the Sniper.",
+            "ticket_t3": "You don't have that many Tier-3 tickets.",
+        }[key]
+        return await inter.response.send_message(missing, ephemeral=True)
+    await _after_balance_change(gid, uid, cid, bal - refund, bal)
 
     if key == "stone":
-        have = await get_stones(gid, uid)
-        if have < amount: 
-            return await inter.response.send_message("You don't have that many stones.", ephemeral=True)
-        await change_stones(gid, uid, -amount)
-        await change_balance(gid, uid, PRICE_STONE * amount, announce_channel_id=cid)
         return await inter.response.send_message(
-            f"Sold **{amount}** {EMO_STONE()} for **{PRICE_STONE*amount} {EMO_SHEKEL()}**."
+            f"Sold **{amount}** {EMO_STONE()} for **{refund} {EMO_SHEKEL()}**."
         )
 
     if key == "badge":
-        have = await get_badge(gid, uid)
-        if have < 1: 
-            return await inter.response.send_message("You don't own the badge.", ephemeral=True)
-        await set_badge(gid, uid, 0)
-        await change_balance(gid, uid, PRICE_BADGE, announce_channel_id=cid)
         rid = (await get_cfg(gid))["bounty_role_id"]
         try:
             m = inter.guild.get_member(uid) or await inter.guild.fetch_member(uid)
@@ -3298,39 +5356,18 @@ async def sell(inter: discord.Interaction, item: app_commands.Choice[str], amoun
         )
 
     if key == "chicken":
-        have = await get_chickens(gid, uid)
-        if have < amount: 
-            return await inter.response.send_message("You don't have that many fried chicken.", ephemeral=True)
-        await change_chickens(gid, uid, -amount)
-        await change_balance(gid, uid, PRICE_CHICK * amount, announce_channel_id=cid)
         return await inter.response.send_message(
-            f"Sold **{amount}** {EMO_CHICKEN()} for **{PRICE_CHICK*amount} {EMO_SHEKEL()}**."
+            f"Sold **{amount}** {EMO_CHICKEN()} for **{refund} {EMO_SHEKEL()}**."
         )
 
     if key == "sniper":
-        have = await get_sniper(gid, uid)
-        if have < 1:
-            return await inter.response.send_message("You don't own the Sniper.", ephemeral=True)
-        if amount != 1:
-            return await inter.response.send_message("You can only sell one Sniper.", ephemeral=True)
-        await set_sniper(gid, uid, 0)
-        await change_balance(gid, uid, PRICE_SNIPER, announce_channel_id=cid)
         return await inter.response.send_message(
             f"Sold **Sniper** for **{PRICE_SNIPER} {EMO_SHEKEL()}**. You no longer have access to `/snipe`."
         )
 
-    if key == "ticket_t3":
-        have = await get_dungeon_tickets_t3(gid, uid)
-        if have < amount:
-            return await inter.response.send_message("You don't have that many Tier-3 tickets.", ephemeral=True)
-        await change_dungeon_tickets_t3(gid, uid, -amount)
-        refund = 5 * amount
-        await change_balance(gid, uid, refund, announce_channel_id=cid)
-        return await inter.response.send_message(
-            f"Sold **{amount}** {EMO_DUNGEON()} Tier-3 Dungeon Ticket(s) for **{refund} {EMO_SHEKEL()}**."
-        )
-
-    await inter.response.send_message("Can't sell that.", ephemeral=True)
+    await inter.response.send_message(
+        f"Sold **{amount}** {EMO_DUNGEON()} Tier-3 Dungeon Ticket(s) for **{refund} {EMO_SHEKEL()}**."
+    )
 
 
 @tree.command(name="eat", description="Eat a Fried Chicken to gain 1 hour stone immunity.")
@@ -3433,52 +5470,61 @@ async def stone_cmd(inter: discord.Interaction, user: discord.Member, times: int
     await inter.response.defer(thinking=False)
 
     gid, uid, cid = inter.guild.id, inter.user.id, inter.channel_id
-
-    have = await get_stones(gid, uid)
-    if have < 1:
-        return await inter.followup.send("You don't have any stones. Buy more with `/buy`.")
-
     today = uk_today_str()
-    used_today = await get_stone_count_today(gid, uid, user.id, today)
-    remaining_cap = max(0, 15 - used_today)
-    if remaining_cap <= 0:
+    now = gmt_now_s()
+
+    # The whole volley is one transaction: cap check, stone spend, stats, victim debit, ground pot.
+    try:
+        async with db_transaction() as db:
+            have = await _tx_scalar(db, "SELECT stones FROM inv WHERE guild_id=? AND user_id=?", (gid, uid))
+            if have < 1:
+                raise TxAbort("no_stones")
+
+            used_today = await _tx_scalar(db, """SELECT count FROM stone_daily
+                                                 WHERE guild_id=? AND attacker_id=? AND target_id=? AND date=?""",
+                                          (gid, uid, user.id, today))
+            remaining_cap = max(0, 15 - used_today)
+            if remaining_cap <= 0:
+                raise TxAbort("cap")
+
+            # Only allow up to remaining cap and what they own
+            allowed = min(times, remaining_cap, have)
+            stones_left = await tx_take_inv(db, gid, uid, "stones", allowed)
+
+            # Stats (attempts) + count attempts regardless of protection
+            await tx_inc_stat(db, gid, uid, "stones_thrown", allowed)
+            await tx_inc_stat(db, gid, user.id, "stoned_received", allowed)
+            await tx_inc_stone_count(db, gid, uid, user.id, today, allowed)
+
+            target_prot = await _tx_scalar(db, "SELECT protected_until_ts FROM inv WHERE guild_id=? AND user_id=?", (gid, user.id))
+            protected = target_prot > now
+
+            drops = 0
+            if not protected:
+                hits = sum(1 for _ in range(allowed) if random.random() < 0.49)
+                victim_bal = await _tx_scalar(db, "SELECT balance FROM wallet WHERE guild_id=? AND user_id=?", (gid, user.id))
+                drops = min(hits, max(0, victim_bal))
+                if drops > 0:
+                    # Take from victim, add to ground pot
+                    victim_bal = await tx_debit(db, gid, user.id, drops)
+                    await tx_add_to_pot(db, gid, drops)
+    except TxAbort as e:
+        if e.reason == "no_stones":
+            return await inter.followup.send("You don't have any stones. Buy more with `/buy`.")
         return await inter.followup.send(f"🛑 You've reached your daily limit of **15** stones against {user.mention}. Resets at **00:00 UK time**.")
 
-    # Only allow up to remaining cap and what they own
-    allowed = min(times, remaining_cap, have)
     if allowed < times:
         await inter.followup.send(f"⚠️ You can only throw **{allowed}** more at {user.mention} today (cap 15 per day). Proceeding with **{allowed}**.")
-    await change_stones(gid, uid, -allowed)
-
-    # Stats (attempts)
-    await inc_stat(gid, uid, "stones_thrown", allowed)
-    await inc_stat(gid, user.id, "stoned_received", allowed)
-
-    target_prot = await get_protection_until(gid, user.id)
-    now = gmt_now_s()
-    protected = target_prot > now
-
-    # Count attempts regardless of protection
-    await inc_stone_count_today(gid, uid, user.id, today, allowed)
 
     if protected:
         left = (target_prot - now)//60
-        stones_left = await get_stones(gid, uid)
         return await inter.followup.send(
             f"🛡️ {user.mention} is protected from stones for about **~{left}m**. "
             f"You used **{allowed}** {EMO_STONE()} (left: **{stones_left}**)."
         )
 
-    hits = sum(1 for _ in range(allowed) if random.random() < 0.49)
-    victim_bal = await get_balance(gid, user.id)
-    drops = min(hits, max(0, victim_bal))
-
     if drops > 0:
-        # Take from victim, add to ground pot
-        await change_balance(gid, user.id, -drops, announce_channel_id=cid)
-        await add_to_pot(gid, drops)
-
-    stones_left = await get_stones(gid, uid)
+        await _after_balance_change(gid, user.id, cid, victim_bal + drops, victim_bal)
 
     if drops:
         # Plain text status (like before)…
@@ -3504,7 +5550,8 @@ async def stone_cmd(inter: discord.Interaction, user: discord.Member, times: int
             target_ch,
             embed=emb,
             view=view,
-            allowed_mentions=discord.AllowedMentions(users=True, roles=False, everyone=False)
+            allowed_mentions=discord.AllowedMentions(users=True, roles=False, everyone=False),
+            priority=SEND_LOW, wait=False,
         )
     else:
         await inter.followup.send(
@@ -3516,10 +5563,11 @@ async def stone_cmd(inter: discord.Interaction, user: discord.Member, times: int
 async def collect(inter: discord.Interaction):
     if not await guard_worldler_inter(inter): return
     gid, uid, cid = inter.guild.id, inter.user.id, inter.channel_id
-    amt = await pop_all_from_pot(gid)
+    async with db_transaction() as db:
+        amt = await tx_take_from_pot(db, gid)
+        bal = await tx_credit(db, gid, uid, amt) if amt > 0 else 0
     if amt <= 0: return await inter.response.send_message("Nothing on the ground right now.")
-    await change_balance(gid, uid, amt, announce_channel_id=cid)
-    bal = await get_balance(gid, uid)
+    await _after_balance_change(gid, uid, cid, bal - amt, bal)
     s = "" if amt == 1 else "s"
     await inter.response.send_message(f"{EMO_SHEKEL()} {inter.user.mention} collected **{amt} shekel{s}**. Balance: **{bal}**")
 
@@ -3758,14 +5806,16 @@ async def snipe_cmd(inter: discord.Interaction, target: discord.Member, word: st
 
     # Lock in that this shooter has used their shot for THIS game
     tried.add(uid)
+    journal_put("solo", _key(gid, target_cid, target.id), game)
 
-    colors = score_guess(cleaned, game["answer"])
+    pattern = score_pattern(cleaned, game["answer"])
+    colors = pattern_colors(pattern)
     row = render_row(cleaned, colors)
 
     # Post the snipe shot in the victim's room (ignore if channel vanished)
     try:
-        ch = inter.guild.get_channel(target_cid)
-        if isinstance(ch, discord.TextChannel):
+        ch = get_room(inter.guild, target_cid)
+        if isinstance(ch, GAME_ROOM_TYPES):
             await ch.send(f"{EMO_SNIPER()} **{inter.user.display_name}** sniped with `{cleaned.upper()}`:\n{row}")
     except Exception:
         ch = None  # if anything went wrong, treat as missing
@@ -3778,18 +5828,31 @@ async def snipe_cmd(inter: discord.Interaction, target: discord.Member, word: st
             pass
         return
 
-    # HIT
+    # HIT — claim the game first: the victim (or another sniper) may have finished it meanwhile
+    key = _key(gid, target_cid, target.id)
+    if solo_games.get(key) is not game or game.get("settled"):
+        try:
+            await inter.followup.send("Too late — that Worldle just ended.", ephemeral=True)
+        except Exception:
+            pass
+        return
+    game["settled"] = True
     next_attempt = len(game["guesses"]) + 1  # snipe shot doesn't consume victim's tries
     payout = payout_for_attempt(next_attempt)
-    if payout:
-        await change_balance(gid, uid, payout, announce_channel_id=target_cid)
 
-    # Count stats: shooter made a snipe; victim got sniped
-    try:
-        await inc_stat(gid, uid, "snipes", 1)
-        await inc_stat(gid, target.id, "sniped", 1)
-    except Exception:
-        pass
+    def _finish():
+        solo_games.pop(key, None)
+        if solo_channels.get((gid, target.id)) == target_cid:
+            solo_channels.pop((gid, target.id), None)
+
+    async def _pay(db):
+        # stats: shooter made a snipe; victim got sniped
+        await tx_inc_stat(db, gid, uid, "snipes", 1)
+        await tx_inc_stat(db, gid, target.id, "sniped", 1)
+        return await tx_credit(db, gid, uid, payout)
+    bal_new = await journal_settle("solo", key, _finish, _pay)
+    if payout:
+        await _after_balance_change(gid, uid, target_cid, bal_new - payout, bal_new)
 
     # Roll back the victim's daily solo slot (sniped games shouldn't count)
     try:
@@ -3803,7 +5866,7 @@ async def snipe_cmd(inter: discord.Interaction, target: discord.Member, word: st
 
     # Build a final board for the announcement: victim guesses + this snipe shot
     try:
-        guesses_for_board = list(game["guesses"]) + [{"word": cleaned, "colors": colors}]
+        guesses_for_board = list(game["guesses"]) + [{"word": cleaned, "colors": colors, "pattern": pattern}]
         board_str = render_board(guesses_for_board)
     except Exception:
         board_str = None
@@ -3829,20 +5892,9 @@ async def snipe_cmd(inter: discord.Interaction, target: discord.Member, word: st
     except Exception:
         pass
 
-    # Cleanup the victim's game state
-    try:
-        solo_games.pop(_key(gid, target_cid, target.id), None)
-        if solo_channels.get((gid, target.id)) == target_cid:
-            solo_channels.pop((gid, target.id), None)
-    except Exception:
-        pass
-
     # Delete the victim's channel last (ignore errors if already gone)
-    try:
-        if isinstance(ch, discord.TextChannel):
-            await ch.delete(reason="Worldle sniped (finished)")
-    except Exception:
-        pass
+    if isinstance(ch, GAME_ROOM_TYPES):
+        await release_room(ch, reason="Worldle sniped (finished)")
 
 
 
@@ -3858,8 +5910,32 @@ async def worldle_set_category(inter: discord.Interaction):
     if not isinstance(cat, discord.CategoryChannel):
         return await send_boxed(inter, "Solo Category", "This channel isn’t inside a category. Move it, then run again.", icon="🛠", ephemeral=True)
     await set_cfg(inter.guild.id, solo_category_id=cat.id)
+    start_room_refill(inter.guild)
     await send_boxed(inter, "Solo Category", f"Solo rooms will be created under **{cat.name}**.", icon="🛠")
 
+@tree.command(name="worldle_set_rooms", description="(Admin) Game rooms as channels, or as private threads under THIS channel.")
+@app_commands.default_permissions(administrator=True)
+@app_commands.choices(backend=[
+    app_commands.Choice(name="Channels (in the solo category)", value="channel"),
+    app_commands.Choice(name="Private threads (under this channel)", value="thread"),
+])
+async def worldle_set_rooms(inter: discord.Interaction, backend: app_commands.Choice[str]):
+    if not inter.guild or not inter.channel:
+        return await send_boxed(inter, "Game Rooms", "Server only.", icon="🛠", ephemeral=True)
+    if backend.value == "channel":
+        await set_cfg(inter.guild.id, room_backend="channel")
+        start_room_refill(inter.guild)
+        return await send_boxed(inter, "Game Rooms", "Games will get **private channels**.", icon="🛠")
+    if not isinstance(inter.channel, discord.TextChannel):
+        return await send_boxed(inter, "Game Rooms", "Run this in a normal text channel (it becomes the threads' parent).", icon="🛠", ephemeral=True)
+    perms = inter.channel.permissions_for(inter.guild.me)
+    if not (perms.create_private_threads and perms.send_messages_in_threads):
+        return await send_boxed(inter, "Game Rooms", "I need **Create Private Threads** and **Send Messages in Threads** here.", icon="🛠", ephemeral=True)
+    await set_cfg(inter.guild.id, room_backend="thread", room_parent_id=inter.channel.id)
+    await send_boxed(inter, "Game Rooms",
+                     f"Games will get **private threads** under {inter.channel.mention}. "
+                     "Threads can't have read-only spectators; finished games are archived.", icon="🛠")
+
 @tree.command(name="worldle_set_announce", description="(Admin) Set THIS channel for solo Wordle result announcements.")
 @app_commands.default_permissions(administrator=True)
 async def worldle_set_announce(inter: discord.Interaction):
@@ -3882,11 +5958,11 @@ async def role_maketier(inter: discord.Interaction, name: str, min: int):
     role = discord.utils.find(lambda r: r.name.lower()==name.lower(), guild.roles)
     if role is None:
         role = await guild.create_role(name=name, reason="Create Wordle World tier")
-    await bot.db.execute("""
+    await db_write("""
       INSERT INTO role_tier(guild_id,role_id,min_balance) VALUES(?,?,?)
       ON CONFLICT(guild_id,role_id) DO UPDATE SET min_balance=excluded.min_balance
     """, (guild.id, role.id, min))
-    await bot.db.commit()
+    invalidate_tiers(guild.id)
     await inter.response.send_message(f"✅ Created/bound tier: {role.mention} at **{min}**.")
 
 @tree.command(name="role_addtier", description="(Admin) Bind an existing role to a Shekel minimum.")
@@ -3897,11 +5973,11 @@ async def role_addtier(inter: discord.Interaction, role: discord.Role, min: int)
     if min < 0: return await inter.response.send_message("Min must be ≥0.", ephemeral=True)
     if not bot_can_manage_role(inter.guild, role):
         return await inter.response.send_message("I can't manage that role. Move my role above it & grant **Manage Roles**.", ephemeral=True)
-    await bot.db.execute("""
+    await db_write("""
       INSERT INTO role_tier(guild_id,role_id,min_balance) VALUES(?,?,?)
       ON CONFLICT(guild_id,role_id) DO UPDATE SET min_balance=excluded.min_balance
     """, (inter.guild.id, role.id, min))
-    await bot.db.commit()
+    invalidate_tiers(inter.guild.id)
     await inter.response.send_message(f"✅ Bound tier: **{role.name}** at **{min}**.")
 
 @tree.command(name="role_removetier", description="(Admin) Remove a tier mapping.")
@@ -3909,15 +5985,14 @@ async def role_addtier(inter: discord.Interaction, role: discord.Role, min: int)
 @app_commands.describe(role="Role")
 async def role_removetier(inter: discord.Interaction, role: discord.Role):
     if not inter.guild: return await inter.response.send_message("Server only.", ephemeral=True)
-    await bot.db.execute("DELETE FROM role_tier WHERE guild_id=? AND role_id=?", (inter.guild.id, role.id))
-    await bot.db.commit()
+    await db_write("DELETE FROM role_tier WHERE guild_id=? AND role_id=?", (inter.guild.id, role.id))
+    invalidate_tiers(inter.guild.id)
     await inter.response.send_message(f"🗑️ Removed tier for **{role.name}**.")
 
 @tree.command(name="role_tiers", description="List tier roles.")
 async def role_tiers(inter: discord.Interaction):
     if not await guard_worldler_inter(inter): return
-    async with bot.db.execute("SELECT role_id,min_balance FROM role_tier WHERE guild_id=? ORDER BY min_balance ASC",(inter.guild.id,)) as cur:
-        rows = await cur.fetchall()
+    rows = await get_tier_rows(inter.guild.id)
     if not rows: return await inter.response.send_message("No tiers configured.")
     lines = ["🏷️ **Role Tiers** (balance ≥ min):"]
     for rid, min_bal in rows:
@@ -3929,16 +6004,115 @@ async def role_tiers(inter: discord.Interaction):
 @app_commands.default_permissions(administrator=True)
 async def role_sync(inter: discord.Interaction):
     if not inter.guild: return await inter.response.send_message("Server only.", ephemeral=True)
-    await inter.response.send_message("⏳ Syncing…", ephemeral=True)
-    async with bot.db.execute("SELECT user_id FROM wallet WHERE guild_id=?", (inter.guild.id,)) as cur:
-        ids = [r[0] for r in await cur.fetchall()]
-    for uid in ids:
+    gid = inter.guild.id
+    task = role_sync_jobs.get(gid)
+    if task and not task.done():
+        return await inter.response.send_message("⏳ A role sync is already running here.", ephemeral=True)
+    await inter.response.send_message("⏳ Role sync starting…")
+    msg = await inter.original_response()
+    await db_write("""
+      INSERT INTO role_sync_job(guild_id,last_user_id,status_channel_id,status_message_id,checked,edited,started_ts)
+      VALUES(?,0,?,?,0,0,?)
+      ON CONFLICT(guild_id) DO UPDATE SET
+        last_user_id=0, status_channel_id=excluded.status_channel_id,
+        status_message_id=excluded.status_message_id, checked=0, edited=0, started_ts=excluded.started_ts
+    """, (gid, msg.channel.id, msg.id, gmt_now_s()))
+    start_role_sync_job(inter.guild)
+
+# -------------------- bulk role sync job --------------------
+role_sync_jobs: dict[int, asyncio.Task] = {}   # gid -> running job
+
+def start_role_sync_job(guild: discord.Guild):
+    task = role_sync_jobs.get(guild.id)
+    if task and not task.done():
+        return
+    role_sync_jobs[guild.id] = asyncio.create_task(_role_sync_job(guild))
+
+async def resume_role_sync_jobs():
+    async with bot.db.execute("SELECT guild_id FROM role_sync_job") as cur:
+        gids = [r[0] for r in await cur.fetchall()]
+    for gid in gids:
+        guild = bot.get_guild(gid)
+        if guild:
+            log.info(f"[roles] resuming bulk sync in {gid}")
+            start_role_sync_job(guild)
+
+async def _edit_member_roles(member: discord.Member, roles: list[discord.Role], sem: asyncio.Semaphore) -> bool:
+    # discord.py already waits out 429s for us; anything that reaches here is a real failure
+    async with sem:
+        try:
+            await member.edit(roles=roles, reason="Wordle World tier sync")
+            return True
+        except Exception as e:
+            log.warning(f"[roles] bulk edit for {member.id} failed: {e}")
+            return False
+
+async def _role_sync_job(guild: discord.Guild):
+    gid = guild.id
+    async with bot.db.execute(
+        "SELECT last_user_id,status_channel_id,status_message_id,checked,edited FROM role_sync_job WHERE guild_id=?",
+        (gid,)
+    ) as cur:
+        row = await cur.fetchone()
+    if not row:
+        return
+    last_uid, ch_id, msg_id, checked, edited = row
+    ch = guild.get_channel_or_thread(ch_id) if ch_id else None
+    status = ch.get_partial_message(msg_id) if ch and msg_id else None
+    last_status = 0.0
+
+    async def report(text: str, force: bool = False):
+        nonlocal last_status
+        if not status or (not force and time.monotonic() - last_status < 3):
+            return
+        last_status = time.monotonic()
         try:
-            member = inter.guild.get_member(uid) or await inter.guild.fetch_member(uid)
-            await sync_member_role_tiers(inter.guild, member)
+            await status.edit(content=text)
         except Exception:
-            continue
-    await inter.followup.send("✅ Done.")
+            pass
+
+    try:
+        manageable = await manageable_tiers(guild)
+        rid = (await get_cfg(gid))["worldler_role_id"]
+        if not guild.chunked:
+            await guild.chunk()
+        # Balances in one read; tiers/members from cache — the loop itself never touches the DB
+        async with bot.db.execute(
+            "SELECT user_id,balance FROM wallet WHERE guild_id=? AND user_id>? ORDER BY user_id",
+            (gid, last_uid)
+        ) as cur:
+            rows = await cur.fetchall()
+        total = checked + len(rows)
+        sem = asyncio.Semaphore(max(1, ROLE_SYNC_CONCURRENCY))
+
+        for i in range(0, len(rows), max(1, ROLE_SYNC_BATCH)):
+            batch = rows[i:i + max(1, ROLE_SYNC_BATCH)]
+            edits = []
+            for uid, bal in batch:
+                member = guild.get_member(uid)
+                if not member or not rid or member.get_role(rid) is None:
+                    continue
+                roles = tier_roles_for(member, manageable, bal)
+                if roles is not None:
+                    edits.append(_edit_member_roles(member, roles, sem))
+            if edits:
+                edited += sum(await asyncio.gather(*edits))
+            checked += len(batch)
+            await db_write(
+                "UPDATE role_sync_job SET last_user_id=?, checked=?, edited=? WHERE guild_id=?",
+                (batch[-1][0], checked, edited, gid)
+            )
+            await report(f"⏳ Role sync: **{checked}/{total}** checked · **{edited}** updated…")
+
+        await db_write("DELETE FROM role_sync_job WHERE guild_id=?", (gid,))
+        await report(f"✅ Role sync done: **{checked}** checked · **{edited}** updated.", force=True)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        log.warning(f"[roles] bulk sync in {gid} stopped: {e}")
+        await report(f"⚠️ Role sync paused at **{checked}** checked (will resume on restart): {e}", force=True)
+    finally:
+        role_sync_jobs.pop(gid, None)
 
 # -------------------- Join / Help / Resync --------------------
 @tree.command(name="immigrate", description=f"Join Wordle World: get the {WORLDLER_ROLE_NAME} role and a welcome bonus.")
@@ -3952,7 +6126,7 @@ async def immigrate(inter: discord.Interaction):
     if not rid:
         return await inter.response.send_message("I need **Manage Roles** to create the role. Ask an admin.", ephemeral=True)
     role = guild.get_role(rid)
-    if role in (guild.get_member(member.id) or await guild.fetch_member(member.id)).roles:
+    if await is_worldler(guild, member):
         bal = await get_balance(guild.id, member.id)
         return await inter.response.send_message(f"You're already a **{WORLDLER_ROLE_NAME}**! Balance: **{bal}**.", ephemeral=True)
 
@@ -3960,6 +6134,7 @@ async def immigrate(inter: discord.Interaction):
         await member.add_roles(role, reason="Wordle World immigration")
     except Exception as e:
         return await inter.response.send_message(f"Couldn't add the role. Do I have **Manage Roles** and is my role above **{WORLDLER_ROLE_NAME}**? ({e})", ephemeral=True)
+    worldler_members.setdefault(guild.id, set()).add(member.id)
 
     await change_balance(guild.id, member.id, START_BONUS, announce_channel_id=inter.channel_id)
     bal = await get_balance(guild.id, member.id)
@@ -3998,9 +6173,16 @@ async def worldle_start(inter: discord.Interaction):
     if not inter.guild or not inter.channel: return
     await inter.response.defer(thinking=False)
     ch = await solo_start(inter.channel, inter.user)
-    if isinstance(ch, discord.TextChannel):
+    if isinstance(ch, GAME_ROOM_TYPES):
         await send_boxed(inter, "Solo Room Opened", f"{inter.user.mention} your room is {ch.mention}.", icon="🧩")
 
+@tree.command(name="worldle_quick", description="Play a solo Wordle right here, visible only to you (counts toward 5/day).")
+async def worldle_quick(inter: discord.Interaction):
+    if not await guard_worldler_inter(inter): return
+    if not await guard_words_inter(inter): return
+    if not inter.guild: return
+    await quick_start(inter)
+
 @tree.command(name="worldle_casino", description="Play a casino Wordle. First game: Word Pot.")
 @app_commands.describe(game="Pick a casino game")
 @app_commands.choices(game=[app_commands.Choice(name="Word Pot", value="word_pot")])
@@ -4012,7 +6194,7 @@ async def worldle_casino(inter: discord.Interaction, game: Optional[app_commands
     if choice != "word_pot":
         return await send_boxed(inter, "Casino", "Only **Word Pot** is available right now.", icon="🎰")
     ch = await casino_start_word_pot(inter.channel, inter.user)
-    if isinstance(ch, discord.TextChannel):
+    if isinstance(ch, GAME_ROOM_TYPES):
         await send_boxed(inter, "Word Pot Room Opened", f"{inter.user.mention} your room is {ch.mention}.", icon="🎰")
 
 
@@ -4081,10 +6263,8 @@ async def worldle_end(inter: discord.Interaction):
         )
         await _announce_result(inter.guild, origin_cid, content="", embed=emb)
 
-        try:
-            await inter.channel.delete(reason="Word Pot ended by user (fail)")
-        except Exception:
-            pass
+        if isinstance(inter.channel, GAME_ROOM_TYPES):
+            await release_room(inter.channel, reason="Word Pot ended by user (fail)")
         return
 
     # --- Solo fallback ---
@@ -4119,10 +6299,8 @@ async def worldle_end(inter: discord.Interaction):
     )
     await _announce_result(inter.guild, origin_cid, content="", embed=emb)
 
-    try:
-        await inter.channel.delete(reason="Wordle World solo ended by user (fail)")
-    except Exception:
-        pass
+    if isinstance(inter.channel, GAME_ROOM_TYPES):
+        await release_room(inter.channel, reason="Wordle World solo ended by user (fail)")
 
 
 
@@ -4146,6 +6324,8 @@ async def ww_emoji_test(inter: discord.Interaction):
 @tree.command(name="ww_refresh_tiles", description="(Admin) Re-scan tile emojis (wl_*) without restarting.")
 @app_commands.default_permissions(administrator=True)
 async def ww_refresh_tiles(inter: discord.Interaction):
+    # Normally kept current by on_guild_emojis_update; this forces a full re-index
+    rebuild_emoji_registry()
     build_emoji_lookup()
     await inter.response.send_message("✅ Tile emoji cache rebuilt.")
 
@@ -4174,9 +6354,16 @@ class ShekelDropView(discord.ui.View):
         if self.claimed:
             return await interaction.response.send_message("Too late — already collected.", ephemeral=True)
 
-        taken = await take_from_pot(self.guild_id, self.amount)
+        self.claimed = True
+        try:
+            async with db_transaction() as db:
+                taken = await tx_take_from_pot(db, self.guild_id, self.amount)
+                if taken > 0:
+                    bal = await tx_credit(db, self.guild_id, interaction.user.id, taken)
+        except Exception:
+            self.claimed = False   # rolled back: the drop is still there for the next click
+            raise
         if taken <= 0:
-            self.claimed = True
             self._btn.disabled = True
             self._btn.style = discord.ButtonStyle.secondary
             self._btn.label = "Already taken"
@@ -4187,8 +6374,7 @@ class ShekelDropView(discord.ui.View):
             return await interaction.followup.send("Someone scooped it, or `/collect` emptied the ground.", ephemeral=True)
 
         # Award and update the button
-        await change_balance(self.guild_id, interaction.user.id, taken, announce_channel_id=self.channel_id)
-        self.claimed = True
+        await _after_balance_change(self.guild_id, interaction.user.id, self.channel_id, bal - taken, bal)
         self._btn.disabled = True
         self._btn.style = discord.ButtonStyle.secondary
         self._btn.label = f"Collected by {interaction.user.display_name}"
@@ -4213,10 +6399,12 @@ class ShekelDropView(discord.ui.View):
 
 
 
+_ambient_last_slot: dict[int, int] = {}   # guild_id -> last slot this process saw claimed
+
 async def maybe_drop_shekel_on_message(msg: discord.Message):
     """
     Ambient drop:
-      • At most one RNG roll per 20-minute slot *per guild* (DB-coordinated).
+      • At most one RNG roll per 20-minute slot *per guild* (DB-coordinated on the slot's first message only).
       • 10% chance to mint a bundle of **1–5** shekels when the slot is claimed.
       • Posts to the configured Drops channel, else the current channel.
     """
@@ -4226,14 +6414,18 @@ async def maybe_drop_shekel_on_message(msg: discord.Message):
     gid = msg.guild.id
     slot = _current_20m_slot()
 
-    # Try to claim (guild, slot). If another process already claimed it, this INSERT
-    # is ignored and rowcount will be 0 — meaning we've already rolled for this slot.
-    cur = await bot.db.execute(
-        "INSERT OR IGNORE INTO ambient_rolls(guild_id, slot) VALUES(?, ?)",
-        (gid, slot),
-    )
-    await bot.db.commit()
-    if getattr(cur, "rowcount", 0) == 0:
+    # Every message after the first in a slot stops here, without touching the DB
+    if _ambient_last_slot.get(gid, -1) >= slot:
+        return
+    _ambient_last_slot[gid] = slot
+
+    # Durable claim: only advances the guild's row if nobody (e.g. another process) got this slot first
+    row = await db_write_fetchone("""
+      INSERT INTO ambient_slot(guild_id, slot) VALUES(?, ?)
+      ON CONFLICT(guild_id) DO UPDATE SET slot=excluded.slot WHERE ambient_slot.slot < excluded.slot
+      RETURNING slot
+    """, (gid, slot))
+    if row is None:
         return  # someone already rolled this 20-minute window
 
     # Only the claimer attempts RNG
@@ -4264,20 +6456,15 @@ async def maybe_drop_shekel_on_message(msg: discord.Message):
         embed=emb,
         view=view,
         allowed_mentions=discord.AllowedMentions(users=True, roles=False, everyone=False),
+        priority=SEND_LOW, wait=False,
     )
 
 
 
 
 async def take_from_pot(gid: int, amount: int) -> int:
-    async with bot.db.execute("SELECT pot FROM ground WHERE guild_id=?", (gid,)) as cur:
-        row = await cur.fetchone()
-    pot = row[0] if row else 0
-    take = min(max(0, int(amount)), pot)
-    if take > 0:
-        await bot.db.execute("UPDATE ground SET pot = pot - ? WHERE guild_id=?", (take, gid))
-        await bot.db.commit()
-    return take
+    async with db_transaction() as db:
+        return await tx_take_from_pot(db, gid, amount)
 
 
 async def _get_drops_channel(guild: discord.Guild) -> Optional[discord.TextChannel]:
@@ -4332,113 +6519,262 @@ async def on_message(msg: discord.Message):
     except Exception as e:
         log.warning(f"shekel drop failed: {e}")
 
+    # Everything else is a text shortcut: one dict hit on the first token rejects plain chatter
     content = msg.content.strip()
-    if not content:
+    head, _, arg = content.partition(" ")
+    route = MESSAGE_ROUTES.get(head.lower())
+    if route is None:
         return
-
-    lower = content.lower()
-
-    # --- SOLO shortcut ---
-    if lower == "w":
-        if not await guard_worldler_msg(msg):
-            await send_boxed(msg.channel, "Access Required", f"{msg.author.mention} you need **{WORLDLER_ROLE_NAME}**. Use `/immigrate` to join.", icon="🔐")
-            return
-        ch = await solo_start(msg.channel, msg.author)
-        if isinstance(ch, discord.TextChannel):
-            await send_boxed(msg.channel, "Solo Room Opened", f"{msg.author.mention} your room is {ch.mention}.", icon="🧩")
+    handler, wants_arg = route
+    arg = arg.strip()
+    if bool(arg) != wants_arg:
         return
-
-    # --- CASINO shortcut (Word Pot) ---
-    if lower == "wc":
-        if not await guard_worldler_msg(msg):
-            await send_boxed(msg.channel, "Access Required", f"{msg.author.mention} you need **{WORLDLER_ROLE_NAME}**. Use `/immigrate`.", icon="🔐")
-            return
-        ch = await casino_start_word_pot(msg.channel, msg.author)
-        if isinstance(ch, discord.TextChannel):
-            await send_boxed(msg.channel, "Word Pot Room Opened", f"{msg.author.mention} your room is {ch.mention}.", icon="🎰")
+    if not await guard_worldler_msg(msg):
+        await send_boxed(msg.channel, "Access Required", f"{msg.author.mention} you need **{WORLDLER_ROLE_NAME}**. Use `/immigrate` to join.", icon="🔐")
         return
-
-    # --- GUESS (smart: duel turn / bounty / casino / dungeon / solo) ---
-    if lower.startswith("g "):
-        if not await guard_worldler_msg(msg):
-            await send_boxed(msg.channel, "Access Required", f"{msg.author.mention} you need **{WORLDLER_ROLE_NAME}**. Use `/immigrate`.", icon="🔐")
-            return
-        word = content.split(None, 1)[1]
-
-        did = _duel_in_channel(msg.channel.id)
-        if did:
-            d = duels.get(did)
-            if d and d["state"] == "active" and msg.author.id == d["turn"]:
-                inter = Shim(msg)
-                await worldle_duel_guess.callback(inter, did, word)
-                return
-
-        game = bounty_games.get(msg.guild.id)
-        if game and game["channel_id"] == msg.channel.id:
-            inter = Shim(msg)
-            await worldle_bounty_guess.callback(inter, word)
+    await handler(msg, arg)
+
+# --- SOLO shortcut: `w` ---
+async def _route_solo_start(msg: discord.Message, _arg: str):
+    ch = await solo_start(msg.channel, msg.author)
+    if isinstance(ch, GAME_ROOM_TYPES):
+        await send_boxed(msg.channel, "Solo Room Opened", f"{msg.author.mention} your room is {ch.mention}.", icon="🧩")
+
+# --- CASINO shortcut (Word Pot): `wc` ---
+async def _route_casino_start(msg: discord.Message, _arg: str):
+    ch = await casino_start_word_pot(msg.channel, msg.author)
+    if isinstance(ch, GAME_ROOM_TYPES):
+        await send_boxed(msg.channel, "Word Pot Room Opened", f"{msg.author.mention} your room is {ch.mention}.", icon="🎰")
+
+# --- GUESS (smart: duel turn / bounty / casino / dungeon / solo): `g WORD` ---
+async def _route_guess(msg: discord.Message, word: str):
+    kinds = channel_interest.get(msg.channel.id)
+    if not kinds:
+        await solo_guess(msg.channel, msg.author, word)   # keeps the "no game here" reply
+        return
+    for did in kinds.get("duel", ()):
+        d = duels.get(did)
+        if d and d["state"] == "active" and msg.author.id == d["turn"]:
+            await worldle_duel_guess.callback(Shim(msg), did, word)
             return
+    if "bounty" in kinds:
+        await worldle_bounty_guess.callback(Shim(msg), word)
+    elif _key(msg.guild.id, msg.channel.id, msg.author.id) in kinds.get("casino", ()):
+        await casino_guess(msg.channel, msg.author, word)
+    elif "dungeon" in kinds:
+        await dungeon_guess(msg.channel, msg.author, word)
+    else:
+        await solo_guess(msg.channel, msg.author, word)
 
-        if _key(msg.guild.id, msg.channel.id, msg.author.id) in casino_games:
-            await casino_guess(msg.channel, msg.author, word)
-            return
+# --- Bounty guess shortcut: `bg WORD` ---
+async def _route_bounty_guess(msg: discord.Message, word: str):
+    await worldle_bounty_guess.callback(Shim(msg), word)
 
-        if msg.channel.id in dungeon_games:
-            await dungeon_guess(msg.channel, msg.author, word)
-            return
+# first token (lowercase) -> (handler(msg, arg), needs an argument)
+MESSAGE_ROUTES = {
+    "w":  (_route_solo_start, False),
+    "wc": (_route_casino_start, False),
+    "g":  (_route_guess, True),
+    "bg": (_route_bounty_guess, True),
+}
 
-        await solo_guess(msg.channel, msg.author, word)
-        return
 
-    # --- Bounty guess shortcut ---
-    if lower.startswith("bg "):
-        if not await guard_worldler_msg(msg):
-            await send_boxed(msg.channel, "Access Required", f"{msg.author.mention} you need **{WORLDLER_ROLE_NAME}**. Use `/immigrate`.", icon="🔐")
-            return
-        word = content.split(None, 1)[1]
-        inter = Shim(msg)
-        await worldle_bounty_guess.callback(inter, word)
-        return
 
+# -------------------- game recovery --------------------
+# Replays game_journal on boot: rebuilds the game maps, re-attaches to rooms that still exist,
+# re-registers reaction handlers and timers, then compacts the journal to one snapshot per game.
+_games_recovered = False
+RESTORED_NOTE = "♻️ Restored after a restart — carry on."
 
+async def _journal_replay() -> dict:
+    live: dict[tuple[str, str], dict] = {}
+    async with bot.db.execute("SELECT kind, key, op, data FROM game_journal ORDER BY seq") as cur:
+        rows = await cur.fetchall()
+    for kind, key, op, data in rows:
+        k = (kind, key)
+        if op == "del":
+            live.pop(k, None)
+        elif op == "put":
+            live[k] = json.loads(data)
+        elif op == "guess" and k in live:
+            g, d = live[k], json.loads(data)
+            if kind == "duel":
+                g["words"].setdefault(str(d["u"]), []).append(d["w"])
+                g["turn"] = g["challenger_id"] if d["u"] == g["target_id"] else g["target_id"]
+            else:
+                g.setdefault("words", []).append(d)
+    return live
+
+def _journal_restore(data: dict) -> dict:
+    game = {k: (set(v) if k in _JOURNAL_SETS else v) for k, v in data.items() if k != "words"}
+    words = data.get("words")
+    if isinstance(words, dict):
+        game["guesses"] = {}
+        for u, ws in words.items():
+            pats = [score_pattern(w, game["answer"]) for w in ws]
+            game["guesses"][int(u)] = [{"word": w, "colors": pattern_colors(p), "pattern": p} for w, p in zip(ws, pats)]
+    elif words is not None:
+        game.update(guesses=[], legend={}, legend_masks=[0, 0, 0])
+        for w in words:
+            apply_guess(game, w, score_pattern(w, game["answer"]))
+    return game
+
+def _adopt_room(ch):
+    # pool rooms in use stay owned by the pool, so the refill doesn't adopt and purge them
+    if ch.name.startswith(ROOM_PREFIX):
+        pooled_rooms.add(ch.id)
+
+async def _restore_one(kind: str, key, data: dict) -> bool:
+    global _next_duel_id
+    gid = data.get("guild_id") or (key[0] if isinstance(key, tuple) else key)
+    guild = bot.get_guild(gid)
+    if not guild:
+        return False
+    game = _journal_restore(data)
+    now = gmt_now_s()
 
+    if kind in ("solo", "casino"):
+        _, cid, uid = key
+        ch = get_room(guild, cid)
+        if not isinstance(ch, GAME_ROOM_TYPES):
+            return False
+        _adopt_room(ch)
+        (solo_games if kind == "solo" else casino_games)[key] = game
+        (solo_channels if kind == "solo" else casino_channels)[(gid, uid)] = cid
+        title = "🎮 Solo Worldle" if kind == "solo" else "🎰 Word Pot"
+        live_board(game, ch).update(board_embed(game, title, status=RESTORED_NOTE))
+    elif kind == "bounty":
+        bounty_games[gid] = game
+        timers.schedule(("bounty_expire", gid), game["expires_at"], _bounty_expired, gid)
+    elif kind == "pending_bounty":
+        pending_bounties[gid] = game
+        register_reaction(game["message_id"], "bounty", gid, ttl_s=max(60, game["expires_at"] - now + 300))
+        timers.schedule(("bounty_prompt", gid), game["expires_at"], _bounty_prompt_expired, gid)
+        if game.get("arming_at"):
+            timers.schedule(("bounty_arm", gid), game["arming_at"], _bounty_arm_due, gid)
+    elif kind == "duel":
+        ch = get_room(guild, game["channel_id"])
+        if not isinstance(ch, GAME_ROOM_TYPES):
+            if game["state"] == "active":   # nowhere to finish it: hand the stakes back with its del
+                users, stake = (game["challenger_id"], game["target_id"]), game["stake"]
+                async def _refund(db):
+                    return [await tx_credit(db, gid, uid, stake) for uid in users]
+                for uid, bal in zip(users, await journal_settle("duel", key, lambda: None, _refund)):
+                    await _after_balance_change(gid, uid, None, bal - stake, bal)
+            return False
+        duels[key] = game
+        _set_duel_state(game, game["state"])
+        _next_duel_id = max(_next_duel_id, key + 1)
+    elif kind == "dungeon":
+        ch = get_room(guild, key)
+        if not isinstance(ch, GAME_ROOM_TYPES):
+            return False
+        _adopt_room(ch)
+        dungeon_games[key] = game
+        if game["state"] == "await_start" and game.get("welcome_msg_id"):
+            register_reaction(game["welcome_msg_id"], "dungeon_lock", key)
+        elif game["state"] == "await_decision" and game.get("decision_msg_id"):
+            register_reaction(game["decision_msg_id"], "dungeon_decision", key)
+        elif game["state"] == "active":
+            title = f"🗝️ Dungeon Round {len(game.get('solved_rounds', [])) + 1} — Tier {game['tier']}"
+            live_board(game, ch).update(board_embed(game, title, status=RESTORED_NOTE))
+    elif kind == "gate":
+        if game["dungeon_channel_id"] not in dungeon_games:
+            return False
+        pending_dungeon_gates_by_msg[key] = game
+        register_reaction(key, "dungeon_gate", game)
+    else:
+        return False
+    return True
 
+async def recover_games():
+    """Rebuild in-flight games from the journal (once per process)."""
+    global _games_recovered, _journal_restoring
+    if _games_recovered:
+        return
+    _games_recovered = True
+    live = await _journal_replay()
+    restored = 0
+    _journal_restoring = True
+    try:
+        for (kind, key), data in live.items():
+            key = json.loads(key)
+            key = tuple(key) if isinstance(key, list) else key
+            try:
+                restored += await _restore_one(kind, key, data)
+            except Exception as e:
+                log.warning(f"[journal] could not restore {kind} {key}: {e}")
+    finally:
+        _journal_restoring = False
+    await journal_compact()
+    if live:
+        log.info(f"[journal] restored {restored}/{len(live)} in-flight games")
 
 # -------------------- lifecycle --------------------
 @bot.event
 async def on_ready():
+    global _boot_reported
+    if not _boot_reported:
+        BOOT_STAGES.append(("login + gateway", time.perf_counter() - _BOOT_IMPORTED))
     log_deps_health()
-    await db_init()
-    for g in bot.guilds:
+    with boot_stage("db_init"):
+        await db_init()
+    start_word_pipeline()   # downloads/rebuilds happen in the background; the definition warm-up needs the db
+    with boot_stage("game recovery"):
         try:
-            await ensure_worldler_role(g)
-            await ensure_bounty_role(g)
-            if DEFAULT_TIERS:
-                await ensure_default_tiers(g)
-            # ensure casino pot row exists
-            await get_casino_pot(g.id)
+            await recover_games()
         except Exception as e:
-            log.warning(f"guild init {g.id} failed: {e}")
+            log.warning(f"[journal] recovery failed: {e}")
+    with boot_stage(f"guild init ({len(bot.guilds)})"):
+        for g in bot.guilds:
+            try:
+                seed_worldler_members(g, await ensure_worldler_role(g))
+                await ensure_bounty_role(g)
+                if DEFAULT_TIERS:
+                    await ensure_default_tiers(g)
+                # ensure casino pot row exists
+                await get_casino_pot(g.id)
+                start_room_refill(g)
+            except Exception as e:
+                log.warning(f"guild init {g.id} failed: {e}")
+    rebuild_emoji_registry()
     build_emoji_lookup()
+    with boot_stage("command sync"):
+        try:
+            await tree.sync()
+            print("Global slash commands synced.")
+        except Exception as e:
+            log.warning(f"global sync failed: {e}")
+    timers.start()
+    for g in bot.guilds:
+        if timers.due_at(("bounty_hour", g.id)) is None:
+            schedule_bounty_hour(g.id)
     try:
-        await tree.sync()
-        print("Global slash commands synced.")
+        await resume_role_sync_jobs()
     except Exception as e:
-        log.warning(f"global sync failed: {e}")
-    if not bounty_loop.is_running():
-        bounty_loop.start()
+        log.warning(f"role sync resume failed: {e}")
     me = bot.user
     print(f"Logged in as {me} ({me.id})")
+    if not _boot_reported:
+        _boot_reported = True
+        log_boot_report()
 
 @bot.event
 async def on_guild_join(guild: discord.Guild):
-    await ensure_worldler_role(guild)
+    if any(n.startswith("wl_") for n in set_guild_emojis(guild.id, guild.emojis)):
+        build_emoji_lookup()
+    seed_worldler_members(guild, await ensure_worldler_role(guild))
     await ensure_bounty_role(guild)
     if DEFAULT_TIERS:
         await ensure_default_tiers(guild)
     await get_casino_pot(guild.id)
+    start_room_refill(guild)
+    schedule_bounty_hour(guild.id)
 
 # -------------------- run --------------------
+_BOOT_IMPORTED = time.perf_counter()
+_boot_reported = False
+
 if __name__ == "__main__":
     if not TOKEN:
         raise SystemExit("Missing DISCORD_TOKEN in environment.")